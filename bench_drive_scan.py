@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Benchmark della scansione di Google Drive
+Confronta la scansione precedente (pagine da 100 file con tutti i campi,
+scaricate in sequenza ed elaborate alla fine) con GoogleDriveClient
+configurato come nell'integrazione, con il delta sync: al primo avvio la
+cartella è scansionata a flusso (pagine da 1000 file con i soli campi usati,
+elaborate mentre arriva la pagina successiva), poi sono lette solo le
+modifiche. Tempo e picco di memoria (tracemalloc) su un servizio Drive finto
+
+Uso:
+    python bench_drive_scan.py                  # 10k file, 50 ms per richiesta
+    python bench_drive_scan.py --files 50000    # Numero di file diverso
+    python bench_drive_scan.py --latency 0      # Latenza di rete simulata (ms)
+    python bench_drive_scan.py --json out.json  # Salva anche i risultati in JSON
+"""
+
+import asyncio
+import gc
+import json
+import re
+import sys
+import time
+import tracemalloc
+
+DEFAULT_FILES = 10_000
+DEFAULT_LATENCY_MS = 50
+ROUNDS = 3
+
+# Pagina e campi usati prima della scansione a flusso
+BASELINE_PAGE_SIZE = 100
+BASELINE_FIELDS = "nextPageToken, files"
+
+BENCH_TRANSPORT = "bench"
+
+
+def fake_drive_files(count):
+    """Risorse file complete, come restituite da Drive senza proiezione dei campi."""
+    files = []
+    for index in range(count):
+        day = f"2026-{index % 12 + 1:02d}-{index % 28 + 1:02d}"
+        files.append({
+            "kind": "drive#file",
+            "id": f"1{index:032x}",
+            "name": f"backup_{day}_{index % 24:02d}-00-00.tar",
+            "mimeType": "application/x-tar",
+            "parents": ["backup-folder"],
+            "size": str(500 * 1024 * 1024 + index),
+            "createdTime": f"{day}T12:00:00.000Z",
+            "modifiedTime": f"{day}T12:00:00.000Z",
+            "md5Checksum": f"{index:032x}",
+            "trashed": False,
+            "starred": False,
+            "webViewLink": f"https://drive.google.com/file/d/1{index:032x}/view",
+            "iconLink": "https://drive-thirdparty.googleusercontent.com/16/type/application/x-tar",
+            "owners": [{
+                "kind": "drive#user",
+                "displayName": "Home Assistant",
+                "emailAddress": "homeassistant@example.com",
+                "me": True,
+            }],
+            "capabilities": {"canDownload": True, "canEdit": True, "canTrash": True},
+        })
+    return files
+
+
+class MemoryStore:
+    """Storage in memoria al posto di quello di Home Assistant."""
+
+    def __init__(self, hass, version, key):
+        self.data = None
+
+    async def async_load(self):
+        return self.data
+
+    def async_delay_save(self, data_func, delay=0):
+        self.data = data_func()
+
+
+def make_transport(files, latency):
+    """Crea la classe di un trasporto Drive che risponde da una lista in memoria."""
+    from custom_components.backup_guardian.drive_api import DriveTransport
+
+    class FakeDriveTransport(DriveTransport):
+        """Drive finto: latenza fissa, risposte decodificate a ogni richiesta."""
+
+        async def async_get_start_page_token(self):
+            await asyncio.sleep(latency)
+            return "1"
+
+        async def async_get_file(self, file_id, fields):
+            await asyncio.sleep(latency)
+            return {"id": file_id}
+
+        async def async_list_changes(self, page_token, fields, page_size):
+            await asyncio.sleep(latency)
+            return {"newStartPageToken": page_token, "changes": []}
+
+        async def async_list_files(self, query, fields, page_size, page_token=None):
+            await asyncio.sleep(latency)
+            start = int(page_token or 0)
+            match = re.search(r"files\(([^)]*)\)", fields)
+            keys = [key.strip() for key in match.group(1).split(",")] if match else None
+            # Copie nuove come dopo la decodifica del JSON
+            page = [
+                {key: item[key] for key in keys} if keys else dict(item)
+                for item in files[start:start + page_size]
+            ]
+            response = {"files": page}
+            if start + page_size < len(files):
+                response["nextPageToken"] = str(start + page_size)
+            return response
+
+    return FakeDriveTransport
+
+
+def new_client():
+    """Client Drive sul trasporto finto, con il delta sync come in from_config."""
+    from custom_components.backup_guardian.google_drive import GoogleDriveClient
+
+    credentials = {
+        "client_id": "bench",
+        "client_secret": "bench",
+        "token": "bench",
+        "folder_id": "backup-folder",
+    }
+    return GoogleDriveClient(None, credentials, transport=BENCH_TRANSPORT)
+
+
+async def scan_before(client):
+    """Scansione precedente: tutte le pagine in sequenza, poi l'elaborazione."""
+    transport = client._transport
+    query = client._build_query()
+    files = []
+    page_token = None
+    while True:
+        response = await transport.async_list_files(
+            query, BASELINE_FIELDS, BASELINE_PAGE_SIZE, page_token
+        )
+        files.extend(response.get("files", []))
+        page_token = response.get("nextPageToken")
+        if not page_token:
+            break
+    return [record for record in map(client.process, files) if record is not None]
+
+
+async def scan_after(client):
+    """Aggiornamento di GoogleDriveClient usato dal coordinator."""
+    return await client.async_get_backups()
+
+
+# Scenari: (scansione, client già sincronizzato)
+SCENARIOS = {
+    "prima": (scan_before, False),
+    "primo avvio": (scan_after, False),
+    "delta": (scan_after, True),
+}
+
+
+async def run_scan(scan, warm, trace):
+    """Esegue una scansione con un client nuovo, misurando solo la scansione.
+
+    Returns:
+        Tuple di (backup trovati, secondi, picco di memoria o None)
+    """
+    client = new_client()
+    if not await client.async_setup():
+        raise RuntimeError("Trasporto finto non inizializzato")
+    if warm:
+        await client.async_get_backups()
+
+    gc.collect()
+    if trace:
+        tracemalloc.start()
+    started = time.perf_counter()
+    count = len(await scan(client))
+    elapsed = time.perf_counter() - started
+    peak = None
+    if trace:
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return count, elapsed, peak
+
+
+def measure(scan, warm):
+    """Miglior tempo su ROUNDS giri e picco di memoria di una scansione."""
+    best = None
+    for _ in range(ROUNDS):
+        count, elapsed, _ = asyncio.run(run_scan(scan, warm, False))
+        best = elapsed if best is None else min(best, elapsed)
+
+    # Memoria misurata a parte: tracemalloc rallenta l'esecuzione
+    _, _, peak = asyncio.run(run_scan(scan, warm, True))
+    return count, best, peak
+
+
+def main():
+    """Esegue il benchmark e stampa il report."""
+    print("⏱️  Benchmark scansione di Google Drive\n")
+
+    try:
+        from custom_components.backup_guardian import google_drive
+        from custom_components.backup_guardian.drive_api import DRIVE_TRANSPORT_CLASSES
+    except ImportError as e:
+        print(f"❌ Import fallito (Home Assistant è installato?):\n{e}")
+        return 1
+
+    file_count = DEFAULT_FILES
+    if "--files" in sys.argv:
+        file_count = int(sys.argv[sys.argv.index("--files") + 1])
+    latency_ms = DEFAULT_LATENCY_MS
+    if "--latency" in sys.argv:
+        latency_ms = float(sys.argv[sys.argv.index("--latency") + 1])
+
+    files = fake_drive_files(file_count)
+    DRIVE_TRANSPORT_CLASSES[BENCH_TRANSPORT] = make_transport(files, latency_ms / 1000)
+    # Indice del delta sync in memoria, senza un'istanza di Home Assistant
+    google_drive.Store = MemoryStore
+
+    results = {kind: measure(scan, warm) for kind, (scan, warm) in SCENARIOS.items()}
+    counts = {kind: result[0] for kind, result in results.items()}
+    if len(set(counts.values())) != 1:
+        print(f"❌ Backup trovati diversi: {counts}")
+        return 1
+
+    print(
+        f"📦 {file_count} file, {latency_ms:g} ms per richiesta,"
+        f" miglior tempo su {ROUNDS} giri:"
+    )
+    for kind, (count, seconds, peak) in results.items():
+        print(
+            f"   {kind:11s} {seconds * 1000:8.1f} ms"
+            f"  picco {peak / 1024 / 1024:7.2f} MB  ({count} backup)"
+        )
+    before, after = results["prima"], results["primo avvio"]
+    print(
+        f"\n✅ Primo avvio {before[1] / after[1]:.1f}x più veloce,"
+        f" picco di memoria ridotto del {(1 - after[2] / before[2]) * 100:.0f}%"
+    )
+
+    if "--json" in sys.argv:
+        path = sys.argv[sys.argv.index("--json") + 1]
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "files": file_count,
+                    "latency_ms": latency_ms,
+                    "results": {
+                        kind: {"backups": count, "seconds": seconds, "peak_bytes": peak}
+                        for kind, (count, seconds, peak) in results.items()
+                    },
+                },
+                f,
+                indent=2,
+            )
+        print(f"\n💾 Risultati salvati in {path}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
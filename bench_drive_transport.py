@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+Benchmark dei trasporti Google Drive di Backup Guardian
+Confronta il client REST nativo (aiohttp) con il client discovery
+(google-api-python-client) misurando tempo di import, tempo di setup e
+latenza di una scansione completa della cartella e di un aggiornamento
+delta contro un server HTTP finto in locale, senza accesso a Google
+
+Uso:
+    python bench_drive_transport.py                  # 10k file, report a schermo
+    python bench_drive_transport.py --files 2000     # Numero di file diverso
+    python bench_drive_transport.py --json out.json  # Salva anche i risultati in JSON
+"""
+
+import asyncio
+import json
+import statistics
+import subprocess
+import sys
+import time
+
+DEFAULT_FILES = 10_000
+SETUP_ROUNDS = 5
+SCAN_ROUNDS = 10
+
+INTEGRATION = "custom_components.backup_guardian"
+# Home Assistant e aiohttp sono già caricati quando l'integrazione si avvia
+PRELOADED = "import homeassistant.core, homeassistant.helpers.aiohttp_client"
+IMPORTS = {
+    "rest": f"import {INTEGRATION}.drive_api",
+    "discovery": "import googleapiclient.discovery, google.oauth2.credentials",
+}
+
+
+def measure_import(code):
+    """Tempo di import a freddo in un nuovo interprete (secondi)."""
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"{PRELOADED}; import time; t = time.perf_counter(); {code};"
+            " print(time.perf_counter() - t)",
+        ],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        return None
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+class BenchHass:
+    """Quanto serve ai trasporti di Home Assistant: l'executor."""
+
+    async def async_add_executor_job(self, target, *args):
+        return await asyncio.get_running_loop().run_in_executor(None, target, *args)
+
+
+class BenchTokenManager:
+    """Token sempre valido, nessun refresh durante il benchmark."""
+
+    def __init__(self):
+        self.expires_at = time.time() + 3600
+        self.token = {"access_token": "bench-token", "expires_at": self.expires_at}
+
+    async def async_get_access_token(self):
+        return "bench-token"
+
+
+def fake_files(count):
+    """File di backup della cartella finta."""
+    return [
+        {
+            "id": f"file{index:06d}",
+            "name": f"backup_2026-01-{index % 28 + 1:02d}_12-00-00.tar",
+            "size": str(500 * 1024 * 1024 + index),
+            "modifiedTime": "2026-01-01T12:00:00.000Z",
+            "md5Checksum": f"{index:032x}",
+        }
+        for index in range(count)
+    ]
+
+
+async def start_mock_server(files):
+    """Avvia un server Drive v3 finto con paginazione e gzip."""
+    from aiohttp import web
+
+    async def list_files(request):
+        page_size = int(request.query.get("pageSize", 100))
+        start = int(request.query.get("pageToken") or 0)
+        body = {"files": files[start:start + page_size]}
+        if start + page_size < len(files):
+            body["nextPageToken"] = str(start + page_size)
+        response = web.json_response(body)
+        if "gzip" in request.headers.get("Accept-Encoding", ""):
+            response.enable_compression()
+        return response
+
+    async def get_file(request):
+        return web.json_response({"id": request.match_info["file_id"], "name": "Backups"})
+
+    async def start_page_token(request):
+        return web.json_response({"startPageToken": "1"})
+
+    async def list_changes(request):
+        return web.json_response({"newStartPageToken": "1", "changes": []})
+
+    app = web.Application()
+    app.router.add_get("/drive/v3/files", list_files)
+    app.router.add_get("/drive/v3/changes/startPageToken", start_page_token)
+    app.router.add_get("/drive/v3/changes", list_changes)
+    app.router.add_get("/drive/v3/files/{file_id}", get_file)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}"
+
+
+async def scan(transport, fields, page_size):
+    """Scansione completa della cartella seguendo nextPageToken."""
+    count = 0
+    page_token = None
+    while True:
+        response = await transport.async_list_files(
+            "'root' in parents", fields, page_size, page_token
+        )
+        count += len(response.get("files", []))
+        page_token = response.get("nextPageToken")
+        if not page_token:
+            return count
+
+
+async def delta_refresh(transport, page_size):
+    """Aggiornamento senza modifiche: cartella, token e una pagina di changes."""
+    await transport.async_get_file("root", "id,name")
+    page_token = await transport.async_get_start_page_token()
+    await transport.async_list_changes(page_token, "newStartPageToken,changes", page_size)
+
+
+def median_p95(samples):
+    """Mediana e 95° percentile (nearest rank) dei tempi."""
+    samples = sorted(samples)
+    return statistics.median(samples), samples[max(int(len(samples) * 0.95) - 1, 0)]
+
+
+async def bench_transports(file_count):
+    """Misura setup e scansione di ogni trasporto contro il server finto."""
+    import aiohttp
+
+    from custom_components.backup_guardian import drive_api
+    from custom_components.backup_guardian.google_drive import (
+        DRIVE_LIST_FIELDS,
+        DRIVE_PAGE_SIZE,
+    )
+    from custom_components.backup_guardian.metrics import COUNTER_BYTES, RefreshMetrics
+
+    runner, base_url = await start_mock_server(fake_files(file_count))
+    session = aiohttp.ClientSession()
+    # Il trasporto REST usa la sessione condivisa di Home Assistant e l'URL di Google
+    drive_api.async_get_clientsession = lambda hass: session
+    drive_api.GOOGLE_DRIVE_API_URL = f"{base_url}/drive/v3"
+
+    hass = BenchHass()
+    credentials = {"client_id": "bench", "client_secret": "bench", "folder_id": "root"}
+    results = {}
+    try:
+        for name, transport_cls in drive_api.DRIVE_TRANSPORT_CLASSES.items():
+            setups = []
+            transport = None
+            for _ in range(SETUP_ROUNDS):
+                transport = transport_cls(
+                    hass, credentials, BenchTokenManager(), RefreshMetrics()
+                )
+                started = time.perf_counter()
+                ready = await transport.async_setup()
+                setups.append(time.perf_counter() - started)
+                if not ready:
+                    break
+            if not ready:
+                print(f"⚠️  Trasporto {name} non disponibile, saltato")
+                continue
+
+            service = getattr(transport, "_service", None)
+            if service is not None:
+                # Il client discovery punta a Google: reindirizzato al server finto
+                service._baseUrl = f"{base_url}/drive/v3/"
+
+            scans = []
+            for _ in range(SCAN_ROUNDS):
+                started = time.perf_counter()
+                found = await scan(transport, DRIVE_LIST_FIELDS, DRIVE_PAGE_SIZE)
+                scans.append(time.perf_counter() - started)
+            if found != file_count:
+                print(f"❌ Trasporto {name}: {found} file invece di {file_count}")
+            scan_bytes = transport._metrics.counters.get(COUNTER_BYTES, 0) // SCAN_ROUNDS
+
+            deltas = []
+            for _ in range(SCAN_ROUNDS):
+                started = time.perf_counter()
+                await delta_refresh(transport, DRIVE_PAGE_SIZE)
+                deltas.append(time.perf_counter() - started)
+
+            scan_median, scan_p95 = median_p95(scans)
+            delta_median, delta_p95 = median_p95(deltas)
+            results[name] = {
+                "setup_first_s": setups[0],
+                "setup_median_s": statistics.median(setups),
+                "scan_median_s": scan_median,
+                "scan_p95_s": scan_p95,
+                "delta_median_s": delta_median,
+                "delta_p95_s": delta_p95,
+                "scan_bytes": scan_bytes,
+            }
+    finally:
+        await session.close()
+        await runner.cleanup()
+    return results
+
+
+def main():
+    """Esegue il benchmark e stampa il report."""
+    print("⏱️  Benchmark trasporti Google Drive\n")
+
+    try:
+        import custom_components.backup_guardian.drive_api  # noqa: F401
+    except ImportError as e:
+        print(f"❌ Import fallito (Home Assistant è installato?):\n{e}")
+        return 1
+
+    file_count = DEFAULT_FILES
+    if "--files" in sys.argv:
+        file_count = int(sys.argv[sys.argv.index("--files") + 1])
+
+    print("📦 Import a freddo (Home Assistant già caricato):")
+    imports = {}
+    for name, code in IMPORTS.items():
+        imports[name] = measure_import(code)
+        if imports[name] is None:
+            print(f"   {name:10s} non installato")
+        else:
+            print(f"   {name:10s} {imports[name] * 1000:8.1f} ms")
+
+    results = asyncio.run(bench_transports(file_count))
+
+    print(f"\n🌐 Setup e scansione di {file_count} file (server finto in locale):")
+    for name, result in results.items():
+        print(
+            f"   {name:10s} setup {result['setup_first_s'] * 1000:7.1f} ms"
+            f" (poi {result['setup_median_s'] * 1000:.1f} ms)"
+            f"  scansione mediana {result['scan_median_s'] * 1000:7.1f} ms"
+            f"  p95 {result['scan_p95_s'] * 1000:7.1f} ms"
+        )
+        print(
+            f"   {'':10s} aggiornamento delta mediano {result['delta_median_s'] * 1000:.1f} ms"
+            f"  p95 {result['delta_p95_s'] * 1000:.1f} ms"
+        )
+        if result["scan_bytes"]:
+            print(f"   {'':10s} {result['scan_bytes'] / 1024:.0f} KB ricevuti per scansione")
+
+    if "--json" in sys.argv:
+        path = sys.argv[sys.argv.index("--json") + 1]
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(
+                {"files": file_count, "import_s": imports, "transports": results},
+                f,
+                indent=2,
+            )
+        print(f"\n💾 Risultati salvati in {path}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark della classificazione dei nomi dei file di backup
+Confronta l'implementazione precedente (re.match per pattern, due re.search
+e strptime) con il modulo filename.py su nomi di file sintetici
+
+Uso:
+    python bench_filename.py                  # 100k nomi, report a schermo
+    python bench_filename.py --count 20000    # Numero di nomi diverso
+    python bench_filename.py --json out.json  # Salva anche i risultati in JSON
+"""
+
+import json
+import random
+import re
+import sys
+import time
+from datetime import datetime
+
+DEFAULT_COUNT = 100_000
+ROUNDS = 5
+
+# Pattern usati prima di filename.py
+BACKUP_FILE_PATTERNS = [
+    r".*\.tar$",
+    r".*\.tar\.gz$",
+    r".*\.tgz$",
+]
+
+
+def baseline_is_backup_file(filename):
+    """Classificazione precedente: un re.match per pattern."""
+    for pattern in BACKUP_FILE_PATTERNS:
+        if re.match(pattern, filename):
+            return True
+    return False
+
+
+def baseline_extract_date(filename, dt_util):
+    """Estrazione precedente: due re.search e strptime."""
+    try:
+        pattern = r"(\d{4}-\d{2}-\d{2})[_ ](\d{2})[:-](\d{2})[:-](\d{2})"
+        match = re.search(pattern, filename)
+        if match:
+            date_str = f"{match.group(1)} {match.group(2)}:{match.group(3)}:{match.group(4)}"
+            date_obj = datetime.strptime(date_str, "%Y-%m-%d %H:%M:%S")
+            date_obj = date_obj.replace(tzinfo=dt_util.UTC)
+            return dt_util.as_local(date_obj)
+
+        pattern = r"(\d{4}-\d{2}-\d{2})"
+        match = re.search(pattern, filename)
+        if match:
+            date_obj = datetime.strptime(match.group(1), "%Y-%m-%d")
+            date_obj = date_obj.replace(tzinfo=dt_util.UTC)
+            return dt_util.as_local(date_obj)
+    except Exception:
+        pass
+    return None
+
+
+def synthetic_filenames(count):
+    """Genera nomi di file simili a quelli reali, non tutti backup."""
+    rng = random.Random(42)
+    names = []
+    for _ in range(count):
+        date = f"2026-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+        clock = f"{rng.randint(0, 23):02d}-{rng.randint(0, 59):02d}-{rng.randint(0, 59):02d}"
+        kind = rng.random()
+        if kind < 0.4:
+            names.append(f"backup_{date}_{clock}.tar")
+        elif kind < 0.7:
+            names.append(f"Full backup {date} {clock.replace('-', ':')}.tar.gz")
+        elif kind < 0.85:
+            names.append(f"homeassistant_{date}.tgz")
+        else:
+            names.append(f"notes_{rng.randint(0, 9999)}.txt")
+    return names
+
+
+def run(function, names):
+    """Applica la funzione a tutti i nomi, miglior tempo su ROUNDS giri."""
+    best = None
+    for _ in range(ROUNDS):
+        started = time.perf_counter()
+        for name in names:
+            function(name)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    """Esegue il benchmark e stampa il report."""
+    print("⏱️  Benchmark classificazione nomi dei file di backup\n")
+
+    try:
+        from homeassistant.util import dt as dt_util
+
+        from custom_components.backup_guardian.filename import (
+            extract_date_from_filename,
+            is_backup_file,
+        )
+    except ImportError as e:
+        print(f"❌ Import fallito (Home Assistant è installato?):\n{e}")
+        return 1
+
+    count = DEFAULT_COUNT
+    if "--count" in sys.argv:
+        count = int(sys.argv[sys.argv.index("--count") + 1])
+    names = synthetic_filenames(count)
+
+    # Le due implementazioni devono dare gli stessi risultati
+    for name in names[:1000]:
+        if baseline_is_backup_file(name) != is_backup_file(name):
+            print(f"❌ Classificazione diversa per {name}")
+            return 1
+        if baseline_extract_date(name, dt_util) != extract_date_from_filename(name):
+            print(f"❌ Data diversa per {name}")
+            return 1
+
+    results = {
+        "is_backup_file": (
+            run(baseline_is_backup_file, names),
+            run(is_backup_file, names),
+        ),
+        "extract_date_from_filename": (
+            run(lambda name: baseline_extract_date(name, dt_util), names),
+            run(extract_date_from_filename, names),
+        ),
+    }
+
+    print(f"📦 {count} nomi di file, miglior tempo su {ROUNDS} giri:")
+    for function, (before, after) in results.items():
+        print(
+            f"   {function:28s} prima {before * 1e9 / count:7.0f} ns/file"
+            f"  dopo {after * 1e9 / count:7.0f} ns/file  ({before / after:.1f}x)"
+        )
+
+    if "--json" in sys.argv:
+        path = sys.argv[sys.argv.index("--json") + 1]
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "count": count,
+                    "results": {
+                        function: {"before_s": before, "after_s": after}
+                        for function, (before, after) in results.items()
+                    },
+                },
+                f,
+                indent=2,
+            )
+        print(f"\n💾 Risultati salvati in {path}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Benchmark dell'elaborazione dei backup del Supervisor
+Misura il costo per record dell'elaborazione precedente (fromisoformat o
+strptime, ZoneInfo per chiamata, parsing della dimensione carattere per
+carattere e log f-string) e di SupervisorBackupSource.process, con il
+debug disattivato come in produzione
+
+Uso:
+    python bench_process_backup.py                  # 20k record, report a schermo
+    python bench_process_backup.py --count 5000     # Numero di record diverso
+    python bench_process_backup.py --profile        # Mostra anche il profilo cProfile
+    python bench_process_backup.py --json out.json  # Salva anche i risultati in JSON
+"""
+
+import cProfile
+import hashlib
+import json
+import logging
+import pstats
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+DEFAULT_COUNT = 20_000
+ROUNDS = 5
+
+_LOGGER = logging.getLogger("bench_process_backup")
+
+
+def baseline_process(backup_data, dt_util, normalize_backup, destination):
+    """Elaborazione di un backup del Supervisor prima del fast path."""
+    date_str = backup_data.get("date", "")
+    try:
+        if "T" in date_str:
+            date_obj_utc = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+        elif " " in date_str:
+            date_obj_utc = datetime.strptime(date_str, "%Y-%m-%d %H:%M:%S")
+            date_obj_utc = date_obj_utc.replace(tzinfo=ZoneInfo("UTC"))
+        else:
+            date_obj_utc = datetime.strptime(date_str, "%Y-%m-%d")
+            date_obj_utc = date_obj_utc.replace(tzinfo=ZoneInfo("UTC"))
+        date_obj_local = dt_util.as_local(date_obj_utc)
+        _LOGGER.debug(f"Backup date conversion: UTC={date_obj_utc.isoformat()} -> Local={date_obj_local.isoformat()}")
+    except Exception as date_err:
+        _LOGGER.debug(f"Could not parse date {date_str}: {date_err}")
+        date_obj_local = dt_util.now()
+
+    size_bytes = backup_data.get("size", 0)
+    _LOGGER.debug(f"Backup size raw value: {size_bytes}, type: {type(size_bytes)}")
+    if isinstance(size_bytes, str):
+        size_bytes = float(''.join(c for c in size_bytes if c.isdigit() or c == '.'))
+    else:
+        size_bytes = float(size_bytes)
+    if size_bytes < 1024:
+        size_mb = round(size_bytes, 2)
+        size_bytes = int(size_bytes * 1024 * 1024)
+    else:
+        size_mb = round(size_bytes / (1024 * 1024), 2)
+        size_bytes = int(size_bytes)
+
+    name = backup_data.get("name", backup_data.get("slug", "Unknown"))
+    result = normalize_backup(
+        name=name,
+        slug=backup_data.get("slug", ""),
+        size_bytes=size_bytes,
+        date_obj=date_obj_local,
+        backup_hash=hashlib.sha256(backup_data.get("slug", "").encode()).hexdigest(),
+        destination=destination,
+        backup_type=backup_data.get("type", "full"),
+        protected=backup_data.get("protected", False),
+    )
+    _LOGGER.debug(f"Processed backup: {name}, size: {size_mb} MB, time: {date_obj_local.strftime('%H:%M:%S')}, destination: {result.destination_name}")
+    return result
+
+
+def synthetic_backups(count):
+    """Genera risposte del Supervisor senza 'size_bytes', come le versioni meno recenti."""
+    rng = random.Random(42)
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    backups = []
+    for index in range(count):
+        moment = start + timedelta(minutes=rng.randint(0, 1_000_000))
+        size = round(rng.uniform(50, 900), 2)
+        backups.append({
+            "slug": f"{index:08x}",
+            "name": f"Full Backup {moment:%Y-%m-%d %H:%M:%S}",
+            "date": moment.isoformat(timespec="microseconds"),
+            "type": rng.choice(["full", "partial"]),
+            "protected": rng.random() < 0.2,
+            # Dimensione in MB, a volte come stringa
+            "size": size if rng.random() < 0.8 else f"{size} MB",
+        })
+    return backups
+
+
+def run(function, backups):
+    """Applica la funzione a tutti i record, miglior tempo su ROUNDS giri."""
+    best = None
+    for _ in range(ROUNDS):
+        started = time.perf_counter()
+        for backup in backups:
+            function(backup)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    """Esegue il benchmark e stampa il report."""
+    print("⏱️  Benchmark elaborazione backup del Supervisor\n")
+
+    try:
+        from homeassistant.util import dt as dt_util
+
+        from custom_components.backup_guardian.source import normalize_backup
+        from custom_components.backup_guardian.supervisor import SupervisorBackupSource
+    except ImportError as e:
+        print(f"❌ Import fallito (Home Assistant è installato?):\n{e}")
+        return 1
+
+    # Debug disattivato come in produzione
+    logging.basicConfig(level=logging.INFO)
+    logging.getLogger("custom_components.backup_guardian").setLevel(logging.INFO)
+
+    count = DEFAULT_COUNT
+    if "--count" in sys.argv:
+        count = int(sys.argv[sys.argv.index("--count") + 1])
+    backups = synthetic_backups(count)
+
+    source = SupervisorBackupSource(None)
+
+    def before(backup):
+        return baseline_process(backup, dt_util, normalize_backup, source.destination)
+
+    # Le due elaborazioni devono produrre gli stessi record
+    for backup in backups[:1000]:
+        if before(backup) != source.process(backup):
+            print(f"❌ Record diverso per {backup['slug']}")
+            return 1
+
+    before_s = run(before, backups)
+    after_s = run(source.process, backups)
+
+    print(f"📦 {count} backup, miglior tempo su {ROUNDS} giri:")
+    print(f"   prima {before_s * 1e6 / count:7.2f} µs/record")
+    print(f"   dopo  {after_s * 1e6 / count:7.2f} µs/record  ({before_s / after_s:.1f}x)")
+
+    if "--profile" in sys.argv:
+        print("\n🔬 Profilo dell'elaborazione attuale:")
+        profiler = cProfile.Profile()
+        profiler.enable()
+        for backup in backups:
+            source.process(backup)
+        profiler.disable()
+        pstats.Stats(profiler).sort_stats("tottime").print_stats(10)
+
+    if "--json" in sys.argv:
+        path = sys.argv[sys.argv.index("--json") + 1]
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "count": count,
+                    "before_us_per_record": before_s * 1e6 / count,
+                    "after_us_per_record": after_s * 1e6 / count,
+                },
+                f,
+                indent=2,
+            )
+        print(f"\n💾 Risultati salvati in {path}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Benchmark della memoria dei record di backup
+Confronta i dizionari usati prima di BackupRecord (13 chiavi, con i campi
+derivati size_mb, date, time e destination_name) con i BackupRecord, misurando
+con tracemalloc la memoria allocata per N record e il tempo di una raccolta
+completa del garbage collector
+
+Uso:
+    python bench_record_memory.py                  # 10k record, report a schermo
+    python bench_record_memory.py --count 50000    # Numero di record diverso
+    python bench_record_memory.py --json out.json  # Salva anche i risultati in JSON
+"""
+
+import gc
+import json
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+
+DEFAULT_COUNT = 10_000
+DESTINATIONS = ("local", "google_drive", "nas")
+
+
+def backup_dict(name, slug, size_bytes, date_obj, backup_hash, destination, destination_names):
+    """Dizionario di un backup come prodotto prima di BackupRecord."""
+    return {
+        "name": name,
+        "slug": slug,
+        "size": size_bytes,
+        "size_mb": round(size_bytes / (1024 * 1024), 2),
+        "date": date_obj.strftime("%Y-%m-%d"),
+        "time": date_obj.strftime("%H:%M:%S"),
+        "datetime": date_obj,
+        "hash": backup_hash,
+        "type": "full",
+        "protected": False,
+        "compressed": True,
+        "destination": destination,
+        "destination_name": destination_names.get(destination, destination.title()),
+    }
+
+
+def synthetic_inputs(count):
+    """Genera i campi canonici, condivisi dalle due rappresentazioni."""
+    rng = random.Random(42)
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    inputs = []
+    for index in range(count):
+        moment = start + timedelta(minutes=rng.randint(0, 1_000_000))
+        inputs.append((
+            f"Full Backup {moment:%Y-%m-%d %H:%M:%S}",
+            f"{index:08x}",
+            rng.randint(50, 900) * 1024 * 1024,
+            moment,
+            f"{rng.getrandbits(128):032x}",
+            rng.choice(DESTINATIONS),
+        ))
+    return inputs
+
+
+def measure(build, inputs):
+    """Costruisce i record e misura memoria allocata, picco e tempo del GC."""
+    gc.collect()
+    tracemalloc.start()
+    records = [build(*fields) for fields in inputs]
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    started = time.perf_counter()
+    gc.collect()
+    gc_seconds = time.perf_counter() - started
+
+    del records
+    return current, peak, gc_seconds
+
+
+def main():
+    """Esegue il benchmark e stampa il report."""
+    print("🧮 Benchmark memoria dei record di backup\n")
+
+    try:
+        from custom_components.backup_guardian.const import DESTINATION_NAMES
+        from custom_components.backup_guardian.record import BackupRecord
+    except ImportError as e:
+        print(f"❌ Import fallito (Home Assistant è installato?):\n{e}")
+        return 1
+
+    count = DEFAULT_COUNT
+    if "--count" in sys.argv:
+        count = int(sys.argv[sys.argv.index("--count") + 1])
+    inputs = synthetic_inputs(count)
+
+    def build_dict(name, slug, size_bytes, date_obj, backup_hash, destination):
+        return backup_dict(
+            name, slug, size_bytes, date_obj, backup_hash, destination, DESTINATION_NAMES
+        )
+
+    def build_record(name, slug, size_bytes, date_obj, backup_hash, destination):
+        return BackupRecord(
+            name=name,
+            slug=slug,
+            size=size_bytes,
+            datetime=date_obj,
+            hash=backup_hash,
+            destination=destination,
+        )
+
+    results = {
+        "dict": measure(build_dict, inputs),
+        "BackupRecord": measure(build_record, inputs),
+    }
+
+    print(f"📦 {count} record (campi canonici esclusi, sono condivisi):")
+    for kind, (current, peak, gc_seconds) in results.items():
+        print(
+            f"   {kind:13s} {current / 1024 / 1024:7.2f} MB"
+            f"  ({current / count:6.0f} B/record, picco {peak / 1024 / 1024:.2f} MB)"
+            f"  gc.collect {gc_seconds * 1000:6.1f} ms"
+        )
+    before, after = results["dict"][0], results["BackupRecord"][0]
+    print(f"\n✅ Memoria ridotta del {(1 - after / before) * 100:.0f}%")
+
+    if "--json" in sys.argv:
+        path = sys.argv[sys.argv.index("--json") + 1]
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "count": count,
+                    "results": {
+                        kind: {"bytes": current, "peak_bytes": peak, "gc_seconds": gc_seconds}
+                        for kind, (current, peak, gc_seconds) in results.items()
+                    },
+                },
+                f,
+                indent=2,
+            )
+        print(f"\n💾 Risultati salvati in {path}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+Verifica del delta sync di Google Drive di Backup Guardian
+Esegue GoogleDriveClient su un Drive finto in memoria che registra ogni
+modifica come la Changes API (aggiunte, cestino, rinomine, spostamenti fuori
+dalla cartella, eliminazioni definitive) e controlla che l'elenco dei backup
+coincida sempre con il contenuto della cartella, anche quando il token delle
+modifiche non è più valido e serve una nuova scansione completa
+
+Uso:
+    python check_delta_sync.py
+"""
+
+import asyncio
+import hashlib
+import sys
+
+CHECK_TRANSPORT = "check"
+FOLDER_ID = "folder-backup"
+OTHER_FOLDER_ID = "folder-altro"
+# Pagine piccole per attraversare anche la paginazione
+MAX_PAGE_SIZE = 2
+
+BACKUP_SUFFIXES = (".tar", ".tar.gz", ".tgz")
+
+
+class MemoryStore:
+    """Storage in memoria al posto di quello di Home Assistant."""
+
+    def __init__(self, hass, version, key):
+        self.data = None
+
+    async def async_load(self):
+        return self.data
+
+    def async_delay_save(self, data_func, delay=0):
+        self.data = data_func()
+
+
+class FakeDrive:
+    """Cartelle e file di Drive con il registro delle modifiche."""
+
+    def __init__(self):
+        self.files = {}
+        self.changes = []
+        self.calls = {"list_files": 0, "list_changes": 0}
+        # Errore restituito alla prossima chiamata di changes.list
+        self.changes_error = None
+
+    def put(self, file_id, name, parents=(FOLDER_ID,), trashed=False, size=1024):
+        """Crea o modifica un file e registra la modifica."""
+        self.files[file_id] = {
+            "id": file_id,
+            "name": name,
+            "size": str(size),
+            "modifiedTime": "2026-02-15T16:40:12.000Z",
+            "md5Checksum": hashlib.md5(file_id.encode()).hexdigest(),
+            "parents": list(parents),
+            "trashed": trashed,
+        }
+        self.changes.append({"fileId": file_id, "removed": False, "file": dict(self.files[file_id])})
+
+    def delete(self, file_id):
+        """Elimina definitivamente un file."""
+        del self.files[file_id]
+        self.changes.append({"fileId": file_id, "removed": True})
+
+    def folder_backups(self):
+        """Nomi dei backup attualmente nella cartella."""
+        return {
+            item["name"]
+            for item in self.files.values()
+            if FOLDER_ID in item["parents"]
+            and not item["trashed"]
+            and item["name"].endswith(BACKUP_SUFFIXES)
+        }
+
+
+def make_transport(drive):
+    """Crea la classe di un trasporto Drive che risponde dal Drive finto."""
+    from custom_components.backup_guardian.drive_api import DriveApiError, DriveTransport
+    from custom_components.backup_guardian.google_drive import DRIVE_FILE_KEYS
+
+    class FakeDriveTransport(DriveTransport):
+        """Changes API e files.list finti, paginati."""
+
+        async def async_get_start_page_token(self):
+            return str(len(drive.changes))
+
+        async def async_get_file(self, file_id, fields):
+            # 'root' e gli alias sono risolti nell'ID reale della cartella
+            return {"id": FOLDER_ID}
+
+        async def async_list_files(self, query, fields, page_size, page_token=None):
+            drive.calls["list_files"] += 1
+            matching = sorted(
+                (
+                    item
+                    for item in drive.files.values()
+                    if FOLDER_ID in item["parents"]
+                    and not item["trashed"]
+                    and any(suffix in item["name"] for suffix in BACKUP_SUFFIXES)
+                ),
+                key=lambda item: item["id"],
+            )
+            start = int(page_token or 0)
+            end = start + min(page_size, MAX_PAGE_SIZE)
+            response = {
+                "files": [
+                    {key: item[key] for key in DRIVE_FILE_KEYS}
+                    for item in matching[start:end]
+                ]
+            }
+            if end < len(matching):
+                response["nextPageToken"] = str(end)
+            return response
+
+        async def async_list_changes(self, page_token, fields, page_size):
+            drive.calls["list_changes"] += 1
+            if drive.changes_error is not None:
+                error, drive.changes_error = drive.changes_error, None
+                raise error
+            start = int(page_token)
+            end = start + min(page_size, MAX_PAGE_SIZE)
+            response = {"changes": [dict(change) for change in drive.changes[start:end]]}
+            if end < len(drive.changes):
+                response["nextPageToken"] = str(end)
+            else:
+                response["newStartPageToken"] = str(len(drive.changes))
+            return response
+
+    return FakeDriveTransport, DriveApiError
+
+
+def check(description, condition):
+    """Stampa l'esito di un controllo."""
+    print(f"{'✅' if condition else '❌'} {description}")
+    return condition
+
+
+async def run_checks():
+    """Applica le modifiche al Drive finto e verifica ogni aggiornamento."""
+    from custom_components.backup_guardian import google_drive
+    from custom_components.backup_guardian.drive_api import DRIVE_TRANSPORT_CLASSES
+
+    drive = FakeDrive()
+    transport_cls, drive_api_error = make_transport(drive)
+    DRIVE_TRANSPORT_CLASSES[CHECK_TRANSPORT] = transport_cls
+    google_drive.Store = MemoryStore
+
+    client = google_drive.GoogleDriveClient(
+        None,
+        {"client_id": "check", "client_secret": "check", "token": "check", "folder_id": "root"},
+        transport=CHECK_TRANSPORT,
+    )
+    if not await client.async_setup():
+        return check("Trasporto finto inizializzato", False)
+
+    all_ok = True
+
+    async def refresh(description, expect_rescan=False):
+        """Aggiorna il client e confronta i backup con la cartella."""
+        listed = drive.calls["list_files"]
+        backups = await client.async_get_backups()
+        rescanned = drive.calls["list_files"] > listed
+        names = {backup.name for backup in backups}
+        ok = names == drive.folder_backups() and rescanned == expect_rescan
+        if not ok:
+            print(f"   backup: {sorted(names)}")
+            print(f"   attesi: {sorted(drive.folder_backups())}, nuova scansione: {rescanned}")
+        return check(description, ok)
+
+    for index in range(5):
+        drive.put(f"file{index}", f"backup_2026-02-{index + 10}_03-00-00.tar")
+    drive.put("notes", "notes.txt")
+    all_ok &= await refresh("Primo avvio: scansione completa paginata", expect_rescan=True)
+    all_ok &= await refresh("Nessuna modifica: nessuna scansione")
+
+    drive.put("file5", "backup_2026-02-15_03-00-00.tar.gz")
+    drive.put("file6", "backup_2026-02-16_03-00-00.tgz")
+    drive.put("elsewhere", "backup_2026-02-16_04-00-00.tar", parents=(OTHER_FOLDER_ID,))
+    all_ok &= await refresh("Aggiunte, ignorate quelle in altre cartelle")
+
+    drive.put("file0", "backup_2026-02-10_03-00-00.tar", trashed=True)
+    all_ok &= await refresh("File spostato nel cestino rimosso")
+
+    drive.put("file1", "backup_rinominato_2026-02-11.tar")
+    drive.put("file2", "backup_2026-02-12.tar.old")
+    all_ok &= await refresh("Rinomine: nome aggiornato, non più backup rimosso")
+
+    drive.put("file3", "backup_2026-02-13_03-00-00.tar", parents=(OTHER_FOLDER_ID,))
+    all_ok &= await refresh("File spostato fuori dalla cartella rimosso")
+
+    drive.delete("file4")
+    drive.put("file2", "backup_2026-02-12_03-00-00.tar")
+    all_ok &= await refresh("Eliminazione definitiva e file tornato backup")
+
+    drive.put("file0", "backup_2026-02-10_03-00-00.tar")
+    drive.put("file3", "backup_2026-02-13_03-00-00.tar")
+    all_ok &= await refresh("Ripristino dal cestino e ritorno nella cartella")
+
+    # Token non più valido: nuova scansione completa
+    drive.put("file7", "backup_2026-02-17_03-00-00.tar")
+    drive.changes_error = drive_api_error(410, "Token scaduto")
+    all_ok &= await refresh("Token scaduto (410): nuova scansione", expect_rescan=True)
+
+    drive.put("file8", "backup_2026-02-18_03-00-00.tar")
+    drive.changes_error = drive_api_error(
+        400,
+        "Invalid Value",
+        [{"reason": "invalid", "location": "pageToken", "locationType": "parameter"}],
+    )
+    all_ok &= await refresh("Token non valido (400 su pageToken): nuova scansione", expect_rescan=True)
+
+    # Altri 400 (es. fields errato) sono errori veri, senza nuova scansione
+    drive.put("file9", "backup_2026-02-19_03-00-00.tar")
+    drive.changes_error = drive_api_error(
+        400,
+        "Invalid field selection",
+        [{"reason": "invalidParameter", "location": "fields", "locationType": "parameter"}],
+    )
+    listed = drive.calls["list_files"]
+    try:
+        await client.async_get_backups()
+        raised = False
+    except drive_api_error:
+        raised = True
+    all_ok &= check(
+        "Errore 400 su fields segnalato senza nuova scansione",
+        raised and drive.calls["list_files"] == listed,
+    )
+    all_ok &= await refresh("Aggiornamento successivo all'errore")
+
+    return all_ok
+
+
+def main():
+    """Esegue i controlli e stampa il report."""
+    print("🔍 Verifica delta sync di Google Drive\n")
+
+    try:
+        from custom_components.backup_guardian import google_drive  # noqa: F401
+    except ImportError as e:
+        print(f"❌ Import fallito (Home Assistant è installato?):\n{e}")
+        return 1
+
+    all_ok = asyncio.run(run_checks())
+
+    print("\n" + "=" * 50)
+    if all_ok:
+        print("✅ Verifica completata: TUTTO OK!")
+        return 0
+    print("❌ Verifica fallita: controlla gli errori sopra")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Verifica dell'indice delle copie di Backup Guardian
+Costruisce i record con le stesse funzioni delle sorgenti (Supervisor e
+Google Drive) e controlla che un backup locale e il suo caricamento su Drive
+finiscano nello stesso gruppo
+
+Uso:
+    python check_replicas.py
+"""
+
+import hashlib
+import sys
+
+INTEGRATION = "custom_components.backup_guardian"
+
+# Archivio locale e la sua copia caricata su Drive
+ARCHIVE_BYTES = 1_234_567_891
+ARCHIVE_MD5 = hashlib.md5(b"archivio di prova").hexdigest()
+
+SUPERVISOR_BACKUP = {
+    "slug": "abc123",
+    "name": "Full Backup 2026-02-15 17:16:00",
+    "date": "2026-02-15T16:16:00.000000+00:00",
+    "type": "full",
+    "protected": False,
+    # Il Supervisor riporta la dimensione in MB arrotondata
+    "size": round(ARCHIVE_BYTES / (1024 * 1024), 2),
+    "size_bytes": ARCHIVE_BYTES,
+}
+DRIVE_FILE = {
+    "id": "1AbCdEf",
+    "name": "Full Backup 2026-02-15 17:16:00.tar",
+    "size": str(ARCHIVE_BYTES),
+    "md5Checksum": ARCHIVE_MD5,
+    "modifiedTime": "2026-02-15T16:40:12.000Z",
+}
+
+
+def check(description, condition):
+    """Stampa l'esito di un controllo."""
+    print(f"{'✅' if condition else '❌'} {description}")
+    return condition
+
+
+def main():
+    """Esegue i controlli e stampa il report."""
+    print("🔍 Verifica indice delle copie\n")
+
+    try:
+        from custom_components.backup_guardian.google_drive import GoogleDriveClient
+        from custom_components.backup_guardian.replicas import ReplicaIndex
+        from custom_components.backup_guardian.supervisor import SupervisorBackupSource
+    except ImportError as e:
+        print(f"❌ Import fallito (Home Assistant è installato?):\n{e}")
+        return 1
+
+    supervisor = SupervisorBackupSource(None)
+    drive = GoogleDriveClient(None, {})
+    all_ok = True
+
+    # Checksum dell'archivio già calcolato in background
+    local = supervisor.process({**SUPERVISOR_BACKUP, "checksum": ARCHIVE_MD5})
+    uploaded = drive.process(DRIVE_FILE)
+    index = ReplicaIndex()
+    index.update([local, uploaded])
+    all_ok &= check("Dimensione locale esatta in byte", local.size == ARCHIVE_BYTES)
+    all_ok &= check("Copia su Drive riconosciuta tramite MD5", index.is_offsite(local))
+    all_ok &= check("Nessun backup locale senza copia", not index.not_offsite([local, uploaded]))
+
+    # Checksum non ancora calcolato: nome e dimensione esatta
+    local = supervisor.process(SUPERVISOR_BACKUP)
+    index = ReplicaIndex()
+    index.update([local, uploaded])
+    all_ok &= check("Copia su Drive riconosciuta tramite nome e dimensione", index.is_offsite(local))
+
+    # Aggiornamento incrementale: la copia su Drive viene eliminata
+    index.update([local])
+    all_ok &= check("Copia eliminata da Drive rilevata", not index.is_offsite(local))
+    index.update([local, uploaded])
+    all_ok &= check("Copia ricaricata su Drive rilevata", index.replica_count(local) == 1)
+
+    print("\n" + "=" * 50)
+    if all_ok:
+        print("✅ Verifica completata: TUTTO OK!")
+        return 0
+    print("❌ Verifica fallita: controlla gli errori sopra")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
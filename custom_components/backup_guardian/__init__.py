@@ -1,42 +1,63 @@
 """The Backup Guardian integration."""
+import hashlib
 import logging
-import os
 import shutil
 from pathlib import Path
 
+from homeassistant.components.http import StaticPathConfig
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
-
-from .const import DOMAIN, PLATFORMS
+from homeassistant.loader import async_get_integration
+
+from .const import (
+    CONF_GOOGLE_TOKEN,
+    DOMAIN,
+    FRONTEND_CARD_FILE,
+    FRONTEND_URL_PATH,
+    PLATFORMS,
+)
 from .coordinator import BackupGuardianCoordinator
+from .services import async_setup_services, async_unload_services
 
 _LOGGER = logging.getLogger(__name__)
 
+DATA_FRONTEND_REGISTERED = f"{DOMAIN}_frontend_registered"
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Backup Guardian from a config entry."""
-    # Copy frontend files automatically
-    await _copy_frontend_files(hass)
+    # Serve the Lovelace card and copy it to www
+    await _async_setup_frontend(hass)
     
     # Initialize coordinator
     coordinator = BackupGuardianCoordinator(hass)
+    coordinator.version = str((await async_get_integration(hass, DOMAIN)).version)
+    entry.async_on_unload(coordinator.async_shutdown)
     
-    # Setup Google Drive if enabled
-    google_drive_ok = await coordinator.async_setup_google_drive(entry.data)
-    if not google_drive_ok:
+    # Setup every enabled backup source (Supervisor, Google Drive, NAS...)
+    failed_sources = await coordinator.async_setup_sources(entry)
+    if failed_sources:
         _LOGGER.warning(
-            "Google Drive setup failed, continuing with local backups only"
+            f"Setup failed for {', '.join(failed_sources)}, continuing with the other sources"
         )
     
-    # First refresh to get data
-    await coordinator.async_config_entry_first_refresh()
+    # Publish the stored catalog right away and refresh in background,
+    # otherwise wait for the first refresh to get data
+    if await coordinator.async_load_catalog():
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN}_initial_refresh"
+        )
+    else:
+        await coordinator.async_config_entry_first_refresh()
 
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    async_setup_services(hass)
+
     # Register update listener for config changes
     entry.async_on_unload(entry.add_update_listener(async_reload_entry))
 
@@ -49,50 +70,79 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id)
+        if not hass.data[DOMAIN]:
+            async_unload_services(hass)
 
     return unload_ok
 
 
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Reload config entry when options change."""
+    # Un token di accesso rinnovato non richiede il reload
+    coordinator = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    if coordinator and _without_access_token(entry.data) == _without_access_token(
+        coordinator.config_data
+    ):
+        return
     await hass.config_entries.async_reload(entry.entry_id)
 
 
-async def _copy_frontend_files(hass: HomeAssistant) -> None:
-    """Copy frontend JavaScript files to www directory."""
-    try:
-        # Directory sorgente (dove si trova il file nell'integrazione)
-        source_dir = Path(__file__).parent / "www"
-        source_file = source_dir / "backup-guardian-card.js"
-        
-        # Directory destinazione (dove deve essere copiato per HACS/frontend)
-        dest_dir = Path(hass.config.path("www/community/backup_guardian"))
-        dest_file = dest_dir / "backup-guardian-card.js"
-        
-        # Crea la directory di destinazione se non esiste
-        dest_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Copia il file se non esiste o se è diverso
-        if not dest_file.exists() or _files_are_different(source_file, dest_file):
-            await hass.async_add_executor_job(shutil.copy2, source_file, dest_file)
-            _LOGGER.info(f"✅ Frontend file copied to {dest_file}")
-        else:
-            _LOGGER.debug("Frontend file already up to date")
-            
-    except Exception as err:
-        _LOGGER.warning(f"Could not copy frontend files: {err}. You may need to copy them manually.")
-
-
-def _files_are_different(file1: Path, file2: Path) -> bool:
-    """Check if two files are different."""
+def _without_access_token(data: dict) -> dict:
+    """Return config entry data without the short-lived access token."""
+    token = {
+        key: value
+        for key, value in (data.get(CONF_GOOGLE_TOKEN) or {}).items()
+        if key not in ("access_token", "expires_at")
+    }
+    return {**data, CONF_GOOGLE_TOKEN: token}
+
+
+async def _async_setup_frontend(hass: HomeAssistant) -> None:
+    """Serve the Lovelace card and keep the legacy copy in www up to date."""
+    source_dir = Path(__file__).parent / "www"
+
+    # Servito direttamente dalla cartella dell'integrazione, senza copie
+    if not hass.data.get(DATA_FRONTEND_REGISTERED):
+        await hass.http.async_register_static_paths(
+            [StaticPathConfig(FRONTEND_URL_PATH, str(source_dir), True)]
+        )
+        hass.data[DATA_FRONTEND_REGISTERED] = True
+
+    # Copia in /config/www per le risorse configurate con l'URL /local
+    dest_dir = Path(hass.config.path("www/community/backup_guardian"))
     try:
-        # Confronta dimensioni prima (veloce)
-        if file1.stat().st_size != file2.stat().st_size:
-            return True
-        
-        # Se le dimensioni sono uguali, ritorna False (assumiamo siano uguali)
-        # Per evitare blocking call su open() nell'event loop
+        copied = await hass.async_add_executor_job(
+            _sync_frontend_file, source_dir / FRONTEND_CARD_FILE, dest_dir / FRONTEND_CARD_FILE
+        )
+    except OSError as err:
+        _LOGGER.warning(
+            f"Could not copy frontend files: {err}. "
+            f"Use {FRONTEND_URL_PATH}/{FRONTEND_CARD_FILE} as card resource."
+        )
+        return
+
+    if copied:
+        _LOGGER.info(f"✅ Frontend file copied to {dest_dir / FRONTEND_CARD_FILE}")
+    else:
+        _LOGGER.debug("Frontend file already up to date")
+
+
+def _sync_frontend_file(source_file: Path, dest_file: Path) -> bool:
+    """Copy the card if the destination is missing or its content differs.
+
+    Blocking call for executor.
+
+    Returns:
+        True if the file was copied
+    """
+    if dest_file.exists() and _file_hash(source_file) == _file_hash(dest_file):
         return False
-    except Exception:
-        # In caso di errore, assumiamo che siano diversi per forzare la copia
-        return True
+
+    dest_file.parent.mkdir(parents=True, exist_ok=True)
+    shutil.copy2(source_file, dest_file)
+    return True
+
+
+def _file_hash(path: Path) -> str:
+    """Return the SHA-256 of a file (blocking call for executor)."""
+    return hashlib.sha256(path.read_bytes()).hexdigest()
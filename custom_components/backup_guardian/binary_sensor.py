@@ -0,0 +1,73 @@
+"""Binary sensor platform for Backup Guardian."""
+import logging
+
+from homeassistant.components.binary_sensor import (
+    BinarySensorDeviceClass,
+    BinarySensorEntity,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import DOMAIN
+from .freshness import target_name
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up Backup Guardian binary sensors."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+
+    async_add_entities(
+        BackupGuardianFreshnessBinarySensor(coordinator, entry, target)
+        for target in coordinator.freshness.targets
+    )
+
+
+class BackupGuardianFreshnessBinarySensor(CoordinatorEntity, BinarySensorEntity):
+    """Problem sensor, on when the newest backup of a target is too old."""
+
+    _attr_has_entity_name = True
+    _attr_device_class = BinarySensorDeviceClass.PROBLEM
+
+    def __init__(self, coordinator, entry, target):
+        """Initialize the binary sensor."""
+        super().__init__(coordinator)
+        self._entry = entry
+        self._target = target
+        self._attr_name = f"Backup Scaduto {target_name(target)}"
+        self._attr_unique_id = f"{entry.entry_id}_scaduto_{target.replace(':', '_')}"
+        self._attr_icon = "mdi:backup-restore"
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Return device info."""
+        return DeviceInfo(
+            identifiers={(DOMAIN, self._entry.entry_id)},
+            name="Backup Guardian",
+            manufacturer="Leonardo",
+            model="Backup Monitor",
+            sw_version=self.coordinator.version,
+        )
+
+    @property
+    def is_on(self) -> bool:
+        """Return true if the SLA is breached."""
+        return self.coordinator.freshness.is_breached(self._target)
+
+    @property
+    def extra_state_attributes(self):
+        """Return the state attributes."""
+        newest = self.coordinator.freshness.newest(self._target)
+        deadline = self.coordinator.freshness.deadline(self._target)
+        return {
+            "last_backup": newest.isoformat() if newest else None,
+            "deadline": deadline.isoformat() if deadline else None,
+        }
@@ -0,0 +1,118 @@
+"""Persistent backup catalog for Backup Guardian.
+
+The last processed backups are stored on disk so that sensors can be
+populated right after a restart, before Supervisor and Google Drive answer.
+"""
+import logging
+from datetime import datetime, timedelta
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import CATALOG_STORAGE_KEY, STORAGE_VERSION
+from .record import BackupRecord
+
+_LOGGER = logging.getLogger(__name__)
+
+# Bump when the layout of stored backups changes, older catalogs are discarded
+CATALOG_SCHEMA_VERSION = 2
+
+# Delay before writing the catalog to storage (seconds)
+CATALOG_SAVE_DELAY = 30
+
+# Interval between writes of an unchanged catalog, to keep the fetch times current
+CATALOG_TIMESTAMP_INTERVAL = timedelta(hours=1)
+
+
+class BackupCatalog:
+    """On-disk catalog of the last processed backups."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the catalog.
+
+        Args:
+            hass: Home Assistant instance
+        """
+        self.hass = hass
+        self._store = Store(hass, STORAGE_VERSION, CATALOG_STORAGE_KEY)
+        self._backups: list[BackupRecord] = []
+        # source -> ISO timestamp of the last successful fetch
+        self._sources: dict[str, str] = {}
+        # UTC time of the last scheduled write
+        self._saved_at: datetime | None = None
+
+    @property
+    def sources(self) -> dict[str, str]:
+        """Return the last update timestamp of each source."""
+        return self._sources
+
+    async def async_load(self) -> list[BackupRecord] | None:
+        """Load the stored backups.
+
+        Returns:
+            List of processed backups, or None if no usable catalog exists
+        """
+        try:
+            stored = await self._store.async_load()
+        except Exception as err:
+            _LOGGER.warning(f"Could not load backup catalog: {err}")
+            return None
+
+        if not stored:
+            return None
+
+        if stored.get("schema_version") != CATALOG_SCHEMA_VERSION:
+            _LOGGER.info("Discarding backup catalog with old schema version")
+            return None
+
+        backups = []
+        for item in stored.get("backups", []):
+            record = BackupRecord.from_storage(item)
+            if record is not None:
+                backups.append(record)
+
+        self._backups = backups
+        self._sources = stored.get("sources", {})
+        self._saved_at = dt_util.utcnow()
+        _LOGGER.debug("Loaded %d backups from catalog", len(backups))
+        return backups
+
+    @callback
+    def async_update(
+        self, backups: list[BackupRecord], sources: list[str], changed: bool = True
+    ) -> None:
+        """Record a new snapshot and schedule writing it to disk.
+
+        An unchanged snapshot is written only once per
+        CATALOG_TIMESTAMP_INTERVAL, to refresh the stored fetch times.
+
+        Args:
+            backups: Full list of processed backups
+            sources: Sources fetched successfully during this refresh
+            changed: Whether any source reported added, updated or removed backups
+        """
+        now = dt_util.utcnow()
+        for source in sources:
+            self._sources[source] = now.isoformat()
+        self._backups = backups
+
+        # Catalogo invariato: evita scritture continue su disco (schede SD)
+        if (
+            not changed
+            and self._saved_at is not None
+            and now - self._saved_at < CATALOG_TIMESTAMP_INTERVAL
+        ):
+            return
+        self._saved_at = now
+        self._store.async_delay_save(self._data_to_save, CATALOG_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the catalog in its serializable form."""
+        return {
+            "schema_version": CATALOG_SCHEMA_VERSION,
+            "sources": self._sources,
+            "backups": [backup.as_storage() for backup in self._backups],
+        }
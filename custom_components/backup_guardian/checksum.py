@@ -0,0 +1,190 @@
+"""Persistent archive checksum cache for Backup Guardian.
+
+Archives are hashed with streaming reads in the executor, one at a time and
+with a bounded read rate so SD-card installs are not saturated. Results are
+stored on disk keyed by (path, size, mtime, inode), so an archive is hashed
+only once for as long as it is not modified.
+
+The checksum is an MD5, the only content hash Google Drive reports, so a
+local archive can be matched with its uploaded copy.
+"""
+import hashlib
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import CHECKSUM_STORAGE_KEY, STORAGE_VERSION
+
+_LOGGER = logging.getLogger(__name__)
+
+# Size of each streaming read (bytes)
+CHECKSUM_CHUNK_SIZE = 1024 * 1024
+# Maximum read rate while hashing (bytes per second)
+CHECKSUM_MAX_RATE = 16 * 1024 * 1024
+# Delay before writing the cache to storage (seconds)
+CHECKSUM_SAVE_DELAY = 30
+
+
+def stat_key(path: str) -> tuple[int, int, int] | None:
+    """Return the (size, mtime_ns, inode) cache key of a file (blocking call).
+
+    Returns:
+        Key tuple, or None if the file does not exist
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns, stat.st_ino
+
+
+def hash_archive(
+    path: str, stop: threading.Event, max_rate: int = CHECKSUM_MAX_RATE
+) -> str | None:
+    """Compute the MD5 of a file with throttled streaming reads.
+
+    Blocking call for executor.
+
+    Args:
+        path: File to hash
+        stop: Checked on every chunk, hashing is abandoned once set
+        max_rate: Maximum read rate in bytes per second
+
+    Returns:
+        Hex digest, None if stopped
+    """
+    digest = hashlib.md5(usedforsecurity=False)
+    buffer = bytearray(CHECKSUM_CHUNK_SIZE)
+    view = memoryview(buffer)
+    started = time.monotonic()
+    total = 0
+
+    with open(path, "rb", buffering=0) as archive:
+        while read := archive.readinto(buffer):
+            if stop.is_set():
+                return None
+            digest.update(view[:read])
+            total += read
+            # Wait if reading faster than the allowed rate, waking up on stop
+            ahead = total / max_rate - (time.monotonic() - started)
+            if ahead > 0 and stop.wait(ahead):
+                return None
+
+    return digest.hexdigest()
+
+
+class ArchiveChecksumCache:
+    """On-disk cache of archive checksums, filled in the background."""
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry | None = None) -> None:
+        """Initialize the cache.
+
+        Args:
+            hass: Home Assistant instance
+            entry: Config entry owning the background hashing task
+        """
+        self.hass = hass
+        self._entry = entry
+        self._store = Store(hass, STORAGE_VERSION, CHECKSUM_STORAGE_KEY)
+        # path -> [size, mtime_ns, inode, md5]
+        self._entries: dict[str, list[Any]] | None = None
+        self._pending: dict[str, tuple[int, int, int]] = {}
+        self._hashing = False
+        # Set on unload, stops the hash running in the executor
+        self._stop = threading.Event()
+
+    async def async_load(self) -> None:
+        """Load the stored checksums once."""
+        if self._entries is not None:
+            return
+        stored = await self._store.async_load() or {}
+        # Le versioni precedenti salvavano SHA-256 in "archives"
+        self._entries = stored.get("archives_md5", {})
+
+    def get(self, path: str, key: tuple[int, int, int]) -> str | None:
+        """Return the cached checksum of an unchanged archive."""
+        entry = (self._entries or {}).get(path)
+        if entry is None or tuple(entry[:3]) != key:
+            return None
+        return entry[3]
+
+    @callback
+    def async_prune(self, paths: set[str]) -> None:
+        """Forget the checksums of archives that no longer exist."""
+        removed = [path for path in self._entries or {} if path not in paths]
+        for path in removed:
+            del self._entries[path]
+        if removed:
+            self._async_schedule_save()
+
+    @callback
+    def async_schedule(
+        self,
+        archives: dict[str, tuple[int, int, int]],
+        on_done: Callable[[], None] | None = None,
+    ) -> None:
+        """Queue archives for hashing in the background.
+
+        Args:
+            archives: path -> cache key of the archives to hash
+            on_done: Called after new checksums have been computed
+        """
+        self._pending.update(archives)
+        if self._hashing or not self._pending or self._stop.is_set():
+            return
+        self._hashing = True
+        target = self._async_hash_pending(on_done)
+        name = "backup_guardian_archive_checksums"
+        if self._entry is not None:
+            self._entry.async_create_background_task(self.hass, target, name)
+        else:
+            self.hass.async_create_background_task(target, name)
+
+    async def _async_hash_pending(self, on_done: Callable[[], None] | None) -> None:
+        """Hash the queued archives one at a time."""
+        computed = 0
+        try:
+            while self._pending and not self._stop.is_set():
+                path, key = self._pending.popitem()
+                try:
+                    checksum = await self.hass.async_add_executor_job(
+                        hash_archive, path, self._stop
+                    )
+                    if checksum is None:
+                        break
+                    # The archive may have been written while it was read
+                    current = await self.hass.async_add_executor_job(stat_key, path)
+                except OSError as err:
+                    _LOGGER.debug("Could not hash %s: %s", path, err)
+                    continue
+                if current != key:
+                    continue
+                self._entries[path] = [*key, checksum]
+                computed += 1
+                _LOGGER.debug("Computed checksum of %s", path)
+        finally:
+            self._hashing = False
+
+        if computed:
+            self._async_schedule_save()
+            if on_done is not None and not self._stop.is_set():
+                on_done()
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop hashing, also the archive being read in the executor."""
+        self._stop.set()
+        self._pending.clear()
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Schedule writing the cache to disk."""
+        self._store.async_delay_save(
+            lambda: {"archives_md5": self._entries}, CHECKSUM_SAVE_DELAY
+        )
@@ -1,5 +1,6 @@
 """Config flow for Backup Guardian integration."""
 import logging
+import time
 from typing import Any
 
 import voluptuous as vol
@@ -15,6 +16,20 @@ from .const import (
     CONF_GOOGLE_CLIENT_SECRET,
     CONF_GOOGLE_FOLDER_ID,
     CONF_GOOGLE_TOKEN,
+    CONF_NAS_PATHS,
+    CONF_BACKUP_LIST_LIMIT,
+    CONF_GOOGLE_DRIVE_TRANSPORT,
+    DEFAULT_BACKUP_LIST_LIMIT,
+    DEFAULT_DRIVE_TRANSPORT,
+    DRIVE_TRANSPORTS,
+    CONF_RETENTION_DAILY,
+    CONF_RETENTION_MONTHLY,
+    CONF_RETENTION_WEEKLY,
+    DEFAULT_RETENTION_DAILY,
+    DEFAULT_RETENTION_MONTHLY,
+    DEFAULT_RETENTION_WEEKLY,
+    CONF_FRESHNESS_SLA,
+    DEFAULT_FRESHNESS_SLA,
 )
 from .oauth_handler import (
     GoogleDriveOAuth2Handler,
@@ -88,7 +103,7 @@ class BackupGuardianOptionsFlow(config_entries.OptionsFlow):
         """Show configuration menu."""
         return self.async_show_menu(
             step_id="menu",
-            menu_options=["google_drive", "advanced"],
+            menu_options=["google_drive", "nas", "retention", "freshness", "advanced"],
         )
 
     async def async_step_google_drive(
@@ -226,6 +241,8 @@ class BackupGuardianOptionsFlow(config_entries.OptionsFlow):
                                 "access_token": tokens.get("access_token"),
                                 "refresh_token": tokens.get("refresh_token"),
                                 "token_type": tokens.get("token_type"),
+                                "expires_at": time.time()
+                                + float(tokens.get("expires_in") or 3600),
                             },
                         }
                     )
@@ -264,16 +281,136 @@ class BackupGuardianOptionsFlow(config_entries.OptionsFlow):
             },
         )
 
+    async def async_step_nas(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Configure local directories or NAS mounts to scan."""
+        if user_input is not None:
+            paths = [
+                path.strip()
+                for path in user_input.get(CONF_NAS_PATHS, "").split(",")
+                if path.strip()
+            ]
+            new_data = {**self.config_entry.data}
+            new_data[CONF_NAS_PATHS] = paths
+            self.hass.config_entries.async_update_entry(
+                self.config_entry, data=new_data
+            )
+            return self.async_create_entry(title="", data={})
+
+        current_paths = ", ".join(self.config_entry.data.get(CONF_NAS_PATHS, []))
+
+        return self.async_show_form(
+            step_id="nas",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(CONF_NAS_PATHS, default=current_paths): str,
+                }
+            ),
+            description_placeholders={
+                "example": "/media/nas/backups, /share/backups",
+            },
+        )
+
+    async def async_step_retention(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Configure the retention policy used for evaluation and forecasts."""
+        if user_input is not None:
+            new_data = {**self.config_entry.data}
+            new_data.update(user_input)
+            self.hass.config_entries.async_update_entry(
+                self.config_entry, data=new_data
+            )
+            return self.async_create_entry(title="", data={})
+
+        data = self.config_entry.data
+        retention_count = vol.All(vol.Coerce(int), vol.Range(min=0, max=1000))
+
+        return self.async_show_form(
+            step_id="retention",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_RETENTION_DAILY,
+                        default=data.get(CONF_RETENTION_DAILY, DEFAULT_RETENTION_DAILY),
+                    ): retention_count,
+                    vol.Required(
+                        CONF_RETENTION_WEEKLY,
+                        default=data.get(CONF_RETENTION_WEEKLY, DEFAULT_RETENTION_WEEKLY),
+                    ): retention_count,
+                    vol.Required(
+                        CONF_RETENTION_MONTHLY,
+                        default=data.get(CONF_RETENTION_MONTHLY, DEFAULT_RETENTION_MONTHLY),
+                    ): retention_count,
+                }
+            ),
+        )
+
+    async def async_step_freshness(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Configure the maximum backup age of each destination and type."""
+        if user_input is not None:
+            new_data = {**self.config_entry.data}
+            # Campi del form: "destination_local" -> "destination:local"
+            new_data[CONF_FRESHNESS_SLA] = {
+                key: user_input[key.replace(":", "_")] for key in DEFAULT_FRESHNESS_SLA
+            }
+            self.hass.config_entries.async_update_entry(
+                self.config_entry, data=new_data
+            )
+            return self.async_create_entry(title="", data={})
+
+        current = {
+            **DEFAULT_FRESHNESS_SLA,
+            **self.config_entry.data.get(CONF_FRESHNESS_SLA, {}),
+        }
+
+        return self.async_show_form(
+            step_id="freshness",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(key.replace(":", "_"), default=current[key]): vol.All(
+                        vol.Coerce(int), vol.Range(min=0, max=24 * 365)
+                    )
+                    for key in DEFAULT_FRESHNESS_SLA
+                }
+            ),
+        )
+
     async def async_step_advanced(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Configure advanced settings."""
-        # Placeholder for future advanced settings
+        if user_input is not None:
+            new_data = {**self.config_entry.data}
+            new_data.update(user_input)
+            self.hass.config_entries.async_update_entry(
+                self.config_entry, data=new_data
+            )
+            return self.async_create_entry(title="", data={})
+
+        current_limit = self.config_entry.data.get(
+            CONF_BACKUP_LIST_LIMIT, DEFAULT_BACKUP_LIST_LIMIT
+        )
+        current_transport = self.config_entry.data.get(
+            CONF_GOOGLE_DRIVE_TRANSPORT, DEFAULT_DRIVE_TRANSPORT
+        )
+
         return self.async_show_form(
             step_id="advanced",
-            data_schema=vol.Schema({}),
+            data_schema=vol.Schema(
+                {
+                    vol.Required(CONF_BACKUP_LIST_LIMIT, default=current_limit): vol.All(
+                        vol.Coerce(int), vol.Range(min=1, max=500)
+                    ),
+                    vol.Required(
+                        CONF_GOOGLE_DRIVE_TRANSPORT, default=current_transport
+                    ): vol.In(DRIVE_TRANSPORTS),
+                }
+            ),
             description_placeholders={
-                "info": "Impostazioni avanzate disponibili nelle prossime versioni"
+                "info": "Il catalogo completo è disponibile con il servizio backup_guardian.list_backups"
             },
         )
-        
\ No newline at end of file
@@ -3,11 +3,48 @@
 DOMAIN = "backup_guardian"
 
 # Platforms
-PLATFORMS = ["sensor"]
+PLATFORMS = ["sensor", "binary_sensor"]
 
-# Update interval in seconds (5 minutes)
+# Storage
+STORAGE_VERSION = 1
+DRIVE_INDEX_STORAGE_KEY = f"{DOMAIN}.drive_index"
+CATALOG_STORAGE_KEY = f"{DOMAIN}.catalog"
+CHECKSUM_STORAGE_KEY = f"{DOMAIN}.checksums"
+
+# Update interval in seconds (5 minutes), default base poll interval
 UPDATE_INTERVAL = 300
 
+# Lovelace card, served from the integration directory
+FRONTEND_CARD_FILE = "backup-guardian-card.js"
+FRONTEND_URL_PATH = f"/{DOMAIN}"
+
+# Services
+SERVICE_LIST_BACKUPS = "list_backups"
+SERVICE_EVALUATE_RETENTION = "evaluate_retention"
+
+# Number of most recent backups published in the backup_list attribute
+CONF_BACKUP_LIST_LIMIT = "backup_list_limit"
+DEFAULT_BACKUP_LIST_LIMIT = 20
+
+# Retention policy (GFS): daily, weekly and monthly backups to keep
+CONF_RETENTION_DAILY = "retention_daily"
+CONF_RETENTION_WEEKLY = "retention_weekly"
+CONF_RETENTION_MONTHLY = "retention_monthly"
+DEFAULT_RETENTION_DAILY = 7
+DEFAULT_RETENTION_WEEKLY = 4
+DEFAULT_RETENTION_MONTHLY = 12
+
+# Freshness SLA: maximum age in hours of the newest backup of each
+# destination ("destination:<code>") and backup type ("type:<type>"), 0 = off
+CONF_FRESHNESS_SLA = "freshness_sla"
+DEFAULT_FRESHNESS_SLA = {
+    "destination:local": 26,
+    "destination:google_drive": 26,
+    "destination:nas": 26,
+    "type:full": 0,
+    "type:partial": 0,
+}
+
 # Sensor attributes
 ATTR_BACKUP_NAME = "backup_name"
 ATTR_BACKUP_DATE = "backup_date"
@@ -24,6 +61,8 @@ DESTINATION_LOCAL = "local"
 DESTINATION_GOOGLE_DRIVE = "google_drive"
 DESTINATION_DROPBOX = "dropbox"
 DESTINATION_ONEDRIVE = "onedrive"
+DESTINATION_NAS = "nas"
+DESTINATION_FTP = "ftp"
 
 # Destination friendly names
 DESTINATION_NAMES = {
@@ -31,6 +70,38 @@ DESTINATION_NAMES = {
     DESTINATION_GOOGLE_DRIVE: "Google Drive",
     DESTINATION_DROPBOX: "Dropbox",
     DESTINATION_ONEDRIVE: "OneDrive",
+    DESTINATION_NAS: "NAS",
+    DESTINATION_FTP: "FTP",
+}
+
+# Fetch timeout per source in seconds
+SOURCE_TIMEOUTS = {
+    DESTINATION_LOCAL: 45,
+    DESTINATION_GOOGLE_DRIVE: 120,
+    DESTINATION_NAS: 60,
+}
+DEFAULT_SOURCE_TIMEOUT = 120
+
+# Base poll interval per source in seconds, doubled after every poll
+# without changes up to POLL_BACKOFF_FACTOR ** 3 times the base
+SOURCE_POLL_INTERVALS = {
+    DESTINATION_LOCAL: 300,
+    DESTINATION_GOOGLE_DRIVE: 1800,
+    DESTINATION_NAS: 900,
+}
+POLL_BACKOFF_FACTOR = 2
+
+# Safety net poll interval in seconds for sources that push their changes
+EVENT_DRIVEN_POLL_INTERVAL = 3600
+
+# Delay in seconds to group change events into a single refresh
+EVENT_REFRESH_COOLDOWN = 5
+
+# Poll interval per source in seconds around expected backup windows
+SOURCE_WINDOW_POLL_INTERVALS = {
+    DESTINATION_LOCAL: 60,
+    DESTINATION_GOOGLE_DRIVE: 300,
+    DESTINATION_NAS: 120,
 }
 
 # Google Drive configuration
@@ -39,17 +110,28 @@ CONF_GOOGLE_CLIENT_ID = "google_client_id"
 CONF_GOOGLE_CLIENT_SECRET = "google_client_secret"
 CONF_GOOGLE_FOLDER_ID = "google_folder_id"
 CONF_GOOGLE_TOKEN = "google_token"
+CONF_GOOGLE_DRIVE_TRANSPORT = "google_drive_transport"
+
+# Directory where the Supervisor stores local backups as <slug>.tar
+SUPERVISOR_BACKUP_DIR = "/backup"
+
+# Local directory / NAS configuration
+CONF_NAS_PATHS = "nas_paths"
 
 # Google Drive API
 GOOGLE_DRIVE_API_SCOPES = ["https://www.googleapis.com/auth/drive.readonly"]
 GOOGLE_DRIVE_API_VERSION = "v3"
+GOOGLE_DRIVE_API_URL = f"https://www.googleapis.com/drive/{GOOGLE_DRIVE_API_VERSION}"
+GOOGLE_DRIVE_BATCH_URL = f"https://www.googleapis.com/batch/drive/{GOOGLE_DRIVE_API_VERSION}"
+
+# Google Drive transports
+DRIVE_TRANSPORT_REST = "rest"  # Native aiohttp client
+DRIVE_TRANSPORT_DISCOVERY = "discovery"  # google-api-python-client
+DRIVE_TRANSPORTS = [DRIVE_TRANSPORT_REST, DRIVE_TRANSPORT_DISCOVERY]
+DEFAULT_DRIVE_TRANSPORT = DRIVE_TRANSPORT_REST
 
-# Backup file patterns (regex)
-BACKUP_FILE_PATTERNS = [
-    r".*\.tar$",      # .tar files
-    r".*\.tar\.gz$",  # .tar.gz files
-    r".*\.tgz$",      # .tgz files
-]
+# Backup archive suffixes, used for the Drive query and to classify file names
+BACKUP_FILE_SUFFIXES = (".tar", ".tar.gz", ".tgz")
 
 # OAuth2
 OAUTH_REDIRECT_URI = "urn:ietf:wg:oauth:2.0:oob"  # For manual code entry
@@ -1,25 +1,52 @@
 """Data coordinator for Backup Guardian."""
-import hashlib
+import asyncio
 import logging
+import time
 from datetime import datetime, timedelta
-from zoneinfo import ZoneInfo
+from functools import partial
 from typing import Any
 
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
-from homeassistant.helpers import hassio
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.util import dt as dt_util
 
 from .const import (
     DOMAIN, 
     UPDATE_INTERVAL,
-    CONF_GOOGLE_DRIVE_ENABLED,
-    CONF_GOOGLE_CLIENT_ID,
-    CONF_GOOGLE_CLIENT_SECRET,
-    CONF_GOOGLE_FOLDER_ID,
-    CONF_GOOGLE_TOKEN,
+    DESTINATION_GOOGLE_DRIVE,
+    DESTINATION_LOCAL,
+    SOURCE_TIMEOUTS,
+    DEFAULT_SOURCE_TIMEOUT,
+    EVENT_REFRESH_COOLDOWN,
 )
-from .google_drive import GoogleDriveClient
+from .catalog import BackupCatalog
+from .forecast import days_until_full, forecast_storage
+from .freshness import FreshnessMonitor, freshness_targets
+from .metrics import (
+    STAGE_AGGREGATION,
+    STAGE_ANALYSIS,
+    STAGE_CAPACITY,
+    STAGE_ENTITY_WRITE,
+    STAGE_FORECAST,
+    STAGE_REFRESH,
+    RefreshMetrics,
+)
+from .record import BackupRecord
+from .replicas import ReplicaIndex
+from .retention import (
+    PROJECTION_HORIZONS,
+    RetentionPolicy,
+    evaluate_retention,
+    project_usage_by_destination,
+)
+from .scheduler import AdaptivePollScheduler
+from .source import SOURCE_REGISTRY, BackupSource
+from .stats import aggregate_backups
+
+# Import source modules so they register themselves
+from . import google_drive, local_directory, supervisor  # noqa: F401
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -35,284 +62,375 @@ class BackupGuardianCoordinator(DataUpdateCoordinator):
             name=DOMAIN,
             update_interval=timedelta(seconds=UPDATE_INTERVAL),
         )
-        self._google_drive_client: GoogleDriveClient | None = None
-        self._google_drive_enabled = False
-
-    async def async_setup_google_drive(self, config_data: dict) -> bool:
-        """Setup Google Drive client if enabled."""
-        self._google_drive_enabled = config_data.get(CONF_GOOGLE_DRIVE_ENABLED, False)
-        
-        if not self._google_drive_enabled:
-            _LOGGER.info("Google Drive integration disabled")
-            self._google_drive_client = None
-            return True
-
-        try:
-            credentials = {
-                "client_id": config_data.get(CONF_GOOGLE_CLIENT_ID),
-                "client_secret": config_data.get(CONF_GOOGLE_CLIENT_SECRET),
-                "folder_id": config_data.get(CONF_GOOGLE_FOLDER_ID, "root"),
-                "token": config_data.get(CONF_GOOGLE_TOKEN, {}).get("access_token"),
-                "refresh_token": config_data.get(CONF_GOOGLE_TOKEN, {}).get("refresh_token"),
-            }
-
-            if not all([credentials["client_id"], credentials["client_secret"], credentials["token"]]):
-                _LOGGER.error("Missing Google Drive credentials")
-                return False
-
-            self._google_drive_client = GoogleDriveClient(self.hass, credentials)
-            
-            if not await self._google_drive_client.async_setup():
-                _LOGGER.error("Failed to setup Google Drive client")
-                self._google_drive_client = None
-                return False
-
-            _LOGGER.info("Google Drive integration enabled successfully")
-            return True
+        self._catalog = BackupCatalog(hass)
+        # destination code -> enabled backup source
+        self._sources: dict[str, BackupSource] = {}
+        self._scheduler = AdaptivePollScheduler()
+        self._replicas = ReplicaIndex()
+        # destination -> last reported free and total bytes
+        self._capacities: dict[str, dict[str, Any]] = {}
+        # Durations of the refresh stages, the sources keep their own
+        self.metrics = RefreshMetrics()
+        # Freshness SLA, one timer for the next deadline
+        self.freshness = FreshnessMonitor(hass, self.async_update_listeners)
+        # Trends fitted on the catalog, refitted only when it changes
+        self._forecast: dict[str, Any] | None = None
+        # Replicas and retention of the catalog, recomputed only when it changes
+        self._analysis: dict[str, Any] | None = None
+        # Sources to refresh on the next update regardless of their schedule
+        self._forced_sources: set[str] = set()
+        # Sources, sync state and replica index are not safe for concurrent refreshes
+        self._update_lock = asyncio.Lock()
+        # Config entry data the sources were set up with
+        self.config_data: dict[str, Any] = {}
+        # Integration version, shown in the device info
+        self.version: str | None = None
+        self._unsub_changes: list = []
+        self._source_refresh_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=EVENT_REFRESH_COOLDOWN,
+            immediate=False,
+            function=self.async_refresh,
+        )
 
-        except Exception as err:
-            _LOGGER.error(f"Error setting up Google Drive: {err}", exc_info=True)
-            self._google_drive_client = None
-            return False
+    @property
+    def destinations(self) -> list[str]:
+        """Return the destination codes of the enabled sources."""
+        return list(self._sources)
 
-    async def _get_backups_from_supervisor(self) -> list:
-        """Get backups using Supervisor via hassio component."""
-        try:
-            # Verifica che siamo su Hassio/Supervisor
-            if not hassio.is_hassio(self.hass):
-                _LOGGER.error("This integration requires Home Assistant OS or Supervised")
-                return []
-            
-            # Accedi direttamente al componente hassio
-            if "hassio" not in self.hass.data:
-                _LOGGER.error("Hassio component not loaded")
-                return []
-            
-            hassio_component = self.hass.data["hassio"]
-            
-            # Chiama il metodo send_command del componente hassio
-            _LOGGER.debug("Calling Supervisor via hassio component")
-            
+    async def async_setup_sources(self, entry: ConfigEntry) -> list[str]:
+        """Create and set up every enabled backup source.
+        
+        Args:
+            entry: Config entry
+        
+        Returns:
+            Destination codes of the sources that failed to set up
+        """
+        self.config_data = dict(entry.data)
+        failed = []
+        for destination, source_cls in SOURCE_REGISTRY.items():
             try:
-                result = await hassio_component.send_command(
-                    "/backups",
-                    method="get",
-                    timeout=30
-                )
-                
-                if not result:
-                    _LOGGER.error("No response from Supervisor")
-                    return []
-                
-                _LOGGER.debug(f"Supervisor raw response structure: {type(result)}, keys: {result.keys() if isinstance(result, dict) else 'N/A'}")
+                source = source_cls.from_config(self.hass, entry)
+                if source is None:
+                    _LOGGER.debug("Backup source %s disabled", destination)
+                    continue
                 
-                # Il formato della risposta del Supervisor varia
-                backups = []
+                if not await source.async_setup():
+                    _LOGGER.error(f"Failed to setup backup source {destination}")
+                    failed.append(destination)
+                    continue
                 
-                # Prova diversi formati di risposta
-                if isinstance(result, dict):
-                    if "data" in result and "backups" in result["data"]:
-                        backups = result["data"]["backups"]
-                    elif "backups" in result:
-                        backups = result["backups"]
+                self._sources[destination] = source
+                _LOGGER.info(f"Backup source {destination} enabled")
                 
-                _LOGGER.info(f"Retrieved {len(backups)} backups from Supervisor")
-                
-                # Log del primo backup per debug
-                if backups:
-                    _LOGGER.debug(f"First backup sample: {backups[0]}")
-                
-                return backups
+                # Aggiornamento su evento per le sorgenti che lo supportano
+                unsub = source.async_subscribe_changes(
+                    partial(self.async_request_source_refresh, destination)
+                )
+                if unsub is not None:
+                    self._unsub_changes.append(unsub)
+                    self._scheduler.set_event_driven(destination)
+                    _LOGGER.debug("Backup source %s pushes its changes", destination)
                 
-            except Exception as api_err:
-                _LOGGER.error(f"Supervisor API call failed: {api_err}", exc_info=True)
-                return []
-                    
-        except Exception as err:
-            _LOGGER.error(f"Error getting backups from Supervisor: {err}", exc_info=True)
-            return []
-
-    def _calculate_hash_from_slug(self, slug: str) -> str:
-        """Calculate a hash from backup slug for identification."""
-        try:
-            return hashlib.sha256(slug.encode()).hexdigest()
-        except Exception:
-            return "N/A"
+            except Exception as err:
+                _LOGGER.error(f"Error setting up backup source {destination}: {err}", exc_info=True)
+                failed.append(destination)
+        
+        self.freshness.configure(freshness_targets(self.config_data, self.destinations))
+        return failed
 
-    def _process_backup(self, backup_data: dict, source: str = "local") -> dict | None:
-        """Process a single backup from API data.
+    @callback
+    def async_request_source_refresh(self, destination: str) -> None:
+        """Schedule a debounced refresh of a single source.
         
         Args:
-            backup_data: Raw backup data from API
-            source: Source/destination of backup (local, google_drive, dropbox, etc.)
-        
+            destination: Destination code of the source that changed
+        """
+        self._forced_sources.add(destination)
+        self.hass.async_create_task(self._source_refresh_debouncer.async_call())
+
+    async def async_shutdown(self) -> None:
+        """Cancel event subscriptions and pending refreshes."""
+        for unsub in self._unsub_changes:
+            unsub()
+        self._unsub_changes.clear()
+        for source in self._sources.values():
+            source.async_shutdown()
+        self._source_refresh_debouncer.async_cancel()
+        self.freshness.async_stop()
+        await super().async_shutdown()
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update all registered listeners, timing the entity state writes."""
+        with self.metrics.time_stage(STAGE_ENTITY_WRITE):
+            super().async_update_listeners()
+
+    def metrics_report(self) -> dict[str, Any]:
+        """Return the stage timings and counters of the coordinator and sources."""
+        return {
+            "coordinator": self.metrics.as_dict(),
+            "sources": {
+                destination: source.metrics.as_dict()
+                for destination, source in self._sources.items()
+            },
+        }
+
+    async def async_load_catalog(self) -> bool:
+        """Publish the backups stored in the on-disk catalog.
+
         Returns:
-            Processed backup dictionary with all fields
+            True if a catalog was found and published as coordinator data
         """
+        backups = await self._catalog.async_load()
+        if backups is None:
+            return False
+
+        _LOGGER.info(f"Loaded {len(backups)} backups from catalog, refreshing in background")
+        async with self._update_lock:
+            data = self._build_data(backups)
+            await self._async_analyze(data["backups"], dt_util.now())
+            data.update(self._analysis)
+        self.async_set_updated_data(data)
+        return True
+
+    async def _async_update_data(self) -> dict:
+        """Fetch data from Supervisor API and Google Drive, one refresh at a time.
+        
+        Refreshes requested by source events may start while an interval
+        refresh is still fetching: they wait for it and then poll the
+        sources that changed in the meantime.
+        """
+        async with self._update_lock:
+            return await self._async_update_sources()
+
+    async def _async_update_sources(self) -> dict:
+        """Poll the due sources and rebuild the coordinator data."""
         try:
-            # Data dal Supervisor è in formato ISO UTC
-            date_str = backup_data.get("date", "")
+            start = time.perf_counter()
+            now = dt_util.now()
             
-            try:
-                # Formato: "2026-01-31T10:30:00.123456+00:00" (UTC)
-                # Convertiamo in datetime UTC
-                if "T" in date_str:
-                    date_obj_utc = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-                elif " " in date_str:
-                    date_obj_utc = datetime.strptime(date_str, "%Y-%m-%d %H:%M:%S")
-                    # Assumiamo sia UTC se non ha timezone
-                    date_obj_utc = date_obj_utc.replace(tzinfo=ZoneInfo("UTC"))
-                else:
-                    date_obj_utc = datetime.strptime(date_str, "%Y-%m-%d")
-                    date_obj_utc = date_obj_utc.replace(tzinfo=ZoneInfo("UTC"))
-                
-                # Convertiamo da UTC al fuso orario locale di Home Assistant
-                date_obj_local = dt_util.as_local(date_obj_utc)
-                
-                _LOGGER.debug(f"Backup date conversion: UTC={date_obj_utc.isoformat()} -> Local={date_obj_local.isoformat()}")
-                
-            except Exception as date_err:
-                _LOGGER.debug(f"Could not parse date {date_str}: {date_err}")
-                # Fallback: usa l'ora corrente locale
-                date_obj_local = dt_util.now()
-            
-            # Gestisci la dimensione - può essere in diversi formati
-            size_bytes = backup_data.get("size", 0)
-            
-            # Debug del formato size
-            _LOGGER.debug(f"Backup size raw value: {size_bytes}, type: {type(size_bytes)}")
-            
-            # Converti in float
-            if isinstance(size_bytes, str):
-                # Rimuovi caratteri non numerici e converti
-                size_bytes = float(''.join(c for c in size_bytes if c.isdigit() or c == '.'))
-            else:
-                size_bytes = float(size_bytes)
-            
-            # Se la dimensione è troppo piccola, potrebbe essere già in MB
-            if size_bytes < 1024:
-                # È probabilmente già in MB
-                size_mb = round(size_bytes, 2)
-                size_bytes = int(size_bytes * 1024 * 1024)
+            # Interroga in parallelo solo le sorgenti in scadenza
+            if self.data is None:
+                due = list(self._sources)
             else:
-                # È in bytes
-                size_mb = round(size_bytes / (1024 * 1024), 2)
-                size_bytes = int(size_bytes)
+                due = self._scheduler.due(list(self._sources), now)
+                due.extend(
+                    destination
+                    for destination in self._forced_sources
+                    if destination in self._sources and destination not in due
+                )
+            self._forced_sources.clear()
             
-            # Nome del backup
-            name = backup_data.get("name", backup_data.get("slug", "Unknown"))
+            backups = []
+            sources = []
+            for destination in self._sources:
+                if destination not in due:
+                    backups.extend(self._previous_backups(destination))
             
-            # Determina il nome friendly della destinazione
-            destination_map = {
-                "local": "Home Assistant Locale",
-                "google_drive": "Google Drive",
-                "dropbox": "Dropbox",
-                "onedrive": "OneDrive",
-                "nas": "NAS",
-                "ftp": "FTP",
-            }
-            destination_friendly = destination_map.get(source, source.title())
+            for next_result in asyncio.as_completed(
+                [self._async_fetch_source(self._sources[destination]) for destination in due]
+            ):
+                source, source_backups = await next_result
+                if source_backups is None:
+                    # Sorgente non disponibile: mantieni gli ultimi dati noti
+                    source_backups = self._previous_backups(source)
+                else:
+                    sources.append(source)
+                backups.extend(source_backups)
             
-            result = {
-                "name": name,
-                "slug": backup_data.get("slug", ""),
-                "size": size_bytes,
-                "size_mb": size_mb,
-                "date": date_obj_local.strftime("%Y-%m-%d"),
-                "time": date_obj_local.strftime("%H:%M:%S"),
-                "datetime": date_obj_local,
-                "hash": self._calculate_hash_from_slug(backup_data.get("slug", "")),
-                "type": backup_data.get("type", "full"),
-                "protected": backup_data.get("protected", False),
-                "compressed": True,
-                "destination": source,  # Codice destinazione (local, google_drive, ecc.)
-                "destination_name": destination_friendly,  # Nome user-friendly
+            data = self._build_data(backups)
+            data["deltas"] = {
+                destination: self._sources[destination].delta for destination in sources
             }
             
-            _LOGGER.debug(f"Processed backup: {name}, size: {size_mb} MB, time: {date_obj_local.strftime('%H:%M:%S')}, destination: {destination_friendly}")
-            return result
+            # Pianifica il prossimo aggiornamento in base all'attività delle sorgenti
+            changed = any(any(delta.values()) for delta in data["deltas"].values())
+            if changed or self.data is None:
+                self._scheduler.learn(data["backups"], now)
+            for destination in due:
+                delta = data["deltas"].get(destination)
+                self._scheduler.record(destination, bool(delta and any(delta.values())), now)
+            self.update_interval = self._scheduler.next_interval(list(self._sources), now)
+            _LOGGER.debug(
+                "Polled %s, next refresh in %s", ", ".join(due) or "no source", self.update_interval
+            )
             
-        except Exception as err:
-            _LOGGER.error(f"Error processing backup: {err}, data: {backup_data}", exc_info=True)
-            return None
-
-    async def _async_update_data(self) -> dict:
-        """Fetch data from Supervisor API and Google Drive."""
-        try:
-            # Ottieni i backup dal Supervisor (locale)
-            backups_raw = await self._get_backups_from_supervisor()
+            # Trend di crescita ricalcolati fuori dal loop solo se il catalogo cambia
+            # Copie e conservazione ricalcolate fuori dal loop solo se il catalogo cambia
+            if changed or self._analysis is None:
+                await self._async_analyze(data["backups"], now)
+            data.update(self._analysis)
             
-            # Processa ogni backup locale
-            backups = []
-            for backup_raw in backups_raw:
-                backup_info = self._process_backup(backup_raw, source="local")
-                if backup_info:
-                    backups.append(backup_info)
+            if changed or self._forecast is None:
+                with self.metrics.time_stage(STAGE_FORECAST):
+                    self._forecast = await self.hass.async_add_executor_job(
+                        forecast_storage, data["backups"], now
+                    )
+            data["forecast"] = self._build_forecast(data)
             
-            # Ottieni backup da Google Drive se abilitato
-            if self._google_drive_enabled and self._google_drive_client:
-                try:
-                    _LOGGER.debug("Fetching backups from Google Drive...")
-                    drive_backups = await self._google_drive_client.async_get_backups()
-                    
-                    if drive_backups:
-                        _LOGGER.info(f"Found {len(drive_backups)} backups on Google Drive")
-                        # I backup da Google Drive sono già processati
-                        backups.extend(drive_backups)
-                    else:
-                        _LOGGER.debug("No backups found on Google Drive")
-                        
-                except Exception as drive_err:
-                    _LOGGER.error(f"Error fetching Google Drive backups: {drive_err}", exc_info=True)
-                    # Non bloccare l'update per errori Google Drive
+            # Salva il catalogo su disco per il prossimo avvio, solo se cambiato
+            self._catalog.async_update(data["backups"], sources, changed)
             
             if not backups:
                 _LOGGER.info("No backups found from any source")
-                return {
-                    "backups": [],
-                    "total_backups": 0,
-                    "last_backup": None,
-                    "total_size": 0,
-                    "total_size_mb": 0,
-                    "local_count": 0,
-                    "drive_count": 0,
-                }
-            
-            # Ordina per data (più recente prima)
-            backups.sort(key=lambda x: x["datetime"], reverse=True)
-            
-            # Calcola dimensione totale
-            total_size = sum(b["size"] for b in backups)
-            total_size_mb = round(total_size / (1024 * 1024), 2)
-            
-            # Ultimo backup
-            last_backup = backups[0]
-            
-            # Conta backup per sorgente
-            local_count = sum(1 for b in backups if b["destination"] == "local")
-            drive_count = sum(1 for b in backups if b["destination"] == "google_drive")
-            
-            _LOGGER.info(f"✅ Loaded {len(backups)} backups total ({local_count} local, {drive_count} Google Drive), total: {total_size_mb} MB")
+            else:
+                _LOGGER.info(f"✅ Loaded {data['total_backups']} backups total ({data['local_count']} local, {data['drive_count']} Google Drive), total: {data['total_size_mb']} MB")
             
-            return {
-                "backups": backups,
-                "total_backups": len(backups),
-                "last_backup": last_backup,
-                "total_size": total_size,
-                "total_size_mb": total_size_mb,
-                "local_count": local_count,
-                "drive_count": drive_count,
-            }
+            self.metrics.record(STAGE_REFRESH, time.perf_counter() - start)
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Refresh stage timings: %s",
+                    {
+                        name: self.metrics.last(name)
+                        for name in (STAGE_REFRESH, STAGE_AGGREGATION, STAGE_ANALYSIS, STAGE_FORECAST)
+                    },
+                )
+            return data
 
         except Exception as err:
             _LOGGER.error(f"Error updating backup data: {err}", exc_info=True)
-            # Non lanciare UpdateFailed, ritorna dati vuoti
-            return {
-                "backups": [],
-                "total_backups": 0,
-                "last_backup": None,
-                "total_size": 0,
-                "total_size_mb": 0,
-                "local_count": 0,
-                "drive_count": 0,
+            # Non lanciare UpdateFailed: mantieni gli ultimi dati pubblicati
+            if self.data is not None:
+                return self.data
+            # Nessun dato ancora pubblicato: ritorna dati vuoti
+            data = self._build_data([])
+            data.update(self._analyze([], dt_util.now()))
+            return data
+
+    async def _async_fetch_source(
+        self, source: BackupSource
+    ) -> tuple[str, list[BackupRecord] | None]:
+        """Fetch the backups of a single source within its timeout.
+        
+        Args:
+            source: Backup source to fetch
+        
+        Returns:
+            Tuple of (destination, backups), backups is None if the fetch failed
+        """
+        destination = source.destination
+        timeout = SOURCE_TIMEOUTS.get(destination, DEFAULT_SOURCE_TIMEOUT)
+        try:
+            _LOGGER.debug("Fetching backups from %s", destination)
+            return destination, await asyncio.wait_for(self._async_poll_source(source), timeout)
+        except asyncio.TimeoutError:
+            _LOGGER.warning(f"Fetching backups from {destination} timed out after {timeout}s")
+        except Exception as err:
+            _LOGGER.error(f"Error fetching backups from {destination}: {err}", exc_info=True)
+        return destination, None
+
+    async def _async_poll_source(self, source: BackupSource) -> list[BackupRecord]:
+        """Fetch the backups of a source and the capacity of its storage."""
+        backups = await source.async_get_backups()
+        try:
+            with source.metrics.time_stage(STAGE_CAPACITY):
+                capacity = await source.async_get_capacity()
+        except Exception as err:
+            _LOGGER.debug("Could not get the capacity of %s: %s", source.destination, err)
+        else:
+            if capacity is not None:
+                self._capacities[source.destination] = capacity
+        return backups
+
+    def _previous_backups(self, source: str) -> list[BackupRecord]:
+        """Return the backups of a source from the last published data."""
+        if not self.data:
+            return []
+        return [b for b in self.data["backups"] if b.destination == source]
+
+    def _build_forecast(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Combine the size trends with the projected usage and the capacities."""
+        projected = data["retention"]["projected_by_destination"]
+        used = {
+            destination: group["size"]
+            for destination, group in data["stats"]["by_destination"].items()
+        }
+        first_horizon = min(PROJECTION_HORIZONS)
+        by_destination = {}
+        for destination in set(self._forecast["by_destination"]) | set(self._capacities):
+            trend = self._forecast["by_destination"].get(destination, {})
+            capacity = self._capacities.get(destination)
+            usage = projected.get(destination)
+            # Crescita netta: i backup nuovi meno quelli eliminati dalla conservazione
+            growth = (
+                (usage[first_horizon] - used.get(destination, 0)) / first_horizon
+                if usage
+                else 0.0
+            )
+            by_destination[destination] = {
+                **trend,
+                "growth_per_day": growth,
+                "capacity": capacity,
+                "days_until_full": (
+                    days_until_full(capacity["free"], used.get(destination, 0), usage)
+                    if capacity and "free" in capacity and usage
+                    else None
+                ),
             }
+        return {**self._forecast, "by_destination": by_destination}
+
+    async def _async_analyze(self, backups: list[BackupRecord], now: datetime) -> None:
+        """Recompute replicas and retention in the executor."""
+        with self.metrics.time_stage(STAGE_ANALYSIS):
+            self._analysis = await self.hass.async_add_executor_job(
+                self._analyze, backups, now
+            )
+
+    def _analyze(self, backups: list[BackupRecord], now: datetime) -> dict[str, Any]:
+        """Match replicas and evaluate the retention policy (CPU bound, run in executor).
+
+        Returns:
+            Dict with the 'replicas' and 'retention' coordinator data
+        """
+        # Copie dello stesso backup su destinazioni diverse
+        self._replicas.update(backups)
+        
+        # Valutazione della politica di conservazione e spazio previsto
+        policy = RetentionPolicy.from_config(self.config_data)
+        retention = evaluate_retention(backups, policy)
+        projected_by_destination = project_usage_by_destination(backups, policy, now)
+        
+        return {
+            "replicas": self._replicas.summary(backups),
+            "retention": {
+                "policy": policy,
+                "by_destination": retention,
+                "prune_count": sum(len(group["prune"]) for group in retention.values()),
+                "prune_size": sum(group["prune_size"] for group in retention.values()),
+                "projected": {
+                    days: sum(usage[days] for usage in projected_by_destination.values())
+                    for days in PROJECTION_HORIZONS
+                },
+                "projected_by_destination": projected_by_destination,
+            },
+        }
+
+    def _build_data(self, backups: list[BackupRecord]) -> dict[str, Any]:
+        """Build the coordinator data from a list of processed backups."""
+        # Ordina per data (più recente prima)
+        backups.sort(key=lambda x: x.datetime, reverse=True)
+        
+        # Statistiche calcolate in un solo passaggio
+        now = dt_util.now()
+        with self.metrics.time_stage(STAGE_AGGREGATION):
+            stats = aggregate_backups(backups, now)
+        by_destination = stats["by_destination"]
+        
+        # Scadenze di freschezza dai backup più recenti
+        self.freshness.async_update(stats)
+        
+        return {
+            "backups": backups,
+            "total_backups": len(backups),
+            "last_backup": backups[0] if backups else None,
+            "total_size": stats["total_size"],
+            "total_size_mb": round(stats["total_size"] / (1024 * 1024), 2),
+            "local_count": by_destination.get(DESTINATION_LOCAL, {}).get("count", 0),
+            "drive_count": by_destination.get(DESTINATION_GOOGLE_DRIVE, {}).get("count", 0),
+            "stats": stats,
+            "sources": dict(self._catalog.sources),
+            "capacities": dict(self._capacities),
+        }
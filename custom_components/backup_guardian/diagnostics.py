@@ -0,0 +1,51 @@
+"""Diagnostics support for Backup Guardian."""
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    CONF_GOOGLE_CLIENT_ID,
+    CONF_GOOGLE_CLIENT_SECRET,
+    CONF_GOOGLE_FOLDER_ID,
+    CONF_GOOGLE_TOKEN,
+    DOMAIN,
+)
+
+TO_REDACT = {
+    CONF_GOOGLE_CLIENT_ID,
+    CONF_GOOGLE_CLIENT_SECRET,
+    CONF_GOOGLE_FOLDER_ID,
+    CONF_GOOGLE_TOKEN,
+}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    data = coordinator.data or {}
+
+    return {
+        "entry": async_redact_data(dict(entry.data), TO_REDACT),
+        "version": coordinator.version,
+        "last_update_success": coordinator.last_update_success,
+        "update_interval": (
+            coordinator.update_interval.total_seconds()
+            if coordinator.update_interval
+            else None
+        ),
+        "destinations": coordinator.destinations,
+        "total_backups": data.get("total_backups", 0),
+        "backups_by_destination": {
+            destination: group["count"]
+            for destination, group in (data.get("stats") or {}).get("by_destination", {}).items()
+        },
+        "deltas": {
+            destination: {kind: len(slugs) for kind, slugs in delta.items()}
+            for destination, delta in data.get("deltas", {}).items()
+        },
+        "metrics": coordinator.metrics_report(),
+    }
@@ -0,0 +1,487 @@
+"""Google Drive API transports for Backup Guardian.
+
+The Drive client only needs a handful of read-only endpoints. They are
+served either by a small native aiohttp client, sharing Home Assistant's
+pooled HTTP session, or by google-api-python-client running in the
+executor.
+"""
+import json
+import logging
+from datetime import datetime, timezone
+from typing import Any
+from urllib.parse import quote, urlencode
+
+from aiohttp import ClientError
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from .const import (
+    DRIVE_TRANSPORT_DISCOVERY,
+    DRIVE_TRANSPORT_REST,
+    GOOGLE_DRIVE_API_SCOPES,
+    GOOGLE_DRIVE_API_URL,
+    GOOGLE_DRIVE_API_VERSION,
+    GOOGLE_DRIVE_BATCH_URL,
+    OAUTH_TOKEN_URL,
+)
+from .metrics import COUNTER_API_CALLS, COUNTER_API_ERRORS, COUNTER_BYTES, RefreshMetrics
+from .oauth_handler import GoogleTokenManager
+
+_LOGGER = logging.getLogger(__name__)
+
+# Timeout of a single Drive API request (seconds)
+DRIVE_REQUEST_TIMEOUT = 30
+
+# Boundary of the multipart/mixed batch requests
+BATCH_BOUNDARY = "backup_guardian_batch"
+
+# Google serves gzip only to user agents mentioning it
+DRIVE_REQUEST_HEADERS = {
+    "Accept-Encoding": "gzip",
+    "User-Agent": "backup-guardian (gzip)",
+}
+
+
+def _import_google_client() -> tuple[Any, Any]:
+    """Import the Google API client (blocking call for executor).
+
+    The Google libraries are heavy to import, so they are loaded only when
+    the discovery transport is set up, never at integration load.
+
+    Returns:
+        Tuple of (discovery build function, Credentials class)
+    """
+    from googleapiclient.discovery import build
+    from google.oauth2.credentials import Credentials
+
+    return build, Credentials
+
+
+class DriveApiError(Exception):
+    """Error returned by the Google Drive API."""
+
+    def __init__(
+        self, status: int | None, message: str, errors: list[dict[str, Any]] | None = None
+    ) -> None:
+        """Initialize the error.
+
+        Args:
+            status: HTTP status code, None for connection errors
+            message: Error message
+            errors: Error details of the response, with 'reason' and 'location'
+        """
+        super().__init__(message)
+        self.status = status
+        self.errors = errors or []
+
+
+def _error_details(content: bytes | None) -> list[dict[str, Any]]:
+    """Return the 'errors' list of a Drive API error response body."""
+    try:
+        errors = json.loads(content)["error"]["errors"]
+    except (TypeError, ValueError, KeyError):
+        return []
+    if not isinstance(errors, list):
+        return []
+    return [error for error in errors if isinstance(error, dict)]
+
+
+class DriveTransport:
+    """Base class of the Google Drive API transports."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        credentials: dict,
+        token_manager: GoogleTokenManager,
+        metrics: RefreshMetrics,
+    ) -> None:
+        """Initialize the transport.
+
+        Args:
+            hass: Home Assistant instance
+            credentials: Dict with 'client_id', 'client_secret', 'folder_id'
+            token_manager: Manager keeping the access token valid
+            metrics: Metrics counting the API calls and bytes received
+        """
+        self.hass = hass
+        self._credentials = credentials
+        self._token_manager = token_manager
+        self._metrics = metrics
+
+    async def async_setup(self) -> bool:
+        """Prepare the transport.
+
+        Returns:
+            True if the transport is ready
+        """
+        return True
+
+    async def async_get_start_page_token(self) -> str:
+        """Return the current start page token of the Changes API."""
+        raise NotImplementedError
+
+    async def async_get_file(self, file_id: str, fields: str) -> dict[str, Any]:
+        """Return the metadata of a file."""
+        raise NotImplementedError
+
+    async def async_list_files(
+        self, query: str, fields: str, page_size: int, page_token: str | None = None
+    ) -> dict[str, Any]:
+        """Return one page of a files.list query."""
+        raise NotImplementedError
+
+    async def async_get_about_and_file(
+        self, about_fields: str, file_id: str, file_fields: str
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Return about.get and files.get results in a single batch request."""
+        raise NotImplementedError
+
+    async def async_list_changes(
+        self, page_token: str, fields: str, page_size: int
+    ) -> dict[str, Any]:
+        """Return one page of changes since a page token."""
+        raise NotImplementedError
+
+
+class RestDriveTransport(DriveTransport):
+    """Drive API over Home Assistant's shared aiohttp session."""
+
+    async def _async_get(self, path: str, params: dict[str, Any]) -> dict[str, Any]:
+        """Send an authorized GET request to the Drive API.
+
+        Args:
+            path: Endpoint path relative to the API root
+            params: Query parameters, None values are dropped
+
+        Returns:
+            Decoded JSON response
+
+        Raises:
+            DriveApiError: On HTTP or connection errors
+        """
+        access_token = await self._token_manager.async_get_access_token()
+        if not access_token:
+            raise DriveApiError(401, "Google Drive access token unavailable")
+
+        session = async_get_clientsession(self.hass)
+        self._metrics.increment(COUNTER_API_CALLS)
+        try:
+            async with session.get(
+                f"{GOOGLE_DRIVE_API_URL}/{path}",
+                params={key: value for key, value in params.items() if value is not None},
+                headers={**DRIVE_REQUEST_HEADERS, "Authorization": f"Bearer {access_token}"},
+                timeout=DRIVE_REQUEST_TIMEOUT,
+            ) as response:
+                body = await response.read()
+                self._metrics.increment(COUNTER_BYTES, len(body))
+                if response.status != 200:
+                    self._metrics.increment(COUNTER_API_ERRORS)
+                    raise DriveApiError(
+                        response.status,
+                        f"Drive API {path} failed: {response.status} "
+                        f"{body.decode(errors='replace')}",
+                        _error_details(body),
+                    )
+                return json.loads(body)
+        except ClientError as err:
+            self._metrics.increment(COUNTER_API_ERRORS)
+            raise DriveApiError(None, f"Drive API {path} failed: {err}") from err
+
+    async def _async_batch_get(
+        self, requests: list[tuple[str, dict[str, Any]]]
+    ) -> list[dict[str, Any]]:
+        """Send several GET requests in one call to the Drive batch endpoint.
+
+        Args:
+            requests: (path, query parameters) of each request
+
+        Returns:
+            Decoded JSON response of each request, in order
+
+        Raises:
+            DriveApiError: If the batch or any of its requests failed
+        """
+        access_token = await self._token_manager.async_get_access_token()
+        if not access_token:
+            raise DriveApiError(401, "Google Drive access token unavailable")
+
+        parts = []
+        for index, (path, params) in enumerate(requests):
+            url = f"/drive/{GOOGLE_DRIVE_API_VERSION}/{path}?{urlencode(params, quote_via=quote)}"
+            parts.append(
+                f"--{BATCH_BOUNDARY}\r\n"
+                "Content-Type: application/http\r\n"
+                f"Content-ID: <item{index}>\r\n\r\n"
+                f"GET {url}\r\n\r\n"
+            )
+        body = "".join(parts) + f"--{BATCH_BOUNDARY}--\r\n"
+
+        session = async_get_clientsession(self.hass)
+        self._metrics.increment(COUNTER_API_CALLS)
+        try:
+            async with session.post(
+                GOOGLE_DRIVE_BATCH_URL,
+                data=body.encode(),
+                headers={
+                    **DRIVE_REQUEST_HEADERS,
+                    "Authorization": f"Bearer {access_token}",
+                    "Content-Type": f"multipart/mixed; boundary={BATCH_BOUNDARY}",
+                },
+                timeout=DRIVE_REQUEST_TIMEOUT,
+            ) as response:
+                body = await response.read()
+                self._metrics.increment(COUNTER_BYTES, len(body))
+                text = body.decode()
+                if response.status != 200:
+                    self._metrics.increment(COUNTER_API_ERRORS)
+                    raise DriveApiError(
+                        response.status, f"Drive API batch failed: {response.status} {text}"
+                    )
+                content_type = response.headers.get("Content-Type", "")
+                boundary = content_type.partition("boundary=")[2].strip('"')
+        except ClientError as err:
+            self._metrics.increment(COUNTER_API_ERRORS)
+            raise DriveApiError(None, f"Drive API batch failed: {err}") from err
+
+        results = _parse_batch_response(text, boundary)
+        return [results[f"response-item{index}"] for index in range(len(requests))]
+
+    async def async_get_start_page_token(self) -> str:
+        """Return the current start page token of the Changes API."""
+        response = await self._async_get("changes/startPageToken", {})
+        return response["startPageToken"]
+
+    async def async_get_about_and_file(
+        self, about_fields: str, file_id: str, file_fields: str
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Return about.get and files.get results in a single batch request."""
+        about, file_data = await self._async_batch_get(
+            [("about", {"fields": about_fields}), (f"files/{file_id}", {"fields": file_fields})]
+        )
+        return about, file_data
+
+    async def async_get_file(self, file_id: str, fields: str) -> dict[str, Any]:
+        """Return the metadata of a file."""
+        return await self._async_get(f"files/{file_id}", {"fields": fields})
+
+    async def async_list_files(
+        self, query: str, fields: str, page_size: int, page_token: str | None = None
+    ) -> dict[str, Any]:
+        """Return one page of a files.list query."""
+        return await self._async_get(
+            "files",
+            {
+                "q": query,
+                "spaces": "drive",
+                "fields": fields,
+                "pageSize": page_size,
+                "pageToken": page_token,
+            },
+        )
+
+    async def async_list_changes(
+        self, page_token: str, fields: str, page_size: int
+    ) -> dict[str, Any]:
+        """Return one page of changes since a page token."""
+        return await self._async_get(
+            "changes",
+            {
+                "pageToken": page_token,
+                "spaces": "drive",
+                "includeRemoved": "true",
+                "fields": fields,
+                "pageSize": page_size,
+            },
+        )
+
+
+class DiscoveryDriveTransport(DriveTransport):
+    """Drive API through google-api-python-client in the executor."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        credentials: dict,
+        token_manager: GoogleTokenManager,
+        metrics: RefreshMetrics,
+    ) -> None:
+        """Initialize the transport."""
+        super().__init__(hass, credentials, token_manager, metrics)
+        self._creds = None
+        self._service = None
+
+    async def async_setup(self) -> bool:
+        """Import the Google client and build the Drive service in the executor."""
+        try:
+            build, credentials_cls = await self.hass.async_add_executor_job(
+                _import_google_client
+            )
+        except ImportError:
+            _LOGGER.error(
+                "Google API client not installed. "
+                "Add 'google-api-python-client>=2.0.0' to requirements"
+            )
+            return False
+
+        access_token = await self._token_manager.async_get_access_token()
+        if not access_token:
+            _LOGGER.error("Google Drive access token expired and could not be refreshed")
+            return False
+
+        creds = credentials_cls(
+            token=access_token,
+            refresh_token=self._credentials.get("refresh_token"),
+            token_uri=OAUTH_TOKEN_URL,
+            client_id=self._credentials.get("client_id"),
+            client_secret=self._credentials.get("client_secret"),
+            scopes=GOOGLE_DRIVE_API_SCOPES,
+        )
+        self._creds = creds
+        self._apply_token_expiry()
+
+        # IMPORTANTE: usa credentials= come parametro nominale
+        self._service = await self.hass.async_add_executor_job(
+            lambda: build("drive", GOOGLE_DRIVE_API_VERSION, credentials=creds)
+        )
+        return True
+
+    async def _async_execute(self, request: Any) -> dict[str, Any]:
+        """Execute a Drive API request in the executor.
+
+        The token manager refreshes ahead of expiry on the shared HTTP
+        session, so the Google client never has to refresh synchronously.
+        """
+        access_token = await self._token_manager.async_get_access_token()
+        if access_token:
+            self._creds.token = access_token
+            self._apply_token_expiry()
+
+        # Il client Google non espone i byte ricevuti, solo le chiamate
+        self._metrics.increment(COUNTER_API_CALLS)
+        try:
+            return await self.hass.async_add_executor_job(request.execute)
+        except Exception as err:
+            self._metrics.increment(COUNTER_API_ERRORS)
+            status = getattr(getattr(err, "resp", None), "status", None)
+            try:
+                status = int(status)
+            except (TypeError, ValueError):
+                status = None
+            raise DriveApiError(
+                status,
+                f"Drive API request failed: {err}",
+                _error_details(getattr(err, "content", None)),
+            ) from err
+
+    def _apply_token_expiry(self) -> None:
+        """Copy the token expiry to the Google credentials (naive UTC)."""
+        expires_at = self._token_manager.expires_at
+        self._creds.expiry = (
+            datetime.fromtimestamp(expires_at, timezone.utc).replace(tzinfo=None)
+            if expires_at
+            else None
+        )
+
+    async def async_get_start_page_token(self) -> str:
+        """Return the current start page token of the Changes API."""
+        response = await self._async_execute(self._service.changes().getStartPageToken())
+        return response["startPageToken"]
+
+    async def async_get_file(self, file_id: str, fields: str) -> dict[str, Any]:
+        """Return the metadata of a file."""
+        return await self._async_execute(
+            self._service.files().get(fileId=file_id, fields=fields)
+        )
+
+    async def async_list_files(
+        self, query: str, fields: str, page_size: int, page_token: str | None = None
+    ) -> dict[str, Any]:
+        """Return one page of a files.list query."""
+        return await self._async_execute(
+            self._service.files().list(
+                q=query,
+                spaces="drive",
+                fields=fields,
+                pageSize=page_size,
+                pageToken=page_token,
+            )
+        )
+
+    async def async_get_about_and_file(
+        self, about_fields: str, file_id: str, file_fields: str
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Return about.get and files.get results in a single batch request."""
+        results: dict[str, Any] = {}
+
+        def _callback(request_id: str, response: dict, exception: Exception | None) -> None:
+            results[request_id] = exception or response
+
+        batch = self._service.new_batch_http_request(callback=_callback)
+        batch.add(self._service.about().get(fields=about_fields), request_id="about")
+        batch.add(
+            self._service.files().get(fileId=file_id, fields=file_fields), request_id="file"
+        )
+        await self._async_execute(batch)
+
+        for result in results.values():
+            if isinstance(result, Exception):
+                raise DriveApiError(None, f"Drive API batch request failed: {result}")
+        return results["about"], results["file"]
+
+    async def async_list_changes(
+        self, page_token: str, fields: str, page_size: int
+    ) -> dict[str, Any]:
+        """Return one page of changes since a page token."""
+        return await self._async_execute(
+            self._service.changes().list(
+                pageToken=page_token,
+                spaces="drive",
+                includeRemoved=True,
+                fields=fields,
+                pageSize=page_size,
+            )
+        )
+
+
+def _parse_batch_response(text: str, boundary: str) -> dict[str, dict[str, Any]]:
+    """Split a multipart/mixed batch response into its JSON responses.
+
+    Args:
+        text: Response body
+        boundary: Multipart boundary from the response Content-Type
+
+    Returns:
+        Content-ID (without brackets) -> decoded JSON body
+
+    Raises:
+        DriveApiError: If a part reports an HTTP error
+    """
+    results = {}
+    for part in text.split(f"--{boundary}"):
+        part = part.strip()
+        if not part or part == "--":
+            continue
+        # Header della parte, poi la risposta HTTP con i suoi header e il body
+        part_headers, _, http_response = part.partition("\r\n\r\n")
+        status_line, _, rest = http_response.partition("\r\n")
+        _, _, body = rest.partition("\r\n\r\n")
+
+        content_id = ""
+        for line in part_headers.splitlines():
+            name, _, value = line.partition(":")
+            if name.strip().lower() == "content-id":
+                content_id = value.strip().strip("<>")
+
+        status = int(status_line.split(" ")[1]) if " " in status_line else None
+        if status != 200:
+            raise DriveApiError(status, f"Drive API batch request failed: {status_line} {body}")
+        results[content_id] = json.loads(body)
+    return results
+
+
+DRIVE_TRANSPORT_CLASSES: dict[str, type[DriveTransport]] = {
+    DRIVE_TRANSPORT_REST: RestDriveTransport,
+    DRIVE_TRANSPORT_DISCOVERY: DiscoveryDriveTransport,
+}
@@ -0,0 +1,70 @@
+"""Backup filename classification for Backup Guardian.
+
+Shared by every source that discovers backups by file name. Everything is
+compiled once at import, so classifying a file costs a suffix check and a
+single regex search.
+"""
+import re
+from datetime import datetime
+
+from homeassistant.util import dt as dt_util
+
+from .const import BACKUP_FILE_SUFFIXES
+
+COMPRESSED_SUFFIXES = (".gz", ".tgz")
+
+# YYYY-MM-DD with an optional _HH-MM-SS / " HH:MM:SS" time
+_DATE_RE = re.compile(
+    r"(\d{4})-(\d{2})-(\d{2})(?:[_ ](\d{2})[:-](\d{2})[:-](\d{2}))?", re.ASCII
+)
+
+
+def is_backup_file(filename: str) -> bool:
+    """Check if filename matches backup patterns.
+
+    Args:
+        filename: File name to check
+
+    Returns:
+        True if matches backup pattern
+    """
+    return filename.endswith(BACKUP_FILE_SUFFIXES)
+
+
+def is_compressed(filename: str) -> bool:
+    """Check if a backup archive is compressed."""
+    return filename.endswith(COMPRESSED_SUFFIXES)
+
+
+def extract_date_from_filename(filename: str) -> datetime | None:
+    """Try to extract date from backup filename.
+
+    Common patterns:
+    - backup_2026-02-15_17-16-00.tar
+    - Full backup 2026-02-15 17:16:00.tar
+
+    Args:
+        filename: Backup filename
+
+    Returns:
+        Datetime object or None if can't parse
+    """
+    match = _DATE_RE.search(filename)
+    if match is None:
+        return None
+
+    year, month, day, hour, minute, second = match.groups()
+    try:
+        # Assume UTC, convert to local
+        date_obj = datetime(
+            int(year),
+            int(month),
+            int(day),
+            int(hour or 0),
+            int(minute or 0),
+            int(second or 0),
+            tzinfo=dt_util.UTC,
+        )
+    except ValueError:
+        return None
+    return dt_util.as_local(date_obj)
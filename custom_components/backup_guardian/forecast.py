@@ -0,0 +1,116 @@
+"""Storage growth forecasting for Backup Guardian.
+
+Backup sizes are fitted with least squares over the backups of the last
+days, accumulating the regression sums in a single pass; the same fit
+drives the retention projection, so both report the same expected backup
+size. Storage fills up only through the net usage left by the retention
+policy, so the days until a destination is full are read from the
+projected usage rather than from the sizes of new backups alone.
+"""
+from datetime import datetime, timedelta
+from typing import Any, Iterable
+
+from .record import BackupRecord
+
+# History used to fit the trends
+FORECAST_WINDOW = timedelta(days=30)
+
+
+def fit_line(points: Iterable[tuple[float, float]]) -> tuple[float, float] | None:
+    """Fit y = intercept + slope * x with least squares.
+
+    Returns:
+        Tuple of (intercept, slope), None with less than two distinct x
+    """
+    count = sum_x = sum_y = sum_xx = sum_xy = 0.0
+    for x, y in points:
+        count += 1
+        sum_x += x
+        sum_y += y
+        sum_xx += x * x
+        sum_xy += x * y
+    denominator = count * sum_xx - sum_x * sum_x
+    if count < 2 or not denominator:
+        return None
+    slope = (count * sum_xy - sum_x * sum_y) / denominator
+    return (sum_y - slope * sum_x) / count, slope
+
+
+def size_trend(backups: Iterable[BackupRecord], now: datetime) -> tuple[float, float]:
+    """Fit the size of the backups made within the forecast window.
+
+    Args:
+        backups: Backups of any order
+        now: Current local time
+
+    Returns:
+        Tuple of (expected bytes of a backup made now, growth in bytes per
+        day); with too few backups the newest size and no growth
+    """
+    since = now - FORECAST_WINDOW
+    newest: BackupRecord | None = None
+    points = []
+    for backup in backups:
+        if newest is None or backup.datetime > newest.datetime:
+            newest = backup
+        if backup.datetime >= since:
+            points.append(((backup.datetime - now).total_seconds() / 86400, backup.size))
+
+    fit = fit_line(points)
+    if fit is None:
+        return float(newest.size if newest else 0), 0.0
+    # Intercept = dimensione prevista per un backup eseguito ora
+    return max(fit[0], 0.0), fit[1]
+
+
+def forecast_storage(backups: list[BackupRecord], now: datetime) -> dict[str, Any]:
+    """Fit the backup size trends (CPU bound, run in executor).
+
+    Args:
+        backups: Backups from all destinations
+        now: Current local time
+
+    Returns:
+        Dict with the overall 'backup_size' (bytes expected for the next
+        backup) and 'backup_size_trend' (bytes per day), and the same for
+        each destination under 'by_destination'
+    """
+    groups: dict[str, list[BackupRecord]] = {}
+    for backup in backups:
+        groups.setdefault(backup.destination, []).append(backup)
+
+    def _trend(group: list[BackupRecord]) -> dict[str, float]:
+        backup_size, trend = size_trend(group, now)
+        return {"backup_size": backup_size, "backup_size_trend": trend}
+
+    return {
+        **_trend(backups),
+        "by_destination": {
+            destination: _trend(group) for destination, group in groups.items()
+        },
+    }
+
+
+def days_until_full(free: int, used: int, projected: dict[int, int]) -> float | None:
+    """Return the days until the free space is used up by the net usage growth.
+
+    Args:
+        free: Free bytes on the storage
+        used: Bytes used by the backups now
+        projected: days ahead -> bytes the backups will use
+
+    Returns:
+        Days until full, interpolated between the projection horizons, or
+        None if the storage does not fill up within the last horizon
+    """
+    if free <= 0:
+        return 0.0
+    previous_days, previous_growth = 0, 0
+    for days, size in sorted(projected.items()):
+        growth = size - used
+        if growth >= free:
+            # Interpolazione lineare tra i due orizzonti
+            fraction = (free - previous_growth) / (growth - previous_growth)
+            return round(previous_days + fraction * (days - previous_days), 1)
+        previous_days, previous_growth = days, growth
+    return None
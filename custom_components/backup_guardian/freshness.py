@@ -0,0 +1,157 @@
+"""Backup freshness SLA monitor for Backup Guardian.
+
+Each target (a destination or a backup type) has a maximum backup age.
+The newest backup of every target comes from the catalog statistics, so a
+refresh only recomputes one deadline per target; a single timer fires at
+the earliest future deadline to publish the breach.
+"""
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Callable
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    CONF_FRESHNESS_SLA,
+    DEFAULT_FRESHNESS_SLA,
+    DESTINATION_NAMES,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Target kinds
+TARGET_DESTINATION = "destination"
+TARGET_TYPE = "type"
+
+
+def freshness_targets(
+    config_data: dict[str, Any], destinations: list[str]
+) -> dict[str, timedelta]:
+    """Return the enabled SLA targets and their maximum backup age.
+
+    Args:
+        config_data: Config entry data
+        destinations: Enabled destinations
+
+    Returns:
+        Target key ('destination:local', 'type:full', ...) -> maximum age
+    """
+    hours = {**DEFAULT_FRESHNESS_SLA, **config_data.get(CONF_FRESHNESS_SLA, {})}
+    targets = {}
+    for key, max_age in hours.items():
+        kind, _, code = key.partition(":")
+        if not max_age or (kind == TARGET_DESTINATION and code not in destinations):
+            continue
+        targets[key] = timedelta(hours=max_age)
+    return targets
+
+
+def target_name(key: str) -> str:
+    """Return the friendly name of a target."""
+    kind, _, code = key.partition(":")
+    if kind == TARGET_DESTINATION:
+        return DESTINATION_NAMES.get(code, code.title())
+    return f"Backup {code.title()}"
+
+
+class FreshnessMonitor:
+    """Track the deadline of each SLA target and time the next breach."""
+
+    def __init__(self, hass: HomeAssistant, on_breach: Callable[[], None]) -> None:
+        """Initialize the monitor.
+
+        Args:
+            hass: Home Assistant instance
+            on_breach: Called in the event loop when a deadline passes
+        """
+        self.hass = hass
+        self._on_breach = on_breach
+        self._targets: dict[str, timedelta] = {}
+        # target -> time of its newest backup
+        self._newest: dict[str, datetime] = {}
+        # target -> moment its newest backup becomes too old, None if no backup
+        self._deadlines: dict[str, datetime | None] = {}
+        self._unsub_timer: CALLBACK_TYPE | None = None
+
+    @property
+    def targets(self) -> list[str]:
+        """Return the enabled target keys."""
+        return list(self._targets)
+
+    def configure(self, targets: dict[str, timedelta]) -> None:
+        """Set the targets and their maximum backup age."""
+        self._targets = targets
+
+    @callback
+    def async_update(self, stats: dict[str, Any]) -> None:
+        """Recompute the deadlines from the catalog statistics.
+
+        Args:
+            stats: Output of aggregate_backups
+        """
+        newest_by_destination = {
+            destination: group["newest"] for destination, group in stats["by_destination"].items()
+        }
+        for key, max_age in self._targets.items():
+            kind, _, code = key.partition(":")
+            source = newest_by_destination if kind == TARGET_DESTINATION else stats["newest_by_type"]
+            newest = source.get(code)
+            if newest is None:
+                self._newest.pop(key, None)
+                self._deadlines[key] = None
+                continue
+            if self._newest.get(key) == newest.datetime:
+                continue
+            self._newest[key] = newest.datetime
+            self._deadlines[key] = newest.datetime + max_age
+
+        self._async_schedule_next(dt_util.utcnow())
+
+    @callback
+    def _async_schedule_next(self, now: datetime) -> None:
+        """Set the timer to the earliest deadline still in the future."""
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+
+        upcoming = [
+            deadline
+            for deadline in self._deadlines.values()
+            if deadline is not None and deadline > now
+        ]
+        if not upcoming:
+            return
+        next_deadline = min(upcoming)
+        self._unsub_timer = async_track_point_in_utc_time(
+            self.hass, self._async_deadline_reached, next_deadline
+        )
+        _LOGGER.debug("Next freshness deadline at %s", next_deadline)
+
+    @callback
+    def _async_deadline_reached(self, now: datetime) -> None:
+        """Publish the breach and time the following deadline."""
+        self._unsub_timer = None
+        self._on_breach()
+        self._async_schedule_next(now)
+
+    @callback
+    def async_stop(self) -> None:
+        """Cancel the pending timer."""
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+
+    def deadline(self, key: str) -> datetime | None:
+        """Return when the target breaches its SLA, None if it has no backup."""
+        return self._deadlines.get(key)
+
+    def newest(self, key: str) -> datetime | None:
+        """Return the time of the newest backup of a target."""
+        return self._newest.get(key)
+
+    def is_breached(self, key: str) -> bool:
+        """Check if the newest backup of a target is older than allowed."""
+        deadline = self._deadlines.get(key)
+        return deadline is None or deadline <= dt_util.utcnow()
@@ -2,46 +2,155 @@
 
 This module handles communication with Google Drive API to fetch backup files.
 """
+import asyncio
 import logging
-import re
-from datetime import datetime
-from typing import Any
+from typing import Any, AsyncIterator
 
-from homeassistant.core import HomeAssistant
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
 from homeassistant.util import dt as dt_util
 
 from .const import (
-    BACKUP_FILE_PATTERNS,
+    BACKUP_FILE_SUFFIXES,
+    CONF_GOOGLE_CLIENT_ID,
+    CONF_GOOGLE_CLIENT_SECRET,
+    CONF_GOOGLE_DRIVE_ENABLED,
+    CONF_GOOGLE_DRIVE_TRANSPORT,
+    CONF_GOOGLE_FOLDER_ID,
+    CONF_GOOGLE_TOKEN,
+    DEFAULT_DRIVE_TRANSPORT,
     DESTINATION_GOOGLE_DRIVE,
-    GOOGLE_DRIVE_API_SCOPES,
-    GOOGLE_DRIVE_API_VERSION,
+    DRIVE_INDEX_STORAGE_KEY,
+    STORAGE_VERSION,
+)
+from .drive_api import DRIVE_TRANSPORT_CLASSES, DriveApiError, DriveTransport
+from .filename import extract_date_from_filename, is_backup_file, is_compressed
+from .oauth_handler import GoogleTokenManager
+from .record import BackupRecord
+from .source import (
+    CAPABILITY_CHECKSUMS,
+    CAPABILITY_DELTA_SYNC,
+    CAPABILITY_PAGINATION,
+    BackupSource,
+    normalize_backup,
+    parse_utc_timestamp,
+    register_source,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
-# Import Google libraries at module level to avoid blocking calls in event loop
-try:
-    from googleapiclient.discovery import build
-    from google.oauth2.credentials import Credentials
-    GOOGLE_AVAILABLE = True
-except ImportError:
-    _LOGGER.error("Google API client not installed")
-    GOOGLE_AVAILABLE = False
+# Maximum page size allowed by files.list
+DRIVE_PAGE_SIZE = 1000
+
+# Only the fields used by process
+DRIVE_FILE_KEYS = ("id", "name", "size", "modifiedTime", "md5Checksum")
+DRIVE_LIST_FIELDS = f"nextPageToken, files({', '.join(DRIVE_FILE_KEYS)})"
+DRIVE_ABOUT_FIELDS = "storageQuota(limit, usage, usageInDrive, usageInDriveTrash)"
+DRIVE_CHANGES_FIELDS = (
+    "nextPageToken, newStartPageToken, changes(fileId, removed, "
+    f"file({', '.join(DRIVE_FILE_KEYS)}, parents, trashed))"
+)
+
+# Delay before writing the file index to storage (seconds)
+DRIVE_INDEX_SAVE_DELAY = 10
 
+# HTTP status codes returned by changes.list for an expired or unknown token
+INVALID_TOKEN_STATUSES = (404, 410)
 
-class GoogleDriveClient:
+@register_source
+class GoogleDriveClient(BackupSource):
     """Google Drive API client for backup scanning."""
 
-    def __init__(self, hass: HomeAssistant, credentials: dict) -> None:
+    destination = DESTINATION_GOOGLE_DRIVE
+    capabilities = frozenset(
+        {CAPABILITY_DELTA_SYNC, CAPABILITY_CHECKSUMS, CAPABILITY_PAGINATION}
+    )
+    key_field = "id"
+    fingerprint_fields = DRIVE_FILE_KEYS
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        credentials: dict,
+        delta_sync: bool = True,
+        token_manager: GoogleTokenManager | None = None,
+        transport: str = DEFAULT_DRIVE_TRANSPORT,
+    ) -> None:
         """Initialize Google Drive client.
         
         Args:
             hass: Home Assistant instance
             credentials: Dict with 'client_id', 'client_secret', 'token', 'folder_id'
+            delta_sync: Use the Drive Changes API instead of listing the folder
+            token_manager: Manager keeping the access token valid
+            transport: Drive API transport, native REST or discovery client
         """
-        self.hass = hass
+        super().__init__(hass)
         self._credentials = credentials
-        self._service = None
+        self._token_manager = token_manager or GoogleTokenManager(
+            hass,
+            credentials.get("client_id"),
+            credentials.get("client_secret"),
+            {
+                "access_token": credentials.get("token"),
+                "refresh_token": credentials.get("refresh_token"),
+            },
+        )
+        # Files returned by the last fetch, used for the folder totals
+        self._files: list[dict[str, Any]] = []
+        self._transport_name = transport
+        self._transport: DriveTransport | None = None
+        self._delta_sync = delta_sync
+        self._store = Store(hass, STORAGE_VERSION, DRIVE_INDEX_STORAGE_KEY)
+        # file ID -> raw file data, loaded lazily from storage
+        self._index: dict[str, dict] | None = None
+        self._start_page_token: str | None = None
+        self._parent_id: str | None = None
+
+    @classmethod
+    def from_config(
+        cls, hass: HomeAssistant, entry: ConfigEntry
+    ) -> "GoogleDriveClient | None":
+        """Create the client if Google Drive is enabled in the config entry."""
+        config_data = entry.data
+        if not config_data.get(CONF_GOOGLE_DRIVE_ENABLED, False):
+            _LOGGER.info("Google Drive integration disabled")
+            return None
+
+        token = config_data.get(CONF_GOOGLE_TOKEN, {})
+        credentials = {
+            "client_id": config_data.get(CONF_GOOGLE_CLIENT_ID),
+            "client_secret": config_data.get(CONF_GOOGLE_CLIENT_SECRET),
+            "folder_id": config_data.get(CONF_GOOGLE_FOLDER_ID, "root"),
+            "token": token.get("access_token"),
+            "refresh_token": token.get("refresh_token"),
+        }
+
+        @callback
+        def _async_persist_token(new_token: dict[str, Any]) -> None:
+            """Save a refreshed token back to the config entry."""
+            hass.config_entries.async_update_entry(
+                entry,
+                data={
+                    **entry.data,
+                    CONF_GOOGLE_TOKEN: {**entry.data.get(CONF_GOOGLE_TOKEN, {}), **new_token},
+                },
+            )
+
+        token_manager = GoogleTokenManager(
+            hass,
+            credentials["client_id"],
+            credentials["client_secret"],
+            token,
+            on_update=_async_persist_token,
+        )
+        return cls(
+            hass,
+            credentials,
+            token_manager=token_manager,
+            transport=config_data.get(CONF_GOOGLE_DRIVE_TRANSPORT, DEFAULT_DRIVE_TRANSPORT),
+        )
 
     async def async_setup(self) -> bool:
         """Setup Google Drive API service.
@@ -49,247 +158,350 @@ class GoogleDriveClient:
         Returns:
             True if setup successful, False otherwise
         """
-        try:
-            if not GOOGLE_AVAILABLE:
-                _LOGGER.error(
-                    "Google API client not installed. "
-                    "Add 'google-api-python-client>=2.0.0' to requirements"
-                )
-                return False
+        if not all(
+            self._credentials.get(key) for key in ("client_id", "client_secret", "token")
+        ):
+            _LOGGER.error("Missing Google Drive credentials")
+            return False
 
-            # Create credentials object from token
-            from google.auth.transport.requests import Request
-            from google.oauth2.credentials import Credentials
-            
-            creds = Credentials(
-                token=self._credentials.get("token"),
-                refresh_token=self._credentials.get("refresh_token"),
-                token_uri="https://oauth2.googleapis.com/token",
-                client_id=self._credentials.get("client_id"),
-                client_secret=self._credentials.get("client_secret"),
-                scopes=GOOGLE_DRIVE_API_SCOPES,
-            )
+        transport_cls = DRIVE_TRANSPORT_CLASSES.get(self._transport_name)
+        if transport_cls is None:
+            _LOGGER.error(f"Unknown Google Drive transport: {self._transport_name}")
+            return False
 
-            # Build service in executor to avoid blocking
-            # IMPORTANTE: usa credentials= come parametro nominale
-            self._service = await self.hass.async_add_executor_job(
-                lambda: build("drive", GOOGLE_DRIVE_API_VERSION, credentials=creds)
+        try:
+            transport = transport_cls(
+                self.hass, self._credentials, self._token_manager, self.metrics
             )
-            
-            _LOGGER.info("Google Drive API service initialized successfully")
-            return True
-
+            if not await transport.async_setup():
+                return False
         except Exception as err:
             _LOGGER.error(f"Failed to setup Google Drive service: {err}", exc_info=True)
             return False
 
-    async def async_get_backups(self) -> list[dict[str, Any]]:
+        self._transport = transport
+        _LOGGER.info(
+            "Google Drive API service initialized successfully (%s transport)",
+            self._transport_name,
+        )
+        return True
+
+    async def async_fetch_raw(self) -> list[dict[str, Any]]:
         """Fetch backup files from Google Drive.
         
         Returns:
-            List of backup file dictionaries with metadata
+            List of raw Drive file dicts
+        """
+        files = []
+        async for page in self.async_iter_raw():
+            files.extend(page)
+        return files
+
+    async def async_iter_raw(self) -> AsyncIterator[list[dict[str, Any]]]:
+        """Stream backup files from Google Drive.
+        
+        With delta sync enabled only the changes since the last call are
+        requested; the whole folder is listed on first run or when the
+        stored start page token is no longer valid. Folder listings are
+        yielded page by page, so each page is processed while the next
+        one is downloaded.
+        
+        Yields:
+            Lists of raw Drive file dicts
         """
-        if not self._service:
+        if not self._transport:
             _LOGGER.error("Google Drive service not initialized")
-            return []
+            yield []
+            return
 
-        try:
-            folder_id = self._credentials.get("folder_id", "root")
-            
-            # Query for backup files in specified folder
-            # Build query to match backup patterns
-            query_parts = []
-            for pattern in BACKUP_FILE_PATTERNS:
-                # Convert regex to simple name contains (Drive doesn't support full regex)
-                if ".tar.gz" in pattern:
-                    query_parts.append("name contains '.tar.gz'")
-                elif ".tar" in pattern:
-                    query_parts.append("name contains '.tar'")
-                elif ".tgz" in pattern:
-                    query_parts.append("name contains '.tgz'")
-            
-            query = f"'{folder_id}' in parents and ({' or '.join(query_parts)}) and trashed=false"
-            
-            _LOGGER.debug(f"Google Drive query: {query}")
+        if self._delta_sync:
+            pages = self._async_iter_index()
+        else:
+            pages = self.async_iter_pages(self._build_query())
+
+        files = []
+        async for page in pages:
+            files.extend(page)
+            yield page
+
+        self._files = files
+        _LOGGER.debug("Found %d files on Google Drive", len(files))
+
+    async def async_get_capacity(self) -> dict[str, Any] | None:
+        """Return the Drive storage quota and the usage of the backup folder.
+        
+        Quota and folder metadata come from a single batch request; folder
+        totals are computed from the files already listed.
+        """
+        if not self._transport:
+            return None
+
+        folder_id = self._credentials.get("folder_id", "root")
+        about, folder = await self._transport.async_get_about_and_file(
+            DRIVE_ABOUT_FIELDS, folder_id, "id, name"
+        )
+        quota = about.get("storageQuota", {})
+        usage = int(quota.get("usage", 0))
+        # Gli account senza limite non riportano 'limit'
+        limit = int(quota["limit"]) if quota.get("limit") else None
+
+        capacity = {
+            "used": usage,
+            "used_in_drive": int(quota.get("usageInDrive", 0)),
+            "used_in_trash": int(quota.get("usageInDriveTrash", 0)),
+            "folder_name": folder.get("name"),
+            "folder_files": len(self._files),
+            "folder_size": sum(int(item.get("size", 0)) for item in self._files),
+        }
+        if limit is not None:
+            capacity["total"] = limit
+            capacity["free"] = max(limit - usage, 0)
+        return capacity
+
+    def _build_query(self) -> str:
+        """Build the files.list query for backup files in the folder."""
+        folder_id = self._credentials.get("folder_id", "root")
+        
+        # Query for backup files in specified folder
+        # Drive non supporta "ends with": process scarta i nomi che contengono solo il suffisso
+        query_parts = [f"name contains '{suffix}'" for suffix in BACKUP_FILE_SUFFIXES]
+        
+        query = f"'{folder_id}' in parents and ({' or '.join(query_parts)}) and trashed=false"
+        
+        _LOGGER.debug(f"Google Drive query: {query}")
+        return query
+
+    async def _async_iter_index(self) -> AsyncIterator[list[dict]]:
+        """Bring the local file index up to date using the Changes API.
+        
+        Yields:
+            The whole index after applying the changes, or the folder
+            listing page by page when a full rescan is needed
+        """
+        folder_id = self._credentials.get("folder_id", "root")
+
+        if self._index is None:
+            stored = await self._store.async_load() or {}
+            if stored.get("folder_id") == folder_id and stored.get("start_page_token"):
+                self._index = stored.get("files", {})
+                self._start_page_token = stored["start_page_token"]
+                self._parent_id = stored.get("parent_id")
+            else:
+                self._index = {}
+
+        if self._start_page_token:
+            try:
+                changes, new_token = await self._async_fetch_changes(
+                    self._start_page_token
+                )
+            except Exception as err:
+                if not _is_invalid_token_error(err):
+                    raise
+                _LOGGER.warning("Google Drive start page token invalidated, rescanning folder")
+                self._start_page_token = None
+            else:
+                self._apply_changes(changes)
+                if changes or new_token != self._start_page_token:
+                    self._start_page_token = new_token
+                    self._async_save_index(folder_id)
+                yield list(self._index.values())
+                return
+
+        async for page in self._async_full_rescan():
+            yield page
+        self._async_save_index(folder_id)
+
+    async def _async_full_rescan(self) -> AsyncIterator[list[dict]]:
+        """List the whole folder and record the start page token for changes.
+        
+        The index is replaced only once the listing is complete.
+        
+        Yields:
+            List of raw file dicts for each page
+        """
+        # Token first, so no change happening during the listing gets lost
+        token, parent_id = await self._async_fetch_start_page_token()
+
+        index = {}
+        async for page in self.async_iter_pages(self._build_query()):
+            for item in page:
+                index[item["id"]] = item
+            yield page
+
+        self._index = index
+        self._start_page_token = token
+        self._parent_id = parent_id
+        _LOGGER.debug("Google Drive full rescan indexed %d file(s)", len(index))
+
+    def _apply_changes(self, changes: list[dict]) -> None:
+        """Apply adds, removals, trashes and renames to the file index.
+        
+        Args:
+            changes: Change resources returned by changes.list
+        """
+        for change in changes:
+            file_id = change.get("fileId")
+            file_data = change.get("file") or {}
+
+            if (
+                change.get("removed")
+                or file_data.get("trashed")
+                or self._parent_id not in file_data.get("parents", [])
+                or not is_backup_file(file_data.get("name", ""))
+            ):
+                self._index.pop(file_id, None)
+                continue
+
+            self._index[file_id] = {
+                key: file_data[key] for key in DRIVE_FILE_KEYS if key in file_data
+            }
+
+        if changes:
+            _LOGGER.debug("Applied %d Google Drive change(s)", len(changes))
+
+    @callback
+    def _async_save_index(self, folder_id: str) -> None:
+        """Persist the file index and start page token."""
+        self._store.async_delay_save(
+            lambda: {
+                "folder_id": folder_id,
+                "parent_id": self._parent_id,
+                "start_page_token": self._start_page_token,
+                "files": self._index,
+            },
+            DRIVE_INDEX_SAVE_DELAY,
+        )
+
+    async def _async_fetch_start_page_token(self) -> tuple[str, str]:
+        """Fetch the current start page token and folder ID.
+        
+        Returns:
+            Tuple of (start page token, resolved folder ID)
+        """
+        folder_id = self._credentials.get("folder_id", "root")
+        token = await self._transport.async_get_start_page_token()
+        # Change resources report the real ID of the parent, never the 'root' alias
+        parent_id = (await self._transport.async_get_file(folder_id, "id"))["id"]
+        return token, parent_id
+
+    async def _async_fetch_changes(self, page_token: str) -> tuple[list[dict], str]:
+        """Fetch all changes since a page token.
+        
+        Args:
+            page_token: Start page token saved by the previous sync
             
-            # Execute query
-            results = await self.hass.async_add_executor_job(
-                self._fetch_files, query
+        Returns:
+            Tuple of (change list, new start page token)
+        """
+        changes = []
+        while True:
+            response = await self._transport.async_list_changes(
+                page_token, DRIVE_CHANGES_FIELDS, DRIVE_PAGE_SIZE
             )
+            changes.extend(response.get("changes", []))
+            if "newStartPageToken" in response:
+                return changes, response["newStartPageToken"]
+            page_token = response["nextPageToken"]
+
+    async def async_iter_pages(self, query: str) -> AsyncIterator[list[dict]]:
+        """Stream all result pages of a Drive query.
+        
+        Follows nextPageToken until the listing is exhausted. The request
+        for the next page is already running while the caller processes
+        the current one.
+        
+        Args:
+            query: Drive API query string
             
-            if not results:
-                _LOGGER.info("No backup files found in Google Drive")
-                return []
+        Yields:
+            List of raw file dicts for each page
+        """
+        pending = asyncio.ensure_future(self._async_fetch_files(query))
+        pages = 0
+        
+        while pending is not None:
+            response = await pending
+            pages += 1
             
-            # Process results
-            backups = []
-            for item in results.get("files", []):
-                backup_info = self._process_drive_file(item)
-                if backup_info:
-                    backups.append(backup_info)
+            page_token = response.get("nextPageToken")
+            pending = (
+                asyncio.ensure_future(self._async_fetch_files(query, page_token))
+                if page_token
+                else None
+            )
             
-            _LOGGER.info(f"Found {len(backups)} backup files on Google Drive")
-            return backups
-
-        except Exception as err:
-            _LOGGER.error(f"Error fetching backups from Google Drive: {err}", exc_info=True)
-            return []
+            try:
+                yield response.get("files", [])
+            except GeneratorExit:
+                if pending is not None:
+                    pending.cancel()
+                raise
+        
+        _LOGGER.debug("Google Drive listing completed in %d page(s)", pages)
 
-    def _fetch_files(self, query: str) -> dict:
-        """Fetch files from Drive (blocking call for executor).
+    async def _async_fetch_files(self, query: str, page_token: str | None = None) -> dict:
+        """Fetch one page of files from Drive.
         
         Args:
             query: Drive API query string
+            page_token: Token of the page to fetch, None for the first page
             
         Returns:
             API response dict
         """
-        return (
-            self._service.files()
-            .list(
-                q=query,
-                spaces="drive",
-                fields="files(id, name, size, createdTime, modifiedTime, md5Checksum)",
-                pageSize=100,
-            )
-            .execute()
+        return await self._transport.async_list_files(
+            query, DRIVE_LIST_FIELDS, DRIVE_PAGE_SIZE, page_token
         )
 
-    def _process_drive_file(self, file_data: dict) -> dict[str, Any] | None:
+    def process(self, file_data: dict) -> BackupRecord | None:
         """Process a Google Drive file into backup format.
         
         Args:
             file_data: Raw file data from Google Drive API
             
         Returns:
-            Processed backup dict or None if invalid
+            Backup record or None if invalid
         """
         try:
             # Validate file matches backup pattern
             filename = file_data.get("name", "")
-            if not self._is_backup_file(filename):
+            if not is_backup_file(filename):
                 return None
 
             # Extract date from filename or use modified time
-            date_obj = self._extract_date_from_filename(filename)
+            date_obj = extract_date_from_filename(filename)
             if not date_obj:
                 # Fallback to file's modified time
-                modified_time = file_data.get("modifiedTime")
-                if modified_time:
-                    date_obj = datetime.fromisoformat(modified_time.replace("Z", "+00:00"))
-                    date_obj = dt_util.as_local(date_obj)
-                else:
-                    date_obj = dt_util.now()
+                date_obj = parse_utc_timestamp(file_data.get("modifiedTime", "")) or dt_util.now()
 
             # Calculate size
             size_bytes = int(file_data.get("size", 0))
-            size_mb = round(size_bytes / (1024 * 1024), 2)
 
             # Use MD5 as hash (Google Drive provides it)
             file_hash = file_data.get("md5Checksum", file_data.get("id", ""))
 
-            return {
-                "name": filename,
-                "slug": file_data.get("id"),  # Use Drive file ID as slug
-                "size": size_bytes,
-                "size_mb": size_mb,
-                "date": date_obj.strftime("%Y-%m-%d"),
-                "time": date_obj.strftime("%H:%M:%S"),
-                "datetime": date_obj,
-                "hash": file_hash,
-                "type": "full",  # Assume full backup
-                "protected": False,
-                "compressed": filename.endswith((".gz", ".tgz")),
-                "destination": DESTINATION_GOOGLE_DRIVE,
-                "destination_name": "Google Drive",
-                "drive_file_id": file_data.get("id"),
-            }
+            return normalize_backup(
+                name=filename,
+                slug=file_data.get("id"),  # Use Drive file ID as slug
+                size_bytes=size_bytes,
+                date_obj=date_obj,
+                backup_hash=file_hash,
+                destination=self.destination,
+                compressed=is_compressed(filename),
+            )
 
         except Exception as err:
             _LOGGER.error(f"Error processing Drive file: {err}", exc_info=True)
             return None
 
-    def _is_backup_file(self, filename: str) -> bool:
-        """Check if filename matches backup patterns.
-        
-        Args:
-            filename: File name to check
-            
-        Returns:
-            True if matches backup pattern
-        """
-        for pattern in BACKUP_FILE_PATTERNS:
-            if re.match(pattern, filename):
-                return True
-        return False
-
-    def _extract_date_from_filename(self, filename: str) -> datetime | None:
-        """Try to extract date from backup filename.
-        
-        Common patterns:
-        - backup_2026-02-15_17-16-00.tar
-        - Full backup 2026-02-15 17:16:00.tar
-        
-        Args:
-            filename: Backup filename
-            
-        Returns:
-            Datetime object or None if can't parse
-        """
-        try:
-            # Pattern 1: YYYY-MM-DD HH:MM:SS
-            import re
-            pattern = r"(\d{4}-\d{2}-\d{2})[_ ](\d{2})[:-](\d{2})[:-](\d{2})"
-            match = re.search(pattern, filename)
-            if match:
-                date_str = f"{match.group(1)} {match.group(2)}:{match.group(3)}:{match.group(4)}"
-                date_obj = datetime.strptime(date_str, "%Y-%m-%d %H:%M:%S")
-                # Assume UTC, convert to local
-                date_obj = date_obj.replace(tzinfo=dt_util.UTC)
-                return dt_util.as_local(date_obj)
-            
-            # Pattern 2: YYYY-MM-DD only
-            pattern = r"(\d{4}-\d{2}-\d{2})"
-            match = re.search(pattern, filename)
-            if match:
-                date_obj = datetime.strptime(match.group(1), "%Y-%m-%d")
-                date_obj = date_obj.replace(tzinfo=dt_util.UTC)
-                return dt_util.as_local(date_obj)
-
-        except Exception as err:
-            _LOGGER.debug(f"Could not extract date from filename {filename}: {err}")
-        
-        return None
 
-    async def async_refresh_token(self) -> dict | None:
-        """Refresh OAuth token if expired.
-        
-        Returns:
-            New token dict or None if refresh failed
-        """
-        try:
-            from google.oauth2.credentials import Credentials
-            from google.auth.transport.requests import Request
-
-            creds = Credentials(
-                token=self._credentials.get("token"),
-                refresh_token=self._credentials.get("refresh_token"),
-                token_uri="https://oauth2.googleapis.com/token",
-                client_id=self._credentials.get("client_id"),
-                client_secret=self._credentials.get("client_secret"),
-                scopes=GOOGLE_DRIVE_API_SCOPES,
-            )
-
-            if creds.expired and creds.refresh_token:
-                await self.hass.async_add_executor_job(creds.refresh, Request())
-                
-                return {
-                    "token": creds.token,
-                    "refresh_token": creds.refresh_token,
-                    "expiry": creds.expiry.isoformat() if creds.expiry else None,
-                }
-
-        except Exception as err:
-            _LOGGER.error(f"Failed to refresh token: {err}", exc_info=True)
-        
-        return None
\ No newline at end of file
+def _is_invalid_token_error(err: Exception) -> bool:
+    """Check if a Drive API error means the start page token is invalid."""
+    if not isinstance(err, DriveApiError):
+        return False
+    if err.status in INVALID_TOKEN_STATUSES:
+        return True
+    # 400 anche per altri parametri errati (es. fields): solo se riguarda il pageToken
+    return err.status == 400 and any(
+        error.get("location") == "pageToken" for error in err.errors
+    )
@@ -0,0 +1,178 @@
+"""Local directory / NAS mount backup source for Backup Guardian.
+
+Backup archives are found by scanning the configured directories with
+os.scandir. Directories whose mtime did not change since the last scan
+are not listed again.
+"""
+import hashlib
+import logging
+import os
+import time
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .const import CONF_NAS_PATHS, DESTINATION_NAS
+from .filename import extract_date_from_filename, is_backup_file, is_compressed
+from .record import BackupRecord
+from .source import (
+    BackupSource,
+    disk_capacity,
+    normalize_backup,
+    register_source,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# A directory modified less than this many seconds before its scan may still
+# contain archives being written, so it is listed again on the next poll
+DIRECTORY_SETTLE_TIME = 120
+
+
+@register_source
+class LocalDirectorySource(BackupSource):
+    """Backup archives stored in local directories or NAS mounts."""
+
+    destination = DESTINATION_NAS
+    key_field = "path"
+    fingerprint_fields = ("path", "size", "mtime")
+
+    def __init__(self, hass: HomeAssistant, paths: list[str]) -> None:
+        """Initialize the source.
+
+        Args:
+            hass: Home Assistant instance
+            paths: Directories to scan for backup archives
+        """
+        super().__init__(hass)
+        self._paths = paths
+        # directory -> (mtime_ns, scan time, archives, subdirectories)
+        self._dir_cache: dict[str, tuple[int, float, list[dict], list[str]]] = {}
+
+    @classmethod
+    def from_config(
+        cls, hass: HomeAssistant, entry: ConfigEntry
+    ) -> "LocalDirectorySource | None":
+        """Create the source if at least one directory is configured."""
+        paths = [path for path in entry.data.get(CONF_NAS_PATHS, []) if path]
+        if not paths:
+            return None
+        return cls(hass, paths)
+
+    async def async_setup(self) -> bool:
+        """Check that the configured directories exist."""
+        missing = await self.hass.async_add_executor_job(
+            lambda: [path for path in self._paths if not os.path.isdir(path)]
+        )
+        for path in missing:
+            _LOGGER.warning(f"Backup directory {path} not found, it will be skipped")
+        return len(missing) < len(self._paths)
+
+    async def async_get_capacity(self) -> dict[str, int] | None:
+        """Return the free and total bytes of the first configured directory."""
+        return await self.hass.async_add_executor_job(disk_capacity, self._paths[0])
+
+    async def async_fetch_raw(self) -> list[dict[str, Any]]:
+        """Scan the configured directories in the executor."""
+        return await self.hass.async_add_executor_job(self._scan_all)
+
+    def _scan_all(self) -> list[dict[str, Any]]:
+        """Scan all directories (blocking call for executor)."""
+        archives: list[dict[str, Any]] = []
+        seen: set[str] = set()
+        pending = list(self._paths)
+
+        while pending:
+            directory = pending.pop()
+            if directory in seen:
+                continue
+            seen.add(directory)
+
+            result = self._scan_directory(directory)
+            if result is not None:
+                dir_archives, subdirs = result
+                archives.extend(dir_archives)
+                pending.extend(subdirs)
+
+        # Forget directories that no longer exist
+        for directory in list(self._dir_cache):
+            if directory not in seen:
+                del self._dir_cache[directory]
+
+        return archives
+
+    def _scan_directory(self, directory: str) -> tuple[list[dict], list[str]] | None:
+        """List one directory, reusing the cached listing if unchanged.
+
+        Args:
+            directory: Directory to scan
+
+        Returns:
+            Tuple of (archives, subdirectories), None if not readable
+        """
+        try:
+            mtime_ns = os.stat(directory).st_mtime_ns
+        except OSError as err:
+            _LOGGER.debug("Cannot stat %s: %s", directory, err)
+            self._dir_cache.pop(directory, None)
+            return None
+
+        cached = self._dir_cache.get(directory)
+        if (
+            cached is not None
+            and cached[0] == mtime_ns
+            and cached[1] - mtime_ns / 1e9 > DIRECTORY_SETTLE_TIME
+        ):
+            return cached[2], cached[3]
+
+        scanned_at = time.time()
+        archives = []
+        subdirs = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif entry.is_file() and is_backup_file(entry.name):
+                        stat = entry.stat()
+                        archives.append(
+                            {
+                                "path": entry.path,
+                                "name": entry.name,
+                                "size": stat.st_size,
+                                "mtime": stat.st_mtime,
+                            }
+                        )
+        except OSError as err:
+            _LOGGER.warning(f"Cannot scan backup directory {directory}: {err}")
+            self._dir_cache.pop(directory, None)
+            return None
+
+        self._dir_cache[directory] = (mtime_ns, scanned_at, archives, subdirs)
+        return archives, subdirs
+
+    def process(self, raw: dict[str, Any]) -> BackupRecord | None:
+        """Turn a scanned archive into a backup record."""
+        try:
+            filename = raw["name"]
+            date_obj = extract_date_from_filename(filename)
+            if not date_obj:
+                date_obj = dt_util.as_local(
+                    dt_util.utc_from_timestamp(raw["mtime"])
+                )
+
+            return normalize_backup(
+                name=filename,
+                slug=raw["path"],
+                size_bytes=int(raw["size"]),
+                date_obj=date_obj,
+                backup_hash=hashlib.sha256(raw["path"].encode()).hexdigest(),
+                destination=self.destination,
+                compressed=is_compressed(filename),
+            )
+
+        except Exception as err:
+            _LOGGER.error(f"Error processing backup archive: {err}", exc_info=True)
+            return None
@@ -0,0 +1,106 @@
+"""Refresh instrumentation for Backup Guardian.
+
+Every stage of a refresh records its duration in a fixed-size window, so
+the percentiles always describe the latest refreshes and memory does not
+grow with uptime. Percentiles are computed only when the metrics are read.
+"""
+import math
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Iterator
+
+# Durations kept per stage
+METRICS_WINDOW = 100
+
+# Stages of a source refresh
+STAGE_FETCH = "fetch"
+STAGE_PROCESSING = "processing"
+STAGE_CAPACITY = "capacity"
+
+# Stages of a coordinator refresh
+STAGE_REFRESH = "refresh"
+STAGE_AGGREGATION = "aggregation"
+STAGE_ANALYSIS = "analysis"
+STAGE_FORECAST = "forecast"
+STAGE_ENTITY_WRITE = "entity_write"
+
+# Counters
+COUNTER_API_CALLS = "api_calls"
+COUNTER_API_ERRORS = "api_errors"
+COUNTER_BYTES = "bytes"
+
+
+def percentile(values: list[float], fraction: float) -> float | None:
+    """Return the nearest-rank percentile of sorted values, None if empty."""
+    if not values:
+        return None
+    rank = max(math.ceil(fraction * len(values)), 1)
+    return values[min(rank, len(values)) - 1]
+
+
+class RefreshMetrics:
+    """Stage durations and counters of a refresh pipeline."""
+
+    def __init__(self, window: int = METRICS_WINDOW) -> None:
+        """Initialize the metrics.
+
+        Args:
+            window: Durations kept per stage
+        """
+        self._window = window
+        # stage -> latest durations in seconds
+        self._durations: dict[str, deque[float]] = {}
+        # stage -> number of runs since setup
+        self._runs: dict[str, int] = {}
+        # counter -> total since setup
+        self.counters: dict[str, int] = {}
+
+    @contextmanager
+    def time_stage(self, stage: str) -> Iterator[None]:
+        """Record the duration of the wrapped block, also if it fails."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - start)
+
+    def record(self, stage: str, seconds: float) -> None:
+        """Record a duration of a stage."""
+        durations = self._durations.get(stage)
+        if durations is None:
+            durations = self._durations[stage] = deque(maxlen=self._window)
+        durations.append(seconds)
+        self._runs[stage] = self._runs.get(stage, 0) + 1
+
+    def increment(self, counter: str, amount: int = 1) -> None:
+        """Add to a counter."""
+        self.counters[counter] = self.counters.get(counter, 0) + amount
+
+    def last(self, stage: str) -> float | None:
+        """Return the latest duration of a stage in seconds."""
+        durations = self._durations.get(stage)
+        return durations[-1] if durations else None
+
+    def stage_summary(self, stage: str) -> dict[str, Any]:
+        """Return the run count and the last, p50, p95 and max durations in ms."""
+        durations = self._durations.get(stage, ())
+        ordered = sorted(durations)
+
+        def _ms(seconds: float | None) -> float | None:
+            return round(seconds * 1000, 1) if seconds is not None else None
+
+        return {
+            "runs": self._runs.get(stage, 0),
+            "last_ms": _ms(durations[-1] if durations else None),
+            "p50_ms": _ms(percentile(ordered, 0.5)),
+            "p95_ms": _ms(percentile(ordered, 0.95)),
+            "max_ms": _ms(ordered[-1] if ordered else None),
+        }
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the summary of every stage and the counters."""
+        return {
+            "stages": {stage: self.stage_summary(stage) for stage in self._durations},
+            "counters": dict(self.counters),
+        }
@@ -2,11 +2,13 @@
 
 This module handles the OAuth2 flow for Google Drive integration.
 """
+import asyncio
 import logging
-from typing import Any
+import time
+from typing import Any, Callable
 
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers import config_entry_oauth2_flow
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .const import (
     GOOGLE_DRIVE_API_SCOPES,
@@ -16,6 +18,9 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Refresh the access token this many seconds before it expires
+TOKEN_REFRESH_MARGIN = 300
+
 
 class GoogleDriveOAuth2Handler:
     """Handle OAuth2 flow for Google Drive."""
@@ -67,7 +72,6 @@ class GoogleDriveOAuth2Handler:
             Dict with 'access_token', 'refresh_token', 'expiry' or None if failed
         """
         try:
-            import aiohttp
             from urllib.parse import urlencode
 
             data = {
@@ -78,25 +82,25 @@ class GoogleDriveOAuth2Handler:
                 "grant_type": "authorization_code",
             }
 
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    OAUTH_TOKEN_URL,
-                    data=urlencode(data),
-                    headers={"Content-Type": "application/x-www-form-urlencoded"},
-                ) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        _LOGGER.error(f"Token exchange failed: {error_text}")
-                        return None
-
-                    result = await response.json()
-                    
-                    return {
-                        "access_token": result.get("access_token"),
-                        "refresh_token": result.get("refresh_token"),
-                        "token_type": result.get("token_type"),
-                        "expires_in": result.get("expires_in"),
-                    }
+            session = async_get_clientsession(self.hass)
+            async with session.post(
+                OAUTH_TOKEN_URL,
+                data=urlencode(data),
+                headers={"Content-Type": "application/x-www-form-urlencoded"},
+            ) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    _LOGGER.error(f"Token exchange failed: {error_text}")
+                    return None
+
+                result = await response.json()
+                
+                return {
+                    "access_token": result.get("access_token"),
+                    "refresh_token": result.get("refresh_token"),
+                    "token_type": result.get("token_type"),
+                    "expires_in": result.get("expires_in"),
+                }
 
         except Exception as err:
             _LOGGER.error(f"Error exchanging authorization code: {err}", exc_info=True)
@@ -109,10 +113,10 @@ class GoogleDriveOAuth2Handler:
             refresh_token: Google OAuth refresh token
             
         Returns:
-            Dict with new 'access_token' or None if failed
+            Dict with new 'access_token', 'expires_in' and optionally a
+            rotated 'refresh_token', or None if failed
         """
         try:
-            import aiohttp
             from urllib.parse import urlencode
 
             data = {
@@ -122,29 +126,118 @@ class GoogleDriveOAuth2Handler:
                 "grant_type": "refresh_token",
             }
 
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    OAUTH_TOKEN_URL,
-                    data=urlencode(data),
-                    headers={"Content-Type": "application/x-www-form-urlencoded"},
-                ) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        _LOGGER.error(f"Token refresh failed: {error_text}")
-                        return None
-
-                    result = await response.json()
-                    
-                    return {
-                        "access_token": result.get("access_token"),
-                        "expires_in": result.get("expires_in"),
-                    }
+            session = async_get_clientsession(self.hass)
+            async with session.post(
+                OAUTH_TOKEN_URL,
+                data=urlencode(data),
+                headers={"Content-Type": "application/x-www-form-urlencoded"},
+            ) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    _LOGGER.error(f"Token refresh failed: {error_text}")
+                    return None
+
+                result = await response.json()
+                
+                return {
+                    "access_token": result.get("access_token"),
+                    # Google may rotate the refresh token
+                    "refresh_token": result.get("refresh_token"),
+                    "expires_in": result.get("expires_in"),
+                }
 
         except Exception as err:
             _LOGGER.error(f"Error refreshing token: {err}", exc_info=True)
             return None
 
 
+class GoogleTokenManager:
+    """Keep a valid Google access token, refreshing it ahead of expiry."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        client_id: str,
+        client_secret: str,
+        token: dict[str, Any],
+        on_update: Callable[[dict[str, Any]], None] | None = None,
+    ) -> None:
+        """Initialize the token manager.
+        
+        Args:
+            hass: Home Assistant instance
+            client_id: Google OAuth client ID
+            client_secret: Google OAuth client secret
+            token: Stored token dict with 'access_token', 'refresh_token'
+                and optionally 'expires_at' (epoch seconds)
+            on_update: Called with the new token dict after every refresh
+        """
+        self._handler = GoogleDriveOAuth2Handler(hass, client_id, client_secret)
+        self._token = dict(token)
+        self._on_update = on_update
+        self._lock = asyncio.Lock()
+
+    @property
+    def token(self) -> dict[str, Any]:
+        """Return the current token dict."""
+        return self._token
+
+    @property
+    def expires_at(self) -> float:
+        """Return the access token expiry in epoch seconds, 0 if unknown."""
+        return float(self._token.get("expires_at") or 0)
+
+    def _needs_refresh(self) -> bool:
+        """Check if the access token is missing or about to expire."""
+        return (
+            not self._token.get("access_token")
+            or self.expires_at - TOKEN_REFRESH_MARGIN <= time.time()
+        )
+
+    async def async_get_access_token(self) -> str | None:
+        """Return a valid access token, refreshing it if needed.
+        
+        Concurrent callers wait for the same refresh instead of starting
+        their own.
+        
+        Returns:
+            Access token, or None if it expired and could not be refreshed
+        """
+        if not self._needs_refresh():
+            return self._token["access_token"]
+
+        async with self._lock:
+            # Another caller may have refreshed while we were waiting
+            if self._needs_refresh():
+                await self._async_refresh()
+
+        if self.expires_at and self.expires_at <= time.time():
+            return None
+        return self._token.get("access_token")
+
+    async def _async_refresh(self) -> None:
+        """Refresh the access token and persist the new token."""
+        refresh_token = self._token.get("refresh_token")
+        if not refresh_token:
+            _LOGGER.error("No Google refresh token available, re-authorize Google Drive")
+            return
+
+        result = await self._handler.async_refresh_token(refresh_token)
+        if not result or not result.get("access_token"):
+            return
+
+        self._token = {
+            **self._token,
+            "access_token": result["access_token"],
+            "refresh_token": result.get("refresh_token") or refresh_token,
+            "expires_at": time.time() + float(result.get("expires_in") or 3600),
+        }
+        _LOGGER.debug("Google access token refreshed")
+
+        if self._on_update is not None:
+            self._on_update(self._token)
+
+
 async def async_validate_credentials(
     hass: HomeAssistant, client_id: str, client_secret: str
 ) -> bool:
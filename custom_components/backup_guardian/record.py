@@ -0,0 +1,112 @@
+"""Backup record model for Backup Guardian."""
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+from .const import DESTINATION_NAMES
+
+
+@dataclass(frozen=True, slots=True)
+class BackupRecord:
+    """A single backup, from any source.
+
+    Only canonical fields are stored; size in MB, date and time strings and
+    the destination friendly name are derived on access. Item access
+    (record["size_mb"], record.get("date")) is supported for consumers
+    written against the former backup dicts.
+    """
+
+    name: str
+    slug: str
+    size: int
+    datetime: datetime
+    hash: str
+    destination: str
+    type: str = "full"
+    protected: bool = False
+    compressed: bool = True
+
+    @property
+    def size_mb(self) -> float:
+        """Return the size in MB."""
+        return round(self.size / (1024 * 1024), 2)
+
+    @property
+    def date(self) -> str:
+        """Return the local date as YYYY-MM-DD."""
+        return self.datetime.strftime("%Y-%m-%d")
+
+    @property
+    def time(self) -> str:
+        """Return the local time as HH:MM:SS."""
+        return self.datetime.strftime("%H:%M:%S")
+
+    @property
+    def destination_name(self) -> str:
+        """Return the friendly name of the destination."""
+        return DESTINATION_NAMES.get(self.destination, self.destination.title())
+
+    def __getitem__(self, key: str) -> Any:
+        """Return a field or derived field by name."""
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return a field or derived field by name, or default."""
+        return getattr(self, key, default)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the record with its derived fields, for state attributes."""
+        return {
+            "name": self.name,
+            "slug": self.slug,
+            "size": self.size,
+            "size_mb": self.size_mb,
+            "date": self.date,
+            "time": self.time,
+            "hash": self.hash,
+            "type": self.type,
+            "protected": self.protected,
+            "compressed": self.compressed,
+            "destination": self.destination,
+            "destination_name": self.destination_name,
+        }
+
+    def as_storage(self) -> dict[str, Any]:
+        """Return the canonical fields in a JSON serializable form."""
+        return {
+            "name": self.name,
+            "slug": self.slug,
+            "size": self.size,
+            "datetime": self.datetime.isoformat(),
+            "hash": self.hash,
+            "destination": self.destination,
+            "type": self.type,
+            "protected": self.protected,
+            "compressed": self.compressed,
+        }
+
+    @classmethod
+    def from_storage(cls, data: dict[str, Any]) -> "BackupRecord | None":
+        """Build a record from as_storage() output, None if invalid."""
+        date_obj = dt_util.parse_datetime(data.get("datetime") or "")
+        if date_obj is None:
+            return None
+        try:
+            return cls(
+                name=data["name"],
+                slug=data["slug"],
+                size=int(data["size"]),
+                datetime=dt_util.as_local(date_obj),
+                hash=data["hash"],
+                destination=data["destination"],
+                type=data.get("type", "full"),
+                protected=data.get("protected", False),
+                compressed=data.get("compressed", True),
+            )
+        except (KeyError, TypeError, ValueError):
+            return None
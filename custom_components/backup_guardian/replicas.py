@@ -0,0 +1,162 @@
+"""Cross-destination replica index for Backup Guardian.
+
+Copies of the same backup on different destinations are matched through
+shared keys: the content MD5, or the normalized name with the exact size,
+or the exact size with the timestamp to the minute. Backups sharing a key
+form a replica group.
+
+The index is updated incrementally: backups added or removed since the
+previous snapshot are found by record identity, and only the groups they
+touch are walked again, so an unchanged catalog costs one dict lookup per
+backup.
+"""
+import logging
+import re
+from typing import Any
+
+from .const import BACKUP_FILE_SUFFIXES, DESTINATION_LOCAL
+from .record import BackupRecord
+
+_LOGGER = logging.getLogger(__name__)
+
+# Hashes that do not identify any content
+_NO_HASH = ("", "N/A")
+
+_NAME_JUNK_RE = re.compile(r"[^0-9a-z]+")
+# Longest first, so ".tar.gz" is stripped before ".gz" could match
+_SUFFIXES = sorted(BACKUP_FILE_SUFFIXES, key=len, reverse=True)
+
+
+def normalize_name(name: str) -> str:
+    """Normalize a backup name for matching across destinations.
+
+    "Full Backup 2026-02-15 17:16:00.tar" and "full_backup_2026-02-15_17-16-00"
+    both become "fullbackup20260215171600".
+    """
+    name = name.lower()
+    for suffix in _SUFFIXES:
+        if name.endswith(suffix):
+            name = name[: -len(suffix)]
+            break
+    return _NAME_JUNK_RE.sub("", name)
+
+
+def replica_keys(backup: BackupRecord) -> tuple[tuple, ...]:
+    """Return the keys identifying copies of a backup."""
+    keys: list[tuple] = [
+        ("name", normalize_name(backup.name), backup.size),
+        ("time", backup.size, int(backup.datetime.timestamp()) // 60),
+    ]
+    if backup.hash not in _NO_HASH:
+        keys.append(("hash", backup.hash))
+    return tuple(keys)
+
+
+class ReplicaIndex:
+    """Group the backups of all destinations into sets of replicas."""
+
+    def __init__(self) -> None:
+        """Initialize the index."""
+        # (destination, slug) -> (record, keys); records are immutable and
+        # reused across refreshes by the incremental sync
+        self._records: dict[tuple[str, str], tuple[BackupRecord, tuple[tuple, ...]]] = {}
+        # key -> backups sharing it
+        self._members: dict[tuple, set[tuple[str, str]]] = {}
+        # (destination, slug) -> destinations holding a copy
+        self._destinations: dict[tuple[str, str], frozenset[str]] = {}
+
+    def update(self, backups: list[BackupRecord]) -> None:
+        """Apply a new catalog snapshot.
+
+        Args:
+            backups: Backups from all destinations
+        """
+        current = {(backup.destination, backup.slug): backup for backup in backups}
+        # Backups whose group must be walked again
+        dirty: set[tuple[str, str]] = set()
+
+        removed = [
+            backup_id
+            for backup_id, (record, _) in self._records.items()
+            if current.get(backup_id) is not record
+        ]
+        for backup_id in removed:
+            self._remove(backup_id, dirty)
+
+        for backup_id, backup in current.items():
+            if backup_id in self._records:
+                continue
+            keys = replica_keys(backup)
+            self._records[backup_id] = (backup, keys)
+            for key in keys:
+                self._members.setdefault(key, set()).add(backup_id)
+            dirty.add(backup_id)
+
+        walked: set[tuple[str, str]] = set()
+        for backup_id in dirty:
+            if backup_id in walked or backup_id not in self._records:
+                continue
+            group = self._group(backup_id)
+            walked |= group
+            destinations = frozenset(destination for destination, _ in group)
+            for member in group:
+                self._destinations[member] = destinations
+
+        if dirty:
+            _LOGGER.debug("Replica index updated, %d backup(s) regrouped", len(dirty))
+
+    def _remove(
+        self,
+        backup_id: tuple[str, str],
+        dirty: set[tuple[str, str]],
+    ) -> None:
+        """Drop a backup, marking the backups it was linked to as dirty."""
+        for key in self._records[backup_id][1]:
+            members = self._members[key]
+            members.discard(backup_id)
+            if members:
+                dirty.update(members)
+            else:
+                del self._members[key]
+        del self._records[backup_id]
+        self._destinations.pop(backup_id, None)
+
+    def _group(self, backup_id: tuple[str, str]) -> set[tuple[str, str]]:
+        """Return the backups linked to a backup through shared keys."""
+        group = {backup_id}
+        stack = [backup_id]
+        while stack:
+            for key in self._records[stack.pop()][1]:
+                for other in self._members[key]:
+                    if other not in group:
+                        group.add(other)
+                        stack.append(other)
+        return group
+
+    def replica_count(self, backup: BackupRecord) -> int:
+        """Return the number of other destinations holding a copy of a backup."""
+        destinations = self._destinations.get((backup.destination, backup.slug))
+        return len(destinations) - 1 if destinations else 0
+
+    def is_offsite(self, backup: BackupRecord) -> bool:
+        """Check if a backup has a copy outside Home Assistant."""
+        destinations = self._destinations.get((backup.destination, backup.slug), ())
+        return any(destination != DESTINATION_LOCAL for destination in destinations)
+
+    def not_offsite(self, backups: list[BackupRecord]) -> list[BackupRecord]:
+        """Return the local backups without any copy on another destination."""
+        return [
+            backup
+            for backup in backups
+            if backup.destination == DESTINATION_LOCAL and not self.is_offsite(backup)
+        ]
+
+    def summary(self, backups: list[BackupRecord]) -> dict[str, Any]:
+        """Return the replica counts and the local backups not yet offsite."""
+        return {
+            "counts": {
+                (backup.destination, backup.slug): self.replica_count(backup)
+                for backup in backups
+            },
+            "not_offsite": self.not_offsite(backups),
+        }
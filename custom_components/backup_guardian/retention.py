@@ -0,0 +1,188 @@
+"""Retention policy evaluation for Backup Guardian.
+
+A grandfather-father-son (GFS) policy keeps the newest backup of each of
+the last N days, weeks and months. Evaluation sorts the backups once and
+walks them newest first, so it is O(n log n) per destination. The same
+evaluator projects storage usage by appending the backups expected from
+the observed cadence and fitted size trend of each destination.
+"""
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Callable, Iterable, TypeVar
+
+from .const import (
+    CONF_RETENTION_DAILY,
+    CONF_RETENTION_MONTHLY,
+    CONF_RETENTION_WEEKLY,
+    DEFAULT_RETENTION_DAILY,
+    DEFAULT_RETENTION_MONTHLY,
+    DEFAULT_RETENTION_WEEKLY,
+)
+from .forecast import size_trend
+from .record import BackupRecord
+
+T = TypeVar("T")
+
+# Days ahead for which storage usage is projected
+PROJECTION_HORIZONS = (30, 90, 365)
+# Backups used to learn the cadence of a destination
+PROJECTION_SAMPLE = 30
+# Projected backups are never closer than this
+MIN_BACKUP_INTERVAL = timedelta(hours=1)
+
+
+@dataclass(frozen=True, slots=True)
+class RetentionPolicy:
+    """Number of daily, weekly and monthly backups to keep."""
+
+    daily: int = DEFAULT_RETENTION_DAILY
+    weekly: int = DEFAULT_RETENTION_WEEKLY
+    monthly: int = DEFAULT_RETENTION_MONTHLY
+
+    @classmethod
+    def from_config(cls, data: dict[str, Any]) -> "RetentionPolicy":
+        """Build the policy from config entry data or service parameters."""
+        return cls(
+            daily=int(data.get(CONF_RETENTION_DAILY, DEFAULT_RETENTION_DAILY)),
+            weekly=int(data.get(CONF_RETENTION_WEEKLY, DEFAULT_RETENTION_WEEKLY)),
+            monthly=int(data.get(CONF_RETENTION_MONTHLY, DEFAULT_RETENTION_MONTHLY)),
+        )
+
+    def as_dict(self) -> dict[str, int]:
+        """Return the policy as a dict."""
+        return {"daily": self.daily, "weekly": self.weekly, "monthly": self.monthly}
+
+
+def _gfs_keep(
+    items: list[T], policy: RetentionPolicy, moment: Callable[[T], datetime]
+) -> list[bool]:
+    """Flag the items kept by a GFS policy.
+
+    Args:
+        items: Items sorted newest first
+        policy: Retention policy
+        moment: Returns the datetime of an item
+
+    Returns:
+        One flag per item, True if the item is kept
+    """
+    rules = (
+        (policy.daily, lambda when: when.date()),
+        (policy.weekly, lambda when: when.isocalendar()[:2]),
+        (policy.monthly, lambda when: (when.year, when.month)),
+    )
+    keep = [False] * len(items)
+    for limit, bucket_of in rules:
+        last_bucket = None
+        kept = 0
+        for position, item in enumerate(items):
+            if kept >= limit:
+                break
+            bucket = bucket_of(moment(item))
+            if bucket != last_bucket:
+                keep[position] = True
+                last_bucket = bucket
+                kept += 1
+    return keep
+
+
+def _group_by_destination(backups: Iterable[BackupRecord]) -> dict[str, list[BackupRecord]]:
+    """Group backups by destination, newest first."""
+    groups: dict[str, list[BackupRecord]] = {}
+    for backup in backups:
+        groups.setdefault(backup.destination, []).append(backup)
+    for group in groups.values():
+        group.sort(key=lambda backup: backup.datetime, reverse=True)
+    return groups
+
+
+def evaluate_retention(
+    backups: list[BackupRecord], policy: RetentionPolicy
+) -> dict[str, dict[str, Any]]:
+    """Compute which backups a policy keeps and prunes on each destination.
+
+    Args:
+        backups: Backups from all destinations
+        policy: Retention policy
+
+    Returns:
+        destination -> dict with the 'keep' and 'prune' backups, newest
+        first, and their total 'keep_size' and 'prune_size' in bytes
+    """
+    result = {}
+    for destination, group in _group_by_destination(backups).items():
+        flags = _gfs_keep(group, policy, lambda backup: backup.datetime)
+        keep = [backup for backup, kept in zip(group, flags) if kept]
+        prune = [backup for backup, kept in zip(group, flags) if not kept]
+        result[destination] = {
+            "keep": keep,
+            "prune": prune,
+            "keep_size": sum(backup.size for backup in keep),
+            "prune_size": sum(backup.size for backup in prune),
+        }
+    return result
+
+
+def project_usage_by_destination(
+    backups: list[BackupRecord],
+    policy: RetentionPolicy,
+    now: datetime,
+    horizons: tuple[int, ...] = PROJECTION_HORIZONS,
+) -> dict[str, dict[int, int]]:
+    """Simulate the storage used under a policy in the coming days.
+
+    Each destination keeps producing backups at its observed cadence, with
+    sizes following the fitted size trend; the policy is applied at the end
+    of each horizon.
+
+    Args:
+        backups: Backups from all destinations
+        policy: Retention policy
+        now: Current local time
+        horizons: Days ahead to project
+
+    Returns:
+        destination -> days ahead -> projected bytes kept
+    """
+    projected = {}
+    for destination, group in _group_by_destination(backups).items():
+        sample = group[:PROJECTION_SAMPLE]
+        existing = [(backup.datetime, backup.size) for backup in group]
+        interval = None
+        if len(sample) > 1:
+            span = sample[0].datetime - sample[-1].datetime
+            interval = max(span / (len(sample) - 1), MIN_BACKUP_INTERVAL)
+        size_now, growth = size_trend(group, now)
+
+        usage = projected[destination] = {}
+        for days in horizons:
+            end = now + timedelta(days=days)
+            future = []
+            if interval is not None:
+                moment = max(sample[0].datetime, now - interval) + interval
+                while moment <= end:
+                    elapsed = (moment - now).total_seconds() / 86400
+                    future.append((moment, max(size_now + growth * elapsed, 0)))
+                    moment += interval
+            timeline = future[::-1] + existing
+            flags = _gfs_keep(timeline, policy, lambda item: item[0])
+            usage[days] = int(sum(size for (_, size), kept in zip(timeline, flags) if kept))
+    return projected
+
+
+def project_usage(
+    backups: list[BackupRecord],
+    policy: RetentionPolicy,
+    now: datetime,
+    horizons: tuple[int, ...] = PROJECTION_HORIZONS,
+) -> dict[int, int]:
+    """Simulate the storage used on all destinations under a policy.
+
+    Returns:
+        days ahead -> projected bytes kept on all destinations
+    """
+    projected = dict.fromkeys(horizons, 0)
+    for usage in project_usage_by_destination(backups, policy, now, horizons).values():
+        for days, size in usage.items():
+            projected[days] += size
+    return projected
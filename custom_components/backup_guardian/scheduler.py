@@ -0,0 +1,167 @@
+"""Adaptive polling scheduler for Backup Guardian.
+
+Each source has its own poll interval. The interval doubles after every
+poll that found no change, up to a maximum, and drops to a short interval
+around the times of day when backups usually happen, learned from the
+catalog.
+"""
+import logging
+from collections import Counter
+from datetime import datetime, timedelta
+
+from .const import (
+    EVENT_DRIVEN_POLL_INTERVAL,
+    POLL_BACKOFF_FACTOR,
+    SOURCE_POLL_INTERVALS,
+    SOURCE_WINDOW_POLL_INTERVALS,
+    UPDATE_INTERVAL,
+)
+from .record import BackupRecord
+
+_LOGGER = logging.getLogger(__name__)
+
+# Size of the time of day buckets used to learn backup windows (minutes)
+WINDOW_BUCKET_MINUTES = 15
+# Days of history used to learn backup windows
+WINDOW_HISTORY_DAYS = 30
+# Backups needed in a bucket to consider it an expected backup window
+WINDOW_MIN_OCCURRENCES = 2
+# Fast polling starts this long before an expected window and lasts this long after
+WINDOW_LEAD = timedelta(minutes=15)
+WINDOW_TAIL = timedelta(minutes=60)
+# Sources due within this delay are polled with the current refresh
+POLL_TOLERANCE = timedelta(seconds=10)
+
+
+class AdaptivePollScheduler:
+    """Decide which sources to poll and when the next refresh is due."""
+
+    def __init__(self) -> None:
+        """Initialize the scheduler."""
+        # destination -> current backed off interval
+        self._intervals: dict[str, timedelta] = {}
+        # destination -> time of the next poll
+        self._next_poll: dict[str, datetime] = {}
+        # Buckets of the day (minute // WINDOW_BUCKET_MINUTES) with regular backups
+        self._windows: frozenset[int] = frozenset()
+        # Sources that push their changes, polled only as a safety net
+        self._event_driven: set[str] = set()
+
+    def set_event_driven(self, destination: str) -> None:
+        """Poll a source that reports its changes only at the safety net interval."""
+        self._event_driven.add(destination)
+
+    def _base_interval(self, destination: str) -> timedelta:
+        """Return the base poll interval of a source."""
+        if destination in self._event_driven:
+            return timedelta(seconds=EVENT_DRIVEN_POLL_INTERVAL)
+        return timedelta(seconds=SOURCE_POLL_INTERVALS.get(destination, UPDATE_INTERVAL))
+
+    def _window_interval(self, destination: str) -> timedelta | None:
+        """Return the poll interval of a source around backup windows."""
+        if destination in self._event_driven or destination not in SOURCE_WINDOW_POLL_INTERVALS:
+            return None
+        return timedelta(seconds=SOURCE_WINDOW_POLL_INTERVALS[destination])
+
+    def learn(self, backups: list[BackupRecord], now: datetime) -> None:
+        """Learn the usual backup times of day from the catalog.
+
+        Args:
+            backups: Backups from all sources
+            now: Current local time
+        """
+        since = now - timedelta(days=WINDOW_HISTORY_DAYS)
+        buckets = Counter(
+            (backup.datetime.hour * 60 + backup.datetime.minute) // WINDOW_BUCKET_MINUTES
+            for backup in backups
+            if backup.datetime >= since
+        )
+        self._windows = frozenset(
+            bucket for bucket, count in buckets.items() if count >= WINDOW_MIN_OCCURRENCES
+        )
+        _LOGGER.debug("Learned %d backup window(s)", len(self._windows))
+
+    def in_backup_window(self, now: datetime) -> bool:
+        """Check if a backup is expected around the given time."""
+        if not self._windows:
+            return False
+        moment = now - WINDOW_TAIL
+        while moment <= now + WINDOW_LEAD:
+            if (moment.hour * 60 + moment.minute) // WINDOW_BUCKET_MINUTES in self._windows:
+                return True
+            moment += timedelta(minutes=WINDOW_BUCKET_MINUTES)
+        return False
+
+    def due(self, destinations: list[str], now: datetime) -> list[str]:
+        """Return the destinations that should be polled now.
+
+        Args:
+            destinations: Enabled destinations
+            now: Current local time
+        """
+        in_window = self.in_backup_window(now)
+        due = []
+        for destination in destinations:
+            next_poll = self._next_poll.get(destination, now)
+            window_interval = self._window_interval(destination) if in_window else None
+            if next_poll <= now + POLL_TOLERANCE or (
+                window_interval is not None and next_poll - now > window_interval
+            ):
+                due.append(destination)
+        return due
+
+    def record(self, destination: str, changed: bool, now: datetime) -> None:
+        """Record the outcome of a poll and schedule the next one.
+
+        Args:
+            destination: Polled destination
+            changed: Whether the poll found new, changed or removed backups
+            now: Current local time
+        """
+        base = self._base_interval(destination)
+        if changed or destination not in self._intervals or destination in self._event_driven:
+            # Sources pushing their changes keep a fixed safety net interval
+            interval = base
+        else:
+            interval = min(
+                self._intervals[destination] * POLL_BACKOFF_FACTOR,
+                base * POLL_BACKOFF_FACTOR**3,
+            )
+        self._intervals[destination] = interval
+
+        window_interval = self._window_interval(destination)
+        if window_interval is not None and self.in_backup_window(now):
+            interval = min(interval, window_interval)
+        self._next_poll[destination] = now + interval
+
+    def next_interval(self, destinations: list[str], now: datetime) -> timedelta:
+        """Return the delay until the next source is due.
+
+        Args:
+            destinations: Enabled destinations
+            now: Current local time
+        """
+        delays = [
+            self._next_poll[destination] - now
+            for destination in destinations
+            if destination in self._next_poll
+        ]
+        window_intervals = [
+            interval
+            for interval in map(self._window_interval, destinations)
+            if interval is not None
+        ]
+        if self.in_backup_window(now):
+            delays.extend(window_intervals)
+        elif delays and window_intervals:
+            # Wake up when the next backup window opens
+            step = timedelta(minutes=WINDOW_BUCKET_MINUTES)
+            moment = now + step
+            while moment - now < min(delays):
+                if self.in_backup_window(moment):
+                    delays.append(moment - now)
+                    break
+                moment += step
+        if not delays:
+            return timedelta(seconds=UPDATE_INTERVAL)
+        return max(min(delays), timedelta(seconds=min(SOURCE_WINDOW_POLL_INTERVALS.values())))
@@ -1,12 +1,19 @@
 """Sensor platform for Backup Guardian."""
 import logging
 
-from homeassistant.components.sensor import SensorEntity, SensorDeviceClass
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorStateClass,
+)
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EntityCategory
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.util import dt as dt_util
 
 from .const import (
     DOMAIN,
@@ -18,26 +25,16 @@ from .const import (
     ATTR_BACKUP_TYPE,
     ATTR_BACKUP_LIST,
     ATTR_BACKUP_DESTINATION,
+    CONF_BACKUP_LIST_LIMIT,
+    DEFAULT_BACKUP_LIST_LIMIT,
+    DESTINATION_GOOGLE_DRIVE,
+    DESTINATION_NAMES,
 )
+from .freshness import target_name
+from .metrics import COUNTER_API_CALLS, COUNTER_API_ERRORS, COUNTER_BYTES, STAGE_REFRESH
 
 _LOGGER = logging.getLogger(__name__)
 
-# Leggi la versione dal manifest
-import json
-from pathlib import Path
-
-def get_version() -> str:
-    """Get version from manifest."""
-    try:
-        manifest_path = Path(__file__).parent / "manifest.json"
-        with open(manifest_path) as f:
-            manifest = json.load(f)
-        return manifest.get("version", "unknown")
-    except Exception:
-        return "unknown"
-
-VERSION = get_version()
-
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -51,15 +48,63 @@ async def async_setup_entry(
         BackupGuardianLastBackupSensor(coordinator, entry),
         BackupGuardianTotalBackupsSensor(coordinator, entry),
         BackupGuardianTotalSizeSensor(coordinator, entry),
+        BackupGuardianOldestBackupAgeSensor(coordinator, entry),
+        BackupGuardianGrowthRateSensor(coordinator, entry),
+        BackupGuardianNotOffsiteSensor(coordinator, entry),
+        BackupGuardianRetentionPruneSensor(coordinator, entry),
+        BackupGuardianProjectedUsageSensor(coordinator, entry),
+        BackupGuardianBackupSizeTrendSensor(coordinator, entry),
+        BackupGuardianRefreshDurationSensor(coordinator, entry),
+        BackupGuardianApiCallsSensor(coordinator, entry),
     ]
 
+    if DESTINATION_GOOGLE_DRIVE in coordinator.destinations:
+        sensors.append(BackupGuardianDriveQuotaSensor(coordinator, entry))
+
+    sensors.extend(
+        BackupGuardianFreshnessDeadlineSensor(coordinator, entry, target)
+        for target in coordinator.freshness.targets
+    )
+
     async_add_entities(sensors)
 
+    # Sensori per destinazione, creati e rimossi in base al catalogo
+    destination_sensors: dict[str, list[BackupGuardianDestinationSensor]] = {}
+
+    @callback
+    def _async_sync_destination_sensors() -> None:
+        """Add sensors for new destinations and remove the vanished ones."""
+        destinations = set(coordinator.destinations)
+        if coordinator.data and coordinator.data.get("stats"):
+            destinations.update(coordinator.data["stats"]["by_destination"])
+
+        new_sensors = []
+        for destination in destinations - destination_sensors.keys():
+            destination_sensors[destination] = [
+                sensor_cls(coordinator, entry, destination)
+                for sensor_cls in DESTINATION_SENSORS
+            ]
+            new_sensors.extend(destination_sensors[destination])
+        if new_sensors:
+            async_add_entities(new_sensors)
+
+        entity_registry = er.async_get(hass)
+        for destination in destination_sensors.keys() - destinations:
+            for sensor in destination_sensors.pop(destination):
+                if sensor.entity_id and entity_registry.async_get(sensor.entity_id):
+                    entity_registry.async_remove(sensor.entity_id)
+                else:
+                    hass.async_create_task(sensor.async_remove(force_remove=True))
+
+    _async_sync_destination_sensors()
+    entry.async_on_unload(coordinator.async_add_listener(_async_sync_destination_sensors))
+
 
 class BackupGuardianLastBackupSensor(CoordinatorEntity, SensorEntity):
     """Sensor for the last backup."""
 
     _attr_has_entity_name = True
+    _unrecorded_attributes = frozenset({ATTR_BACKUP_HASH})
 
     def __init__(self, coordinator, entry):
         """Initialize the sensor."""
@@ -78,7 +123,7 @@ class BackupGuardianLastBackupSensor(CoordinatorEntity, SensorEntity):
             name="Backup Guardian",
             manufacturer="Leonardo",
             model="Backup Monitor",
-            sw_version=VERSION,
+            sw_version=self.coordinator.version,
         )
 
     @property
@@ -86,7 +131,7 @@ class BackupGuardianLastBackupSensor(CoordinatorEntity, SensorEntity):
         """Return the state of the sensor."""
         if self.coordinator.data and self.coordinator.data.get("last_backup"):
             last = self.coordinator.data["last_backup"]
-            return f"{last['date']} {last['time']}"
+            return f"{last.date} {last.time}"
         return "Nessun backup"
 
     @property
@@ -95,13 +140,13 @@ class BackupGuardianLastBackupSensor(CoordinatorEntity, SensorEntity):
         if self.coordinator.data and self.coordinator.data.get("last_backup"):
             last = self.coordinator.data["last_backup"]
             return {
-                ATTR_BACKUP_NAME: last["name"],
-                ATTR_BACKUP_DATE: last["date"],
-                ATTR_BACKUP_TIME: last["time"],
-                ATTR_BACKUP_SIZE: f"{last['size_mb']} MB",
-                ATTR_BACKUP_HASH: last["hash"],
-                ATTR_BACKUP_TYPE: last["type"],
-                ATTR_BACKUP_DESTINATION: last.get("destination_name", "Locale"),  # NEW
+                ATTR_BACKUP_NAME: last.name,
+                ATTR_BACKUP_DATE: last.date,
+                ATTR_BACKUP_TIME: last.time,
+                ATTR_BACKUP_SIZE: f"{last.size_mb} MB",
+                ATTR_BACKUP_HASH: last.hash,
+                ATTR_BACKUP_TYPE: last.type,
+                ATTR_BACKUP_DESTINATION: last.destination_name,
             }
         return {}
 
@@ -110,6 +155,8 @@ class BackupGuardianTotalBackupsSensor(CoordinatorEntity, SensorEntity):
     """Sensor for total number of backups."""
 
     _attr_has_entity_name = True
+    # La lista backup è pesante: non salvarla nel recorder
+    _unrecorded_attributes = frozenset({ATTR_BACKUP_LIST})
 
     def __init__(self, coordinator, entry):
         """Initialize the sensor."""
@@ -128,7 +175,7 @@ class BackupGuardianTotalBackupsSensor(CoordinatorEntity, SensorEntity):
             name="Backup Guardian",
             manufacturer="Leonardo",
             model="Backup Monitor",
-            sw_version=VERSION,
+            sw_version=self.coordinator.version,
         )
 
     @property
@@ -142,16 +189,19 @@ class BackupGuardianTotalBackupsSensor(CoordinatorEntity, SensorEntity):
     def extra_state_attributes(self):
         """Return the state attributes."""
         if self.coordinator.data and self.coordinator.data.get("backups"):
-            backups = self.coordinator.data["backups"]
+            # Solo i backup più recenti, il catalogo completo è disponibile
+            # tramite il servizio backup_guardian.list_backups
+            limit = self._entry.data.get(CONF_BACKUP_LIST_LIMIT, DEFAULT_BACKUP_LIST_LIMIT)
+            backups = self.coordinator.data["backups"][:limit]
             backup_list = []
             for backup in backups:
                 backup_list.append({
-                    "name": backup["name"],
-                    "date": backup["date"],
-                    "time": backup["time"],
-                    "size": f"{backup['size_mb']} MB",
-                    "hash": backup["hash"],
-                    "destination": backup.get("destination_name", "Locale"),  # NEW
+                    "name": backup.name,
+                    "date": backup.date,
+                    "time": backup.time,
+                    "size": f"{backup.size_mb} MB",
+                    "hash": backup.hash,
+                    "destination": backup.destination_name,
                 })
             return {ATTR_BACKUP_LIST: backup_list}
         return {}
@@ -180,7 +230,7 @@ class BackupGuardianTotalSizeSensor(CoordinatorEntity, SensorEntity):
             name="Backup Guardian",
             manufacturer="Leonardo",
             model="Backup Monitor",
-            sw_version=VERSION,
+            sw_version=self.coordinator.version,
         )
 
     @property
@@ -189,3 +239,520 @@ class BackupGuardianTotalSizeSensor(CoordinatorEntity, SensorEntity):
         if self.coordinator.data:
             return self.coordinator.data.get("total_size_mb", 0)
         return 0
+
+
+class BackupGuardianSensor(CoordinatorEntity, SensorEntity):
+    """Base class for Backup Guardian aggregate sensors."""
+
+    _attr_has_entity_name = True
+
+    def __init__(self, coordinator, entry):
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._entry = entry
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Return device info."""
+        return DeviceInfo(
+            identifiers={(DOMAIN, self._entry.entry_id)},
+            name="Backup Guardian",
+            manufacturer="Leonardo",
+            model="Backup Monitor",
+            sw_version=self.coordinator.version,
+        )
+
+    def _stats(self) -> dict | None:
+        """Return the catalog statistics of the last refresh."""
+        if self.coordinator.data:
+            return self.coordinator.data.get("stats")
+        return None
+
+
+class BackupGuardianDestinationSensor(BackupGuardianSensor):
+    """Base class for sensors of a single destination."""
+
+    def __init__(self, coordinator, entry, destination):
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry)
+        self._destination = destination
+        self._destination_name = DESTINATION_NAMES.get(destination, destination.title())
+
+    def _group(self) -> dict:
+        """Return the statistics of the destination, empty if it has no backups."""
+        stats = self._stats()
+        if stats:
+            return stats["by_destination"].get(self._destination, {})
+        return {}
+
+
+class BackupGuardianSourceCountSensor(BackupGuardianDestinationSensor):
+    """Sensor for the number of backups of a destination."""
+
+    def __init__(self, coordinator, entry, destination):
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry, destination)
+        self._attr_name = f"Backup {self._destination_name}"
+        self._attr_unique_id = f"{entry.entry_id}_{destination}_backup"
+        self._attr_icon = "mdi:counter"
+        self._attr_native_unit_of_measurement = "backup"
+        self._attr_state_class = SensorStateClass.MEASUREMENT
+
+    @property
+    def native_value(self):
+        """Return the state of the sensor."""
+        return self._group().get("count", 0)
+
+
+class BackupGuardianSourceSizeSensor(BackupGuardianDestinationSensor):
+    """Sensor for the total size of the backups of a destination."""
+
+    def __init__(self, coordinator, entry, destination):
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry, destination)
+        self._attr_name = f"Dimensione {self._destination_name}"
+        self._attr_unique_id = f"{entry.entry_id}_{destination}_dimensione"
+        self._attr_icon = "mdi:harddisk"
+        self._attr_native_unit_of_measurement = "MB"
+        self._attr_device_class = SensorDeviceClass.DATA_SIZE
+        self._attr_state_class = SensorStateClass.MEASUREMENT
+
+    @property
+    def native_value(self):
+        """Return the state of the sensor."""
+        return round(self._group().get("size", 0) / (1024 * 1024), 2)
+
+
+class BackupGuardianSourceLastBackupSensor(BackupGuardianDestinationSensor):
+    """Sensor for the newest backup of a destination."""
+
+    def __init__(self, coordinator, entry, destination):
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry, destination)
+        self._attr_name = f"Ultimo Backup {self._destination_name}"
+        self._attr_unique_id = f"{entry.entry_id}_{destination}_ultimo_backup"
+        self._attr_icon = "mdi:backup-restore"
+        self._attr_device_class = SensorDeviceClass.TIMESTAMP
+
+    @property
+    def native_value(self):
+        """Return the state of the sensor."""
+        newest = self._group().get("newest")
+        return newest.datetime if newest else None
+
+    @property
+    def extra_state_attributes(self):
+        """Return the state attributes."""
+        group = self._group()
+        if not group:
+            return {}
+        return {
+            ATTR_BACKUP_NAME: group["newest"].name,
+            "oldest_backup": group["oldest"].datetime.isoformat(),
+        }
+
+
+class BackupGuardianOldestBackupAgeSensor(BackupGuardianSensor):
+    """Sensor for the age of the oldest backup."""
+
+    def __init__(self, coordinator, entry):
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry)
+        self._attr_name = "Età Backup Più Vecchio"
+        self._attr_unique_id = f"{entry.entry_id}_eta_backup_piu_vecchio"
+        self._attr_icon = "mdi:clock-alert-outline"
+        self._attr_native_unit_of_measurement = "d"
+        self._attr_device_class = SensorDeviceClass.DURATION
+        self._attr_state_class = SensorStateClass.MEASUREMENT
+
+    @property
+    def native_value(self):
+        """Return the state of the sensor."""
+        stats = self._stats()
+        if stats and stats["oldest"]:
+            age = dt_util.now() - stats["oldest"].datetime
+            return round(age.total_seconds() / 86400, 1)
+        return None
+
+
+class BackupGuardianGrowthRateSensor(BackupGuardianSensor):
+    """Sensor for the average backup data added per day."""
+
+    def __init__(self, coordinator, entry):
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry)
+        self._attr_name = "Crescita Backup"
+        self._attr_unique_id = f"{entry.entry_id}_crescita_backup"
+        self._attr_icon = "mdi:chart-line"
+        self._attr_native_unit_of_measurement = "MB/d"
+        self._attr_state_class = SensorStateClass.MEASUREMENT
+
+    @property
+    def native_value(self):
+        """Return the state of the sensor."""
+        stats = self._stats()
+        if stats:
+            return round(stats["growth_per_day"] / (1024 * 1024), 2)
+        return 0
+
+
+class BackupGuardianNotOffsiteSensor(BackupGuardianSensor):
+    """Sensor for the local backups without a copy on another destination."""
+
+    _unrecorded_attributes = frozenset({ATTR_BACKUP_LIST})
+
+    def __init__(self, coordinator, entry):
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry)
+        self._attr_name = "Backup Non Offsite"
+        self._attr_unique_id = f"{entry.entry_id}_backup_non_offsite"
+        self._attr_icon = "mdi:cloud-off-outline"
+        self._attr_native_unit_of_measurement = "backup"
+        self._attr_state_class = SensorStateClass.MEASUREMENT
+
+    def _not_offsite(self) -> list:
+        """Return the local backups not yet copied offsite, newest first."""
+        if self.coordinator.data:
+            return self.coordinator.data["replicas"]["not_offsite"]
+        return []
+
+    @property
+    def native_value(self):
+        """Return the state of the sensor."""
+        return len(self._not_offsite())
+
+    @property
+    def extra_state_attributes(self):
+        """Return the state attributes."""
+        limit = self._entry.data.get(CONF_BACKUP_LIST_LIMIT, DEFAULT_BACKUP_LIST_LIMIT)
+        return {
+            ATTR_BACKUP_LIST: [
+                {"name": backup.name, "date": backup.date, "time": backup.time}
+                for backup in self._not_offsite()[:limit]
+            ]
+        }
+
+
+class BackupGuardianRetentionPruneSensor(BackupGuardianSensor):
+    """Sensor for the backups the retention policy would prune."""
+
+    _unrecorded_attributes = frozenset({ATTR_BACKUP_LIST})
+
+    def __init__(self, coordinator, entry):
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry)
+        self._attr_name = "Backup Da Eliminare"
+        self._attr_unique_id = f"{entry.entry_id}_backup_da_eliminare"
+        self._attr_icon = "mdi:delete-clock-outline"
+        self._attr_native_unit_of_measurement = "backup"
+        self._attr_state_class = SensorStateClass.MEASUREMENT
+
+    def _retention(self) -> dict | None:
+        """Return the retention evaluation of the last refresh."""
+        if self.coordinator.data:
+            return self.coordinator.data.get("retention")
+        return None
+
+    @property
+    def native_value(self):
+        """Return the state of the sensor."""
+        retention = self._retention()
+        return retention["prune_count"] if retention else 0
+
+    @property
+    def extra_state_attributes(self):
+        """Return the state attributes."""
+        retention = self._retention()
+        if not retention:
+            return {}
+        limit = self._entry.data.get(CONF_BACKUP_LIST_LIMIT, DEFAULT_BACKUP_LIST_LIMIT)
+        prune = sorted(
+            (
+                backup
+                for group in retention["by_destination"].values()
+                for backup in group["prune"]
+            ),
+            key=lambda backup: backup.datetime,
+        )
+        return {
+            "policy": retention["policy"].as_dict(),
+            "prune_size_mb": round(retention["prune_size"] / (1024 * 1024), 2),
+            ATTR_BACKUP_LIST: [
+                {"name": backup.name, "date": backup.date, "destination": backup.destination_name}
+                for backup in prune[:limit]
+            ],
+        }
+
+
+class BackupGuardianProjectedUsageSensor(BackupGuardianSensor):
+    """Sensor for the storage used in 90 days under the retention policy."""
+
+    def __init__(self, coordinator, entry):
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry)
+        self._attr_name = "Spazio Previsto"
+        self._attr_unique_id = f"{entry.entry_id}_spazio_previsto"
+        self._attr_icon = "mdi:chart-timeline-variant"
+        self._attr_native_unit_of_measurement = "MB"
+        self._attr_device_class = SensorDeviceClass.DATA_SIZE
+        self._attr_state_class = SensorStateClass.MEASUREMENT
+
+    def _projected(self) -> dict:
+        """Return days ahead -> projected bytes."""
+        if self.coordinator.data:
+            return self.coordinator.data["retention"]["projected"]
+        return {}
+
+    @property
+    def native_value(self):
+        """Return the state of the sensor."""
+        projected = self._projected()
+        if 90 not in projected:
+            return None
+        return round(projected[90] / (1024 * 1024), 2)
+
+    @property
+    def extra_state_attributes(self):
+        """Return the state attributes."""
+        return {
+            f"size_mb_{days}d": round(size / (1024 * 1024), 2)
+            for days, size in self._projected().items()
+        }
+
+
+class BackupGuardianBackupSizeTrendSensor(BackupGuardianSensor):
+    """Sensor for the change of the backup size per day."""
+
+    def __init__(self, coordinator, entry):
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry)
+        self._attr_name = "Trend Dimensione Backup"
+        self._attr_unique_id = f"{entry.entry_id}_trend_dimensione_backup"
+        self._attr_icon = "mdi:trending-up"
+        self._attr_native_unit_of_measurement = "MB/d"
+        self._attr_state_class = SensorStateClass.MEASUREMENT
+
+    def _forecast(self) -> dict | None:
+        """Return the storage forecast of the last refresh."""
+        if self.coordinator.data:
+            return self.coordinator.data.get("forecast")
+        return None
+
+    @property
+    def native_value(self):
+        """Return the state of the sensor."""
+        forecast = self._forecast()
+        if forecast:
+            return round(forecast["backup_size_trend"] / (1024 * 1024), 2)
+        return None
+
+    @property
+    def extra_state_attributes(self):
+        """Return the state attributes."""
+        forecast = self._forecast()
+        if not forecast:
+            return {}
+        return {
+            "expected_backup_size_mb": round(forecast["backup_size"] / (1024 * 1024), 2)
+        }
+
+
+class BackupGuardianSourceDaysUntilFullSensor(BackupGuardianDestinationSensor):
+    """Sensor for the days until the storage of a destination is full."""
+
+    def __init__(self, coordinator, entry, destination):
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry, destination)
+        self._attr_name = f"Giorni Al Riempimento {self._destination_name}"
+        self._attr_unique_id = f"{entry.entry_id}_{destination}_giorni_al_riempimento"
+        self._attr_icon = "mdi:harddisk-plus"
+        self._attr_native_unit_of_measurement = "d"
+        self._attr_device_class = SensorDeviceClass.DURATION
+        self._attr_state_class = SensorStateClass.MEASUREMENT
+
+    def _destination_forecast(self) -> dict:
+        """Return the forecast of the destination, empty if unknown."""
+        if self.coordinator.data and self.coordinator.data.get("forecast"):
+            return self.coordinator.data["forecast"]["by_destination"].get(
+                self._destination, {}
+            )
+        return {}
+
+    @property
+    def native_value(self):
+        """Return the state of the sensor."""
+        return self._destination_forecast().get("days_until_full")
+
+    @property
+    def extra_state_attributes(self):
+        """Return the state attributes."""
+        forecast = self._destination_forecast()
+        capacity = forecast.get("capacity")
+        if not capacity or "free" not in capacity:
+            return {}
+        return {
+            "free_mb": round(capacity["free"] / (1024 * 1024), 2),
+            "total_mb": round(capacity["total"] / (1024 * 1024), 2),
+            "growth_mb_per_day": round(forecast.get("growth_per_day", 0) / (1024 * 1024), 2),
+        }
+
+
+class BackupGuardianDriveQuotaSensor(BackupGuardianSensor):
+    """Sensor for the used share of the Google Drive storage quota."""
+
+    def __init__(self, coordinator, entry):
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry)
+        self._attr_name = "Quota Google Drive"
+        self._attr_unique_id = f"{entry.entry_id}_quota_google_drive"
+        self._attr_icon = "mdi:google-drive"
+        self._attr_native_unit_of_measurement = "%"
+        self._attr_state_class = SensorStateClass.MEASUREMENT
+
+    def _capacity(self) -> dict:
+        """Return the last reported Drive quota and folder usage."""
+        if self.coordinator.data:
+            return self.coordinator.data.get("capacities", {}).get(DESTINATION_GOOGLE_DRIVE, {})
+        return {}
+
+    @property
+    def native_value(self):
+        """Return the state of the sensor."""
+        capacity = self._capacity()
+        if not capacity.get("total"):
+            return None
+        return round(capacity["used"] / capacity["total"] * 100, 1)
+
+    @property
+    def extra_state_attributes(self):
+        """Return the state attributes."""
+        capacity = self._capacity()
+        if not capacity:
+            return {}
+        attributes = {
+            "used_mb": round(capacity["used"] / (1024 * 1024), 2),
+            "used_in_drive_mb": round(capacity["used_in_drive"] / (1024 * 1024), 2),
+            "used_in_trash_mb": round(capacity["used_in_trash"] / (1024 * 1024), 2),
+            "folder_name": capacity["folder_name"],
+            "folder_files": capacity["folder_files"],
+            "folder_size_mb": round(capacity["folder_size"] / (1024 * 1024), 2),
+        }
+        if "total" in capacity:
+            attributes["total_mb"] = round(capacity["total"] / (1024 * 1024), 2)
+            attributes["free_mb"] = round(capacity["free"] / (1024 * 1024), 2)
+        return attributes
+
+
+class BackupGuardianFreshnessDeadlineSensor(BackupGuardianSensor):
+    """Sensor for the moment a freshness target breaches its SLA."""
+
+    def __init__(self, coordinator, entry, target):
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry)
+        self._target = target
+        self._attr_name = f"Scadenza Freschezza {target_name(target)}"
+        self._attr_unique_id = f"{entry.entry_id}_scadenza_{target.replace(':', '_')}"
+        self._attr_icon = "mdi:timer-sand"
+        self._attr_device_class = SensorDeviceClass.TIMESTAMP
+
+    @property
+    def native_value(self):
+        """Return the state of the sensor."""
+        # Un timestamp evita aggiornamenti periodici del tempo rimanente
+        return self.coordinator.freshness.deadline(self._target)
+
+
+class BackupGuardianRefreshDurationSensor(BackupGuardianSensor):
+    """Diagnostic sensor for the duration of the last refresh."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _unrecorded_attributes = frozenset({"stages"})
+
+    def __init__(self, coordinator, entry):
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry)
+        self._attr_name = "Durata Aggiornamento"
+        self._attr_unique_id = f"{entry.entry_id}_durata_aggiornamento"
+        self._attr_icon = "mdi:timer-outline"
+        self._attr_native_unit_of_measurement = "ms"
+        self._attr_device_class = SensorDeviceClass.DURATION
+        self._attr_state_class = SensorStateClass.MEASUREMENT
+
+    @property
+    def native_value(self):
+        """Return the state of the sensor."""
+        return self.coordinator.metrics.stage_summary(STAGE_REFRESH)["last_ms"]
+
+    @property
+    def extra_state_attributes(self):
+        """Return the state attributes."""
+        report = self.coordinator.metrics_report()
+        refresh = report["coordinator"]["stages"].get(STAGE_REFRESH, {})
+        # Percentili di ogni fase, le fasi delle sorgenti con il loro prefisso
+        stages = {
+            stage: {"p50_ms": summary["p50_ms"], "p95_ms": summary["p95_ms"]}
+            for stage, summary in report["coordinator"]["stages"].items()
+        }
+        for destination, metrics in report["sources"].items():
+            for stage, summary in metrics["stages"].items():
+                stages[f"{destination}_{stage}"] = {
+                    "p50_ms": summary["p50_ms"],
+                    "p95_ms": summary["p95_ms"],
+                }
+        return {
+            "p50_ms": refresh.get("p50_ms"),
+            "p95_ms": refresh.get("p95_ms"),
+            "stages": stages,
+        }
+
+
+class BackupGuardianApiCallsSensor(BackupGuardianSensor):
+    """Diagnostic sensor for the API calls made to the backup sources."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+
+    def __init__(self, coordinator, entry):
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry)
+        self._attr_name = "Chiamate API"
+        self._attr_unique_id = f"{entry.entry_id}_chiamate_api"
+        self._attr_icon = "mdi:api"
+        self._attr_native_unit_of_measurement = "chiamate"
+        self._attr_state_class = SensorStateClass.TOTAL_INCREASING
+
+    def _counters(self) -> dict[str, dict[str, int]]:
+        """Return the counters of each source."""
+        return {
+            destination: metrics["counters"]
+            for destination, metrics in self.coordinator.metrics_report()["sources"].items()
+        }
+
+    @property
+    def native_value(self):
+        """Return the state of the sensor."""
+        return sum(
+            counters.get(COUNTER_API_CALLS, 0) for counters in self._counters().values()
+        )
+
+    @property
+    def extra_state_attributes(self):
+        """Return the state attributes."""
+        attributes = {}
+        for destination, counters in self._counters().items():
+            attributes[f"{destination}_calls"] = counters.get(COUNTER_API_CALLS, 0)
+            attributes[f"{destination}_errors"] = counters.get(COUNTER_API_ERRORS, 0)
+            attributes[f"{destination}_mb"] = round(
+                counters.get(COUNTER_BYTES, 0) / (1024 * 1024), 2
+            )
+        return attributes
+
+
+# Sensori creati per ogni destinazione
+DESTINATION_SENSORS = (
+    BackupGuardianSourceCountSensor,
+    BackupGuardianSourceSizeSensor,
+    BackupGuardianSourceLastBackupSensor,
+    BackupGuardianSourceDaysUntilFullSensor,
+)
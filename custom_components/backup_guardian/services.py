@@ -0,0 +1,219 @@
+"""Services for Backup Guardian."""
+import logging
+from datetime import datetime
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.helpers import config_validation as cv
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    CONF_RETENTION_DAILY,
+    CONF_RETENTION_MONTHLY,
+    CONF_RETENTION_WEEKLY,
+    DOMAIN,
+    SERVICE_EVALUATE_RETENTION,
+    SERVICE_LIST_BACKUPS,
+)
+from .record import BackupRecord
+from .retention import RetentionPolicy, evaluate_retention, project_usage
+
+_LOGGER = logging.getLogger(__name__)
+
+ATTR_SOURCE = "source"
+ATTR_TYPE = "type"
+ATTR_START = "start"
+ATTR_END = "end"
+ATTR_SORT_BY = "sort_by"
+ATTR_DESCENDING = "descending"
+ATTR_OFFSET = "offset"
+ATTR_LIMIT = "limit"
+
+SORT_KEYS = {
+    "datetime": lambda backup: backup.datetime,
+    "size": lambda backup: backup.size,
+    "name": lambda backup: backup.name.lower(),
+}
+
+MAX_PAGE_SIZE = 500
+
+LIST_BACKUPS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_SOURCE): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(ATTR_TYPE): cv.string,
+        vol.Optional(ATTR_START): cv.datetime,
+        vol.Optional(ATTR_END): cv.datetime,
+        vol.Optional(ATTR_SORT_BY, default="datetime"): vol.In(list(SORT_KEYS)),
+        vol.Optional(ATTR_DESCENDING, default=True): cv.boolean,
+        vol.Optional(ATTR_OFFSET, default=0): vol.All(vol.Coerce(int), vol.Range(min=0)),
+        vol.Optional(ATTR_LIMIT, default=50): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=MAX_PAGE_SIZE)
+        ),
+    }
+)
+
+_RETENTION_COUNT = vol.All(vol.Coerce(int), vol.Range(min=0, max=1000))
+
+EVALUATE_RETENTION_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_SOURCE): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(CONF_RETENTION_DAILY): _RETENTION_COUNT,
+        vol.Optional(CONF_RETENTION_WEEKLY): _RETENTION_COUNT,
+        vol.Optional(CONF_RETENTION_MONTHLY): _RETENTION_COUNT,
+    }
+)
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the Backup Guardian services."""
+    if hass.services.has_service(DOMAIN, SERVICE_LIST_BACKUPS):
+        return
+
+    async def async_list_backups(call: ServiceCall) -> ServiceResponse:
+        """Return a filtered, sorted page of the backup catalog."""
+        backups: list[BackupRecord] = []
+        replica_counts: dict[tuple[str, str], int] = {}
+        for coordinator in hass.data.get(DOMAIN, {}).values():
+            if coordinator.data:
+                backups.extend(coordinator.data.get("backups", []))
+                replica_counts.update(coordinator.data["replicas"]["counts"])
+
+        return query_backups(backups, call.data, replica_counts)
+
+    async def async_evaluate_retention(call: ServiceCall) -> ServiceResponse:
+        """Return what a retention policy would keep and prune."""
+        backups: list[BackupRecord] = []
+        config_data: dict[str, Any] = {}
+        for coordinator in hass.data.get(DOMAIN, {}).values():
+            if coordinator.data:
+                backups.extend(coordinator.data.get("backups", []))
+                config_data = {**coordinator.config_data, **config_data}
+
+        sources = set(call.data.get(ATTR_SOURCE) or [])
+        if sources:
+            backups = [backup for backup in backups if backup.destination in sources]
+
+        # Parametri non indicati: politica configurata
+        policy = RetentionPolicy.from_config({**config_data, **call.data})
+        return await hass.async_add_executor_job(
+            retention_report, backups, policy, dt_util.now()
+        )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_LIST_BACKUPS,
+        async_list_backups,
+        schema=LIST_BACKUPS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_EVALUATE_RETENTION,
+        async_evaluate_retention,
+        schema=EVALUATE_RETENTION_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+
+@callback
+def async_unload_services(hass: HomeAssistant) -> None:
+    """Remove the Backup Guardian services."""
+    hass.services.async_remove(DOMAIN, SERVICE_LIST_BACKUPS)
+    hass.services.async_remove(DOMAIN, SERVICE_EVALUATE_RETENTION)
+
+
+def query_backups(
+    backups: list[BackupRecord],
+    params: dict[str, Any],
+    replica_counts: dict[tuple[str, str], int] | None = None,
+) -> dict[str, Any]:
+    """Filter, sort and paginate backups.
+
+    Args:
+        backups: Backups to query
+        params: Validated parameters of the list_backups service
+        replica_counts: (destination, slug) -> copies on other destinations
+
+    Returns:
+        Dict with the total number of matches and the requested page
+    """
+    sources = set(params.get(ATTR_SOURCE) or [])
+    backup_type = params.get(ATTR_TYPE)
+    start = params.get(ATTR_START)
+    end = params.get(ATTR_END)
+    # Naive datetimes are in the Home Assistant timezone
+    if start is not None and start.tzinfo is None:
+        start = start.replace(tzinfo=dt_util.DEFAULT_TIME_ZONE)
+    if end is not None and end.tzinfo is None:
+        end = end.replace(tzinfo=dt_util.DEFAULT_TIME_ZONE)
+
+    matches = [
+        backup
+        for backup in backups
+        if (not sources or backup.destination in sources)
+        and (backup_type is None or backup.type == backup_type)
+        and (start is None or backup.datetime >= start)
+        and (end is None or backup.datetime <= end)
+    ]
+    matches.sort(
+        key=SORT_KEYS[params.get(ATTR_SORT_BY, "datetime")],
+        reverse=params.get(ATTR_DESCENDING, True),
+    )
+
+    offset = params.get(ATTR_OFFSET, 0)
+    limit = params.get(ATTR_LIMIT, 50)
+
+    return {
+        "total": len(matches),
+        "offset": offset,
+        "limit": limit,
+        "backups": [
+            {
+                **backup.as_dict(),
+                "datetime": backup.datetime.isoformat(),
+                "replicas": (replica_counts or {}).get((backup.destination, backup.slug), 0),
+            }
+            for backup in matches[offset : offset + limit]
+        ],
+    }
+
+
+def retention_report(
+    backups: list[BackupRecord], policy: RetentionPolicy, now: datetime
+) -> dict[str, Any]:
+    """Evaluate a retention policy for the evaluate_retention service (CPU bound, run in executor).
+
+    Args:
+        backups: Backups to evaluate
+        policy: Retention policy
+        now: Current local time
+
+    Returns:
+        Dict with the policy, keep/prune names per destination and the
+        projected usage in MB
+    """
+    return {
+        "policy": policy.as_dict(),
+        "destinations": {
+            destination: {
+                "keep": [backup.name for backup in group["keep"]],
+                "prune": [backup.name for backup in group["prune"]],
+                "keep_size_mb": round(group["keep_size"] / (1024 * 1024), 2),
+                "prune_size_mb": round(group["prune_size"] / (1024 * 1024), 2),
+            }
+            for destination, group in evaluate_retention(backups, policy).items()
+        },
+        "projected_size_mb": {
+            str(days): round(size / (1024 * 1024), 2)
+            for days, size in project_usage(backups, policy, now).items()
+        },
+    }
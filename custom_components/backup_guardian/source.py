@@ -0,0 +1,240 @@
+"""Backup source framework for Backup Guardian.
+
+Every backup destination is implemented as a BackupSource registered by
+destination code. Sources only fetch raw items and turn a single item into
+a BackupRecord; caching of processed backups is shared by all of them.
+"""
+import logging
+import os
+import re
+import time
+from datetime import datetime
+from typing import Any, AsyncIterator, Callable
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .metrics import STAGE_FETCH, STAGE_PROCESSING, RefreshMetrics
+from .record import BackupRecord
+from .sync import FINGERPRINT_FIELDS, IncrementalBackupSync
+
+_LOGGER = logging.getLogger(__name__)
+
+# Characters dropped from sizes reported as strings ("1.5 MB" -> "1.5")
+_SIZE_JUNK_RE = re.compile(r"[^\d.]")
+
+# Source capabilities
+CAPABILITY_DELTA_SYNC = "delta_sync"
+CAPABILITY_CHECKSUMS = "checksums"
+CAPABILITY_PAGINATION = "pagination"
+
+# destination code -> source class
+SOURCE_REGISTRY: dict[str, type["BackupSource"]] = {}
+
+
+def register_source(source_cls: type["BackupSource"]) -> type["BackupSource"]:
+    """Register a backup source class by its destination code."""
+    SOURCE_REGISTRY[source_cls.destination] = source_cls
+    return source_cls
+
+
+class BackupSource:
+    """Base class for a backup destination."""
+
+    # Destination code (local, google_drive, nas, ...)
+    destination: str = ""
+    # Capabilities supported by the source
+    capabilities: frozenset[str] = frozenset()
+    # Raw fields identifying an item and detecting its changes
+    key_field: str = "slug"
+    fingerprint_fields: tuple[str, ...] = FINGERPRINT_FIELDS
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the source.
+
+        Args:
+            hass: Home Assistant instance
+        """
+        self.hass = hass
+        self._sync = IncrementalBackupSync(
+            self.process,
+            key_field=self.key_field,
+            fingerprint_fields=self.fingerprint_fields,
+        )
+        self.delta: dict[str, list[str]] = {"added": [], "removed": [], "changed": []}
+        # Durations of the fetch stages, API calls and bytes received
+        self.metrics = RefreshMetrics()
+
+    @classmethod
+    def from_config(
+        cls, hass: HomeAssistant, entry: ConfigEntry
+    ) -> "BackupSource | None":
+        """Create the source from the config entry.
+
+        Args:
+            hass: Home Assistant instance
+            entry: Config entry
+
+        Returns:
+            Source instance, or None if the source is not enabled
+        """
+        return None
+
+    async def async_setup(self) -> bool:
+        """Prepare the source, return False if it cannot be used."""
+        return True
+
+    def async_subscribe_changes(
+        self, on_change: Callable[[], None]
+    ) -> Callable[[], None] | None:
+        """Call on_change when the source reports that its backups changed.
+
+        Args:
+            on_change: Callback run in the event loop
+
+        Returns:
+            Unsubscribe callback, or None if the source cannot push changes
+        """
+        return None
+
+    def async_shutdown(self) -> None:
+        """Stop the background work of the source, called on unload."""
+
+    async def async_fetch_raw(self) -> list[dict[str, Any]]:
+        """Fetch the raw item listing of the source."""
+        raise NotImplementedError
+
+    async def async_iter_raw(self) -> AsyncIterator[list[dict[str, Any]]]:
+        """Stream the raw item listing page by page.
+
+        Paginated sources override this so each page is processed while
+        the next one is fetched; by default the listing is a single page.
+        """
+        yield await self.async_fetch_raw()
+
+    async def async_get_capacity(self) -> dict[str, Any] | None:
+        """Return the 'free' and 'total' bytes of the storage, None if unknown.
+
+        Sources may add other usage figures to the dict.
+        """
+        return None
+
+    def process(self, raw: dict[str, Any]) -> BackupRecord | None:
+        """Turn a raw item into a backup record, None if it is not a backup."""
+        raise NotImplementedError
+
+    async def async_get_backups(self) -> list[BackupRecord]:
+        """Return the processed backups, reprocessing only changed items."""
+        started = time.perf_counter()
+        processing = 0.0
+        self._sync.begin()
+        async for raw_items in self.async_iter_raw():
+            page_started = time.perf_counter()
+            self._sync.feed(raw_items)
+            processing += time.perf_counter() - page_started
+        backups, self.delta = self._sync.commit()
+
+        # Le pagine sono elaborate durante il download: il fetch esclude l'elaborazione
+        self.metrics.record(STAGE_FETCH, time.perf_counter() - started - processing)
+        self.metrics.record(STAGE_PROCESSING, processing)
+        return backups
+
+
+def normalize_backup(
+    *,
+    name: str,
+    slug: str,
+    size_bytes: int,
+    date_obj: datetime,
+    backup_hash: str,
+    destination: str,
+    backup_type: str = "full",
+    protected: bool = False,
+    compressed: bool = True,
+) -> BackupRecord:
+    """Build a backup record in the schema shared by all sources.
+
+    Args:
+        name: Backup name
+        slug: Unique identifier of the backup within its source
+        size_bytes: Size in bytes
+        date_obj: Local datetime of the backup
+        backup_hash: Hash identifying the backup
+        destination: Destination code
+        backup_type: Backup type (full, partial)
+        protected: Whether the backup is password protected
+        compressed: Whether the archive is compressed
+
+    Returns:
+        Backup record
+    """
+    return BackupRecord(
+        name=name,
+        slug=slug,
+        size=size_bytes,
+        datetime=date_obj,
+        hash=backup_hash,
+        destination=destination,
+        type=backup_type,
+        protected=protected,
+        compressed=compressed,
+    )
+
+
+def disk_capacity(path: str) -> dict[str, int] | None:
+    """Return the free and total bytes of the filesystem holding a path.
+
+    Blocking call for executor.
+    """
+    try:
+        stat = os.statvfs(path)
+    except OSError:
+        return None
+    return {
+        "free": stat.f_bavail * stat.f_frsize,
+        "total": stat.f_blocks * stat.f_frsize,
+    }
+
+
+def parse_utc_timestamp(value: str) -> datetime | None:
+    """Parse an ISO timestamp and convert it to local time.
+
+    Handles "2026-01-31T10:30:00.123+00:00", "...Z", "2026-01-31 10:30:00"
+    and "2026-01-31" with a single fromisoformat call; naive values are
+    assumed to be UTC.
+
+    Args:
+        value: Timestamp string
+
+    Returns:
+        Local datetime, or None if the value can't be parsed
+    """
+    try:
+        date_obj = datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+    if date_obj.tzinfo is None:
+        date_obj = date_obj.replace(tzinfo=dt_util.UTC)
+    return dt_util.as_local(date_obj)
+
+
+def parse_backup_size(value: Any) -> float:
+    """Parse a size reported as number or string.
+
+    Args:
+        value: Raw size, e.g. 1234, "1234" or "1.5 MB"
+
+    Returns:
+        Size as float, 0 if it can't be parsed
+    """
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        pass
+    try:
+        return float(_SIZE_JUNK_RE.sub("", str(value)))
+    except ValueError:
+        return 0.0
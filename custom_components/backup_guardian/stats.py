@@ -0,0 +1,66 @@
+"""Backup catalog statistics for Backup Guardian."""
+from datetime import datetime, timedelta
+from typing import Any
+
+from .record import BackupRecord
+
+# Window used to compute the backup growth rate
+GROWTH_WINDOW = timedelta(days=7)
+
+
+def aggregate_backups(backups: list[BackupRecord], now: datetime) -> dict[str, Any]:
+    """Compute the catalog statistics in a single pass.
+
+    Args:
+        backups: Backups from all sources
+        now: Current time, used for the growth window
+
+    Returns:
+        Dict with the totals, the oldest backup, the growth rate in bytes
+        per day, per-destination count, size, newest and oldest backup and
+        the newest backup of each type
+    """
+    window_start = now - GROWTH_WINDOW
+    total_size = 0
+    window_size = 0
+    oldest: BackupRecord | None = None
+    newest: BackupRecord | None = None
+    by_destination: dict[str, dict[str, Any]] = {}
+    newest_by_type: dict[str, BackupRecord] = {}
+
+    for backup in backups:
+        total_size += backup.size
+        if backup.datetime >= window_start:
+            window_size += backup.size
+        if oldest is None or backup.datetime < oldest.datetime:
+            oldest = backup
+        if newest is None or backup.datetime > newest.datetime:
+            newest = backup
+        newest_of_type = newest_by_type.get(backup.type)
+        if newest_of_type is None or backup.datetime > newest_of_type.datetime:
+            newest_by_type[backup.type] = backup
+
+        group = by_destination.get(backup.destination)
+        if group is None:
+            by_destination[backup.destination] = {
+                "count": 1,
+                "size": backup.size,
+                "newest": backup,
+                "oldest": backup,
+            }
+            continue
+        group["count"] += 1
+        group["size"] += backup.size
+        if backup.datetime > group["newest"].datetime:
+            group["newest"] = backup
+        if backup.datetime < group["oldest"].datetime:
+            group["oldest"] = backup
+
+    return {
+        "total_size": total_size,
+        "oldest": oldest,
+        "newest": newest,
+        "growth_per_day": window_size / GROWTH_WINDOW.days,
+        "by_destination": by_destination,
+        "newest_by_type": newest_by_type,
+    }
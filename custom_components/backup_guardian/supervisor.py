@@ -0,0 +1,256 @@
+"""Home Assistant Supervisor backup source for Backup Guardian."""
+import hashlib
+import logging
+import os
+from typing import Any, Callable
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import hassio
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.util import dt as dt_util
+
+from .checksum import ArchiveChecksumCache, stat_key
+from .const import DESTINATION_LOCAL, SUPERVISOR_BACKUP_DIR
+from .metrics import COUNTER_API_CALLS, COUNTER_API_ERRORS
+from .record import BackupRecord
+from .source import (
+    BackupSource,
+    disk_capacity,
+    normalize_backup,
+    parse_backup_size,
+    parse_utc_timestamp,
+    register_source,
+)
+from .sync import FINGERPRINT_FIELDS
+
+_LOGGER = logging.getLogger(__name__)
+
+# Dispatcher signal of the hassio integration for Supervisor websocket events
+SUPERVISOR_EVENT_SIGNAL = "supervisor_event"
+
+
+@register_source
+class SupervisorBackupSource(BackupSource):
+    """Backups stored locally and managed by the Supervisor."""
+
+    destination = DESTINATION_LOCAL
+    fingerprint_fields = (*FINGERPRINT_FIELDS, "size_bytes", "checksum")
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry | None = None) -> None:
+        """Initialize the source.
+
+        Args:
+            hass: Home Assistant instance
+            entry: Config entry, owner of the background checksum task
+        """
+        super().__init__(hass)
+        self._checksums = ArchiveChecksumCache(hass, entry)
+        self._on_change: Callable[[], None] | None = None
+
+    @classmethod
+    def from_config(
+        cls, hass: HomeAssistant, entry: ConfigEntry
+    ) -> "SupervisorBackupSource":
+        """Create the source, local backups are always monitored."""
+        return cls(hass, entry)
+
+    def async_subscribe_changes(
+        self, on_change: Callable[[], None]
+    ) -> Callable[[], None] | None:
+        """Call on_change when a Supervisor backup job completes."""
+        if not hassio.is_hassio(self.hass):
+            return None
+        # Also used to publish checksums computed in background
+        self._on_change = on_change
+
+        @callback
+        def _async_supervisor_event(event: dict[str, Any]) -> None:
+            """Handle a Supervisor event."""
+            if not isinstance(event, dict) or event.get("event") != "job":
+                return
+            job = event.get("data") or {}
+            # Backup create/remove/restore jobs: backup_manager_full_backup, ...
+            if "backup" in str(job.get("name", "")) and job.get("done"):
+                _LOGGER.debug("Supervisor backup job %s completed", job.get("name"))
+                on_change()
+
+        return async_dispatcher_connect(
+            self.hass, SUPERVISOR_EVENT_SIGNAL, _async_supervisor_event
+        )
+
+    async def async_fetch_raw(self) -> list[dict[str, Any]]:
+        """Get backups using Supervisor via hassio component.
+
+        Raises:
+            HomeAssistantError: If the Supervisor is unavailable or does not
+                answer, so the coordinator keeps the last known backups
+        """
+        # Verifica che siamo su Hassio/Supervisor
+        if not hassio.is_hassio(self.hass):
+            raise HomeAssistantError("This integration requires Home Assistant OS or Supervised")
+        
+        # Accedi direttamente al componente hassio
+        if "hassio" not in self.hass.data:
+            raise HomeAssistantError("Hassio component not loaded")
+        
+        hassio_component = self.hass.data["hassio"]
+        
+        # Chiama il metodo send_command del componente hassio
+        _LOGGER.debug("Calling Supervisor via hassio component")
+        
+        self.metrics.increment(COUNTER_API_CALLS)
+        try:
+            result = await hassio_component.send_command(
+                "/backups",
+                method="get",
+                timeout=30
+            )
+        except Exception as api_err:
+            self.metrics.increment(COUNTER_API_ERRORS)
+            raise HomeAssistantError(f"Supervisor API call failed: {api_err}") from api_err
+        
+        # Una risposta vuota è un errore, non un elenco senza backup
+        if not result:
+            self.metrics.increment(COUNTER_API_ERRORS)
+            raise HomeAssistantError("No response from Supervisor")
+        
+        _LOGGER.debug(
+            "Supervisor raw response structure: %s, keys: %s",
+            type(result),
+            result.keys() if isinstance(result, dict) else "N/A",
+        )
+        
+        # Il formato della risposta del Supervisor varia
+        backups = None
+        
+        # Prova diversi formati di risposta
+        if isinstance(result, dict):
+            if isinstance(result.get("data"), dict) and "backups" in result["data"]:
+                backups = result["data"]["backups"]
+            elif "backups" in result:
+                backups = result["backups"]
+        
+        if not isinstance(backups, list):
+            raise HomeAssistantError(f"Unexpected Supervisor response: {result!r:.200}")
+        
+        _LOGGER.info("Retrieved %d backups from Supervisor", len(backups))
+        
+        # Log del primo backup per debug
+        if backups:
+            _LOGGER.debug("First backup sample: %s", backups[0])
+        
+        await self._async_attach_checksums(backups)
+        return backups
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Stop hashing archives in background."""
+        self._checksums.async_stop()
+
+    async def async_get_capacity(self) -> dict[str, int] | None:
+        """Return the free and total bytes of the backup disk."""
+        return await self.hass.async_add_executor_job(disk_capacity, SUPERVISOR_BACKUP_DIR)
+
+    async def _async_attach_checksums(self, backups: list[dict[str, Any]]) -> None:
+        """Add the cached archive checksum to each raw backup.
+
+        Archives without a valid cached checksum are hashed in background;
+        their backups get it on the refresh after hashing completes.
+        """
+        await self._checksums.async_load()
+        paths = {
+            backup.get("slug"): os.path.join(SUPERVISOR_BACKUP_DIR, f"{backup.get('slug')}.tar")
+            for backup in backups
+            if backup.get("slug")
+        }
+        keys = await self.hass.async_add_executor_job(
+            lambda: {path: stat_key(path) for path in paths.values()}
+        )
+
+        missing = {}
+        for backup in backups:
+            path = paths.get(backup.get("slug"))
+            key = keys.get(path)
+            if key is None:
+                continue
+            # Dimensione esatta dell'archivio se il Supervisor non la riporta
+            backup.setdefault("size_bytes", key[0])
+            checksum = self._checksums.get(path, key)
+            if checksum is not None:
+                backup["checksum"] = checksum
+            else:
+                missing[path] = key
+
+        self._checksums.async_prune({path for path, key in keys.items() if key})
+        if missing:
+            _LOGGER.debug("Hashing %d local backup archive(s) in background", len(missing))
+            self._checksums.async_schedule(missing, self._on_change)
+
+    def _calculate_hash_from_slug(self, slug: str) -> str:
+        """Calculate a hash from backup slug for identification."""
+        try:
+            return hashlib.sha256(slug.encode()).hexdigest()
+        except Exception:
+            return "N/A"
+
+    def process(self, backup_data: dict) -> BackupRecord | None:
+        """Process a single backup from API data.
+        
+        Args:
+            backup_data: Raw backup data from API
+        
+        Returns:
+            Backup record
+        """
+        try:
+            # Data dal Supervisor è in formato ISO UTC, convertita nel fuso locale
+            date_str = backup_data.get("date", "")
+            date_obj_local = parse_utc_timestamp(date_str)
+            if date_obj_local is None:
+                _LOGGER.debug("Could not parse date %s", date_str)
+                # Fallback: usa l'ora corrente locale
+                date_obj_local = dt_util.now()
+            
+            # Dimensione esatta in byte, necessaria per riconoscere le copie
+            size_bytes = backup_data.get("size_bytes")
+            if not isinstance(size_bytes, int) or isinstance(size_bytes, bool):
+                # Gestisci la dimensione - può essere in diversi formati
+                size_bytes = parse_backup_size(backup_data.get("size", 0))
+                
+                # Se la dimensione è troppo piccola, potrebbe essere già in MB
+                if size_bytes < 1024:
+                    size_bytes = int(size_bytes * 1024 * 1024)
+                else:
+                    size_bytes = int(size_bytes)
+            
+            # Nome del backup
+            slug = backup_data.get("slug", "")
+            name = backup_data.get("name", slug or "Unknown")
+            
+            result = normalize_backup(
+                name=name,
+                slug=slug,
+                size_bytes=size_bytes,
+                date_obj=date_obj_local,
+                # MD5 dell'archivio se già calcolato, altrimenti SHA-256 dello slug
+                backup_hash=backup_data.get("checksum") or self._calculate_hash_from_slug(slug),
+                destination=self.destination,
+                backup_type=backup_data.get("type", "full"),
+                protected=backup_data.get("protected", False),
+            )
+            
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Processed backup: %s, size: %s MB, time: %s, destination: %s",
+                    name,
+                    result.size_mb,
+                    result.time,
+                    result.destination_name,
+                )
+            return result
+            
+        except Exception as err:
+            _LOGGER.error("Error processing backup: %s, data: %s", err, backup_data, exc_info=True)
+            return None
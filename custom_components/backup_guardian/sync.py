@@ -0,0 +1,125 @@
+"""Incremental backup synchronization for Backup Guardian.
+
+This module keeps a slug-indexed store of processed backups so that each
+poll only reprocesses the backups that are new or have changed.
+"""
+import logging
+from typing import Any, Callable
+
+_LOGGER = logging.getLogger(__name__)
+
+# Raw fields that identify a change in a backup
+FINGERPRINT_FIELDS = ("date", "size", "protected")
+
+
+class IncrementalBackupSync:
+    """Slug-indexed store of processed backups."""
+
+    def __init__(
+        self,
+        process: Callable[[dict], Any],
+        key_field: str = "slug",
+        fingerprint_fields: tuple[str, ...] = FINGERPRINT_FIELDS,
+    ) -> None:
+        """Initialize the incremental sync.
+
+        Args:
+            process: Function turning a raw backup into a processed backup
+            key_field: Raw field used as unique key for a backup
+            fingerprint_fields: Raw fields compared to detect a changed backup
+        """
+        self._process = process
+        self._key_field = key_field
+        self._fingerprint_fields = fingerprint_fields
+        # key -> (fingerprint, processed backup)
+        self._entries: dict[str, tuple[tuple, Any]] = {}
+        # Listing being applied, page by page
+        self._pending: dict[str, tuple[tuple, Any]] = {}
+        self._delta: dict[str, list[str]] = {"added": [], "removed": [], "changed": []}
+
+    @property
+    def backups(self) -> list[Any]:
+        """Return the current snapshot of processed backups."""
+        return [backup for _, backup in self._entries.values()]
+
+    def _fingerprint(self, raw: dict) -> tuple:
+        """Build the change fingerprint of a raw backup."""
+        return tuple(raw.get(field) for field in self._fingerprint_fields)
+
+    def begin(self) -> None:
+        """Start applying a new raw listing, fed page by page with feed()."""
+        self._pending: dict[str, tuple[tuple, Any]] = {}
+        self._delta: dict[str, list[str]] = {"added": [], "removed": [], "changed": []}
+
+    def feed(self, raw_backups: list[dict]) -> None:
+        """Process a page of the raw listing started with begin().
+
+        Only backups with a new key or a different fingerprint are passed
+        to the process function.
+
+        Args:
+            raw_backups: Page of the raw backup listing
+        """
+        entries = self._pending
+        delta = self._delta
+
+        for raw in raw_backups:
+            key = raw.get(self._key_field)
+            if not key or key in entries:
+                continue
+
+            fingerprint = self._fingerprint(raw)
+            cached = self._entries.get(key)
+            if cached is not None and cached[0] == fingerprint:
+                entries[key] = cached
+                continue
+
+            processed = self._process(raw)
+            if processed is None:
+                continue
+
+            entries[key] = (fingerprint, processed)
+            delta["changed" if cached is not None else "added"].append(key)
+
+    def commit(self) -> tuple[list[Any], dict[str, list[str]]]:
+        """Replace the store with the listing fed since begin().
+
+        Keys missing from the listing are dropped.
+
+        Returns:
+            Tuple of (full snapshot, delta) where delta has the keys
+            'added', 'removed' and 'changed' listing the affected keys
+        """
+        entries, delta = self._pending, self._delta
+        delta["removed"] = [key for key in self._entries if key not in entries]
+        self._entries = entries
+        self._pending = {}
+
+        if any(delta.values()):
+            _LOGGER.debug(
+                "Incremental sync: %d added, %d changed, %d removed",
+                len(delta["added"]),
+                len(delta["changed"]),
+                len(delta["removed"]),
+            )
+
+        return self.backups, delta
+
+    def sync(
+        self, raw_backups: list[dict]
+    ) -> tuple[list[Any], dict[str, list[str]]]:
+        """Apply a new raw listing to the store in one step.
+
+        Args:
+            raw_backups: Full raw backup listing from the source
+
+        Returns:
+            Tuple of (full snapshot, delta), see commit()
+        """
+        self.begin()
+        self.feed(raw_backups)
+        return self.commit()
+
+    def clear(self) -> None:
+        """Drop all cached entries, forcing a full reprocess on next sync."""
+        self._entries = {}
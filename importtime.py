@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Misura del tempo di caricamento di Backup Guardian
+Importa l'integrazione a freddo con python -X importtime e riassume il costo
+dei moduli dell'integrazione e delle dipendenze Google
+
+Uso:
+    python importtime.py                  # Report a schermo
+    python importtime.py --json out.json  # Salva anche i risultati in JSON
+"""
+
+import json
+import subprocess
+import sys
+
+INTEGRATION = "custom_components.backup_guardian"
+# Moduli caricati da Home Assistant al setup dell'integrazione
+ENTRY_MODULES = [
+    f"{INTEGRATION}",
+    f"{INTEGRATION}.coordinator",
+    f"{INTEGRATION}.sensor",
+    f"{INTEGRATION}.config_flow",
+]
+# Dipendenze pesanti che non devono essere importate al caricamento
+HEAVY_PREFIXES = ("googleapiclient", "google.oauth2", "google.auth", "httplib2")
+
+
+def measure():
+    """Importa l'integrazione in un nuovo interprete e legge -X importtime."""
+    code = "; ".join(f"import {module}" for module in ENTRY_MODULES)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        errors = [line for line in result.stderr.splitlines() if not line.startswith("import time:")]
+        raise RuntimeError("\n".join(errors[-5:]))
+
+    modules = {}
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        modules[name.strip()] = (int(self_us), int(cumulative_us))
+    return modules
+
+
+def main():
+    """Esegue la misura e stampa il report."""
+    print("⏱️  Tempo di import di Backup Guardian\n")
+
+    try:
+        modules = measure()
+    except RuntimeError as e:
+        print(f"❌ Import fallito (Home Assistant è installato?):\n{e}")
+        return 1
+
+    integration = {
+        name: times for name, times in modules.items() if name.startswith(INTEGRATION)
+    }
+    heavy = sorted(
+        name for name in modules if name.startswith(HEAVY_PREFIXES)
+    )
+    integration_self = sum(self_us for self_us, _ in integration.values())
+
+    print("📦 Moduli dell'integrazione (cumulativo, include le dipendenze):")
+    for name, (_, cumulative_us) in sorted(
+        integration.items(), key=lambda item: item[1][1], reverse=True
+    ):
+        print(f"   {cumulative_us / 1000:8.1f} ms  {name}")
+
+    print(f"\n🧮 Tempo proprio dei moduli dell'integrazione: {integration_self / 1000:.1f} ms")
+
+    if heavy:
+        print(f"\n❌ Librerie Google importate al caricamento ({len(heavy)} moduli):")
+        for name in heavy[:10]:
+            print(f"   {name}")
+    else:
+        print("\n✅ Nessuna libreria Google importata al caricamento")
+
+    if "--json" in sys.argv:
+        path = sys.argv[sys.argv.index("--json") + 1]
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "integration_self_us": integration_self,
+                    "modules": {name: cumulative for name, (_, cumulative) in integration.items()},
+                    "heavy_modules": heavy,
+                },
+                f,
+                indent=2,
+            )
+        print(f"\n💾 Risultati salvati in {path}")
+
+    return 1 if heavy else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())